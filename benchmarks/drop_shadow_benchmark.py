@@ -0,0 +1,80 @@
+import sys
+import time
+from PyQt6.QtWidgets import QApplication, QWidget
+from PyQt6.QtCore import Qt, QSize, QPoint
+from PyQt6.QtGui import QImage, QRegion
+from pyqttooltip.drop_shadow import DropShadow
+from pyqttooltip.constants import DROP_SHADOW_SIZE
+
+
+LAYOUTS = 500
+
+
+class Tooltip(QWidget):
+
+    def getDropShadowStrength(self) -> float:
+        return 2.0
+
+
+class LegacyDropShadow(QWidget):
+
+    # Previous implementation that stacks one stylesheet widget per layer
+    def __init__(self, tooltip: Tooltip):
+        super().__init__(tooltip)
+        self.tooltip = tooltip
+        self.layers = []
+        for i in range(DROP_SHADOW_SIZE):
+            layer = QWidget(self)
+            self.apply_layer_stylesheet(layer, i)
+            self.layers.append(layer)
+
+    def update(self):
+        for i, layer in enumerate(self.layers):
+            self.apply_layer_stylesheet(layer, i)
+
+    def resize(self, size: QSize):
+        super().resize(size)
+        for i, layer in enumerate(self.layers):
+            layer.resize(size.width() - i * 2, size.height() - i * 2)
+            layer.move(i, i)
+
+    def apply_layer_stylesheet(self, layer: QWidget, index: int):
+        layer.setStyleSheet(
+            'background: rgba(0, 0, 0, {}); border-radius: 8px;'
+            .format((index + 1) * 0.001 * self.tooltip.getDropShadowStrength())
+        )
+
+
+def benchmark(drop_shadow_class) -> tuple[int, float, float]:
+    tooltip = Tooltip()
+    drop_shadow = drop_shadow_class(tooltip)
+    image = QImage(300, 100, QImage.Format.Format_ARGB32_Premultiplied)
+
+    # Layout only (resize and update as done by the tooltip on every layout pass)
+    start = time.perf_counter()
+    for i in range(LAYOUTS):
+        drop_shadow.resize(QSize(200 + i % 50, 60))
+        drop_shadow.update()
+    layout_time = (time.perf_counter() - start) * 1000 / LAYOUTS
+
+    # Layout and paint
+    start = time.perf_counter()
+    for i in range(LAYOUTS):
+        drop_shadow.resize(QSize(200 + i % 50, 60))
+        drop_shadow.update()
+        image.fill(Qt.GlobalColor.transparent)
+        drop_shadow.render(image, QPoint(), QRegion(), QWidget.RenderFlag.DrawChildren)
+    paint_time = (time.perf_counter() - start) * 1000 / LAYOUTS
+
+    widget_count = 1 + len(drop_shadow.findChildren(QWidget))
+    return widget_count, layout_time, paint_time
+
+
+# Run benchmark (use QT_QPA_PLATFORM=offscreen to run without a display)
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+
+    print('{:<18} {:>8} {:>12} {:>20}'.format('implementation', 'widgets', 'layout (ms)', 'layout + paint (ms)'))
+    for name, drop_shadow_class in [('stacked widgets', LegacyDropShadow), ('single paint', DropShadow)]:
+        widget_count, layout_time, paint_time = benchmark(drop_shadow_class)
+        print('{:<18} {:>8} {:>12.4f} {:>20.4f}'.format(name, widget_count, layout_time, paint_time))
@@ -0,0 +1,56 @@
+import sys
+import time
+from PyQt6.QtWidgets import QApplication, QMainWindow, QPushButton
+from PyQt6.QtCore import qInstallMessageHandler
+from PyQt6.QtTest import QTest
+from pyqttooltip import Tooltip, TooltipFadeMode
+from pyqttooltip.utils import Utils
+
+
+FADES = 20
+FADE_DURATION = 250
+
+
+def benchmark(app: QApplication, fade_mode: TooltipFadeMode) -> tuple[float, float]:
+    window = QMainWindow()
+    button = QPushButton('Button', window)
+    tooltip = Tooltip(button, 'This is a tooltip with some text')
+    tooltip.setFadeMode(fade_mode)
+    tooltip.setFadeInDuration(FADE_DURATION)
+    tooltip.setFadeOutDuration(FADE_DURATION)
+    window.show()
+    app.processEvents()
+
+    # CPU time of fading in and out (animation frames, repaints, and compositing of the backing store)
+    start = time.process_time()
+    for i in range(FADES):
+        tooltip.show()
+        QTest.qWait(FADE_DURATION + 50)
+        tooltip.hide()
+        QTest.qWait(FADE_DURATION + 50)
+    fade_time = (time.process_time() - start) * 1000 / (FADES * 2)
+    frame_time = fade_time / (FADE_DURATION / Utils.get_frame_interval())
+
+    tooltip.deleteLater()
+    window.deleteLater()
+    app.processEvents()
+    return fade_time, frame_time
+
+
+# Run benchmark (use QT_QPA_PLATFORM=offscreen to run without a display)
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+
+    # The offscreen platform warns on every window opacity change
+    qInstallMessageHandler(lambda *args: None)
+
+    print('{:<10} {:>16} {:>16}'.format('fade mode', 'fade (ms CPU)', 'frame (ms CPU)'))
+    for fade_mode in [TooltipFadeMode.EFFECT, TooltipFadeMode.WINDOW, TooltipFadeMode.SNAPSHOT]:
+        # Platforms without window opacity (e.g. offscreen) don't fade the window at all
+        if fade_mode == TooltipFadeMode.WINDOW and not Utils.is_window_opacity_supported():
+            print('{:<10} {:>33}'.format(
+                fade_mode.name, 'not measurable on {}'.format(QApplication.platformName())
+            ))
+            continue
+        fade_time, frame_time = benchmark(app, fade_mode)
+        print('{:<10} {:>16.4f} {:>16.4f}'.format(fade_mode.name, fade_time, frame_time))
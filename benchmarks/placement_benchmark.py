@@ -0,0 +1,79 @@
+import random
+import sys
+import time
+from pyqttooltip import TooltipPlacement
+from pyqttooltip import placement_core
+from pyqttooltip.placement_core import PlacementCore, Rect
+
+
+TOOLTIPS = 10000
+OFFSETS = {
+    TooltipPlacement.LEFT:   (0, 0),
+    TooltipPlacement.RIGHT:  (0, 0),
+    TooltipPlacement.TOP:    (0, 0),
+    TooltipPlacement.BOTTOM: (0, 0)
+}
+BOUNDS = Rect(0, 0, 1920, 1080)
+SCREENS = [Rect(0, 0, 1920, 1080), Rect(1920, 0, 1920, 1080)]
+
+
+def create_items() -> list[tuple[tuple[int, int, int, int], tuple[int, int]]]:
+    random.seed(0)
+    return [
+        (
+            (random.randint(0, 1800), random.randint(0, 1040), random.randint(20, 120), random.randint(20, 40)),
+            (random.randint(50, 300), random.randint(25, 80))
+        )
+        for _ in range(TOOLTIPS)
+    ]
+
+
+def benchmark_core(items) -> float:
+    start = time.perf_counter()
+    PlacementCore.get_placements(items, BOUNDS, SCREENS, 5, OFFSETS)
+    return (time.perf_counter() - start) * 1000
+
+
+def benchmark_bulk(items, vectorized: bool) -> float:
+    anchors = [anchor for anchor, size in items]
+    sizes = [size for anchor, size in items]
+    numpy = placement_core.numpy
+    if not vectorized:
+        placement_core.numpy = None
+
+    start = time.perf_counter()
+    PlacementCore.get_optimal_placements(anchors, sizes, 5, OFFSETS, BOUNDS, SCREENS)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    placement_core.numpy = numpy
+    return elapsed
+
+
+def benchmark_widgets(items) -> float:
+    from PyQt6.QtWidgets import QApplication, QWidget
+    from PyQt6.QtCore import QPoint, QSize
+    from pyqttooltip.placement_utils import PlacementUtils
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    window = QWidget()
+    window.setGeometry(0, 0, 1920, 1080)
+    widget = QWidget(window)
+    offsets = {placement: QPoint(*offset) for placement, offset in OFFSETS.items()}
+
+    start = time.perf_counter()
+    for (x, y, width, height), size in items:
+        widget.setGeometry(x, y, width, height)
+        PlacementUtils.get_optimal_placement(widget, QSize(*size), 5, offsets)
+    return (time.perf_counter() - start) * 1000
+
+
+# Run benchmark (use QT_QPA_PLATFORM=offscreen to run without a display)
+if __name__ == '__main__':
+    items = create_items()
+
+    print('{:<22} {:>10} {:>12}'.format('implementation', 'tooltips', 'total (ms)'))
+    print('{:<22} {:>10} {:>12.1f}'.format('core batch (no Qt)', TOOLTIPS, benchmark_core(items)))
+    print('{:<22} {:>10} {:>12.1f}'.format('bulk (pure Python)', TOOLTIPS, benchmark_bulk(items, False)))
+    if placement_core.numpy is not None:
+        print('{:<22} {:>10} {:>12.1f}'.format('bulk (NumPy)', TOOLTIPS, benchmark_bulk(items, True)))
+    print('{:<22} {:>10} {:>12.1f}'.format('widgets + adapter', TOOLTIPS, benchmark_widgets(items)))
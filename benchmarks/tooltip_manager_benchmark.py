@@ -0,0 +1,48 @@
+import sys
+import time
+import tracemalloc
+from PyQt6.QtWidgets import QApplication, QWidget, QPushButton
+from PyQt6.QtCore import QObject
+from pyqttooltip import Tooltip, TooltipManager
+
+
+def create_tooltips(buttons: list[QPushButton]) -> list[Tooltip]:
+    return [Tooltip(button, 'Tooltip {}'.format(i)) for i, button in enumerate(buttons)]
+
+
+def create_specs(buttons: list[QPushButton]) -> TooltipManager:
+    manager = TooltipManager()
+    for i, button in enumerate(buttons):
+        manager.addTooltip(button, 'Tooltip {}'.format(i))
+    return manager
+
+
+# Run benchmark (use QT_QPA_PLATFORM=offscreen to run without a display)
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+
+    print('{:>8} {:>10} {:>12} {:>12} {:>12}'.format('widgets', 'mode', 'time (ms)', 'qobjects', 'python (KB)'))
+    for count in [500, 1000, 5000]:
+        for mode, create in [('tooltips', create_tooltips), ('manager', create_specs)]:
+            window = QWidget()
+            buttons = [QPushButton(window) for _ in range(count)]
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            result = create(buttons)
+            elapsed = (time.perf_counter() - start) * 1000
+            memory = tracemalloc.get_traced_memory()[0] // 1024
+            tracemalloc.stop()
+
+            # Tooltips are top-level windows, pooled tooltips are created on the first hover
+            if mode == 'tooltips':
+                qobjects = sum(len(tooltip.findChildren(QObject)) + 1 for tooltip in result)
+            else:
+                qobjects = sum(len(tooltip.findChildren(QObject)) + 1 for tooltip in result.getPool())
+            print('{:>8} {:>10} {:>12.1f} {:>12} {:>12}'.format(count, mode, elapsed, qobjects, memory))
+
+            if mode == 'tooltips':
+                for tooltip in result:
+                    tooltip.deleteLater()
+            window.deleteLater()
+            app.processEvents()
@@ -0,0 +1,55 @@
+import sys
+from PyQt6.QtWidgets import QApplication, QLabel
+from PyQt6.QtGui import QFont
+from pyqttooltip.text_metrics import TextMetrics
+
+
+LOREM_IPSUM = (
+    'Lorem ipsum dolor sit amet, consetetur sadipscing elitr, sed diam nonumy eirmod '
+    'tempor invidunt ut labore et dolore magna aliquyam erat, sed diam voluptua. '
+)
+MAXIMUM_WIDTH = 400
+
+
+class ProbeCounter:
+
+    def __init__(self, label: QLabel):
+        self.label = label
+        self.probes = 0
+
+    def __call__(self, width: int) -> int:
+        self.probes += 1
+        return self.label.heightForWidth(width)
+
+
+def get_minimal_wrap_width_linear(height_for_width, width: int) -> int:
+    # Previous implementation that shrinks the width one pixel at a time
+    height = height_for_width(width)
+    new_text_height = height_for_width(width - 1)
+    new_text_width = width
+    while new_text_height == height:
+        new_text_width -= 1
+        new_text_height = height_for_width(new_text_width)
+    return new_text_width + 1
+
+
+# Run benchmark (use QT_QPA_PLATFORM=offscreen to run without a display)
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    label = QLabel()
+    label.setFont(QFont('Arial', 9, QFont.Weight.Bold))
+    label.setWordWrap(True)
+
+    print('{:>10} {:>14} {:>14} {:>8}'.format('characters', 'linear probes', 'binary probes', 'width'))
+    for length in [100, 250, 500, 1000, 2500, 5000]:
+        label.setText((LOREM_IPSUM * (length // len(LOREM_IPSUM) + 1))[:length])
+
+        linear_counter = ProbeCounter(label)
+        linear_width = get_minimal_wrap_width_linear(linear_counter, MAXIMUM_WIDTH)
+        binary_counter = ProbeCounter(label)
+        binary_width = TextMetrics.get_minimal_wrap_width(binary_counter, MAXIMUM_WIDTH)
+
+        assert linear_width == binary_width
+        print('{:>10} {:>14} {:>14} {:>8}'.format(
+            length, linear_counter.probes, binary_counter.probes, binary_width
+        ))
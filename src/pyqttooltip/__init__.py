@@ -1 +1,3 @@
-from .tooltip import Tooltip, TooltipPlacement
+from .tooltip import Tooltip, TooltipPlacement, TooltipRenderer, TooltipFadeMode
+from .tooltip_style import TooltipStyle
+from .tooltip_manager import TooltipManager, TooltipSpec
@@ -0,0 +1,144 @@
+import time
+from typing import Callable
+from qtpy.QtCore import QTimer, QEasingCurve
+from .utils import Utils
+
+
+class Fade:
+
+    __slots__ = ('start_time', 'duration', 'start_value', 'end_value', 'easing_curve', 'apply', 'finished')
+
+    def __init__(self, duration: int, start_value: float, end_value: float,
+                 easing_curve: QEasingCurve.Type, apply: Callable[[float], None],
+                 finished: Callable[[], None]):
+        """Create a new Fade instance that animates an opacity
+
+        :param duration: duration in milliseconds
+        :param start_value: opacity at the start of the fade
+        :param end_value: opacity at the end of the fade
+        :param easing_curve: easing curve of the fade
+        :param apply: callback that applies the current opacity
+        :param finished: callback that is called once the fade finished
+        """
+
+        self.start_time = time.monotonic()
+        self.duration = duration
+        self.start_value = start_value
+        self.end_value = end_value
+        self.easing_curve = QEasingCurve(easing_curve)
+        self.apply = apply
+        self.finished = finished
+
+    def get_progress(self, now: float) -> float:
+        """Get the progress of the fade at a point in time
+
+        :param now: point in time (from time.monotonic())
+        :return: progress between 0 and 1
+        """
+
+        if self.duration <= 0:
+            return 1.0
+        return min(1.0, (now - self.start_time) * 1000 / self.duration)
+
+    def get_value(self, now: float) -> float:
+        """Get the opacity at a point in time
+
+        :param now: point in time (from time.monotonic())
+        :return: opacity
+        """
+
+        progress = self.easing_curve.valueForProgress(self.get_progress(now))
+        return self.start_value + (self.end_value - self.start_value) * progress
+
+
+class AnimationClock:
+
+    # Running fades by key
+    __fades = {}
+    __timer = None
+
+    @staticmethod
+    def start(key: object, fade: Fade):
+        """Start a fade. A fade that is already running with the same key is replaced.
+        Fades without a duration are finished immediately.
+
+        :param key: key of the fade
+        :param fade: fade to start
+        """
+
+        AnimationClock.__fades.pop(key, None)
+
+        if fade.duration <= 0:
+            fade.apply(fade.end_value)
+            fade.finished()
+            return
+
+        fade.apply(fade.start_value)
+        AnimationClock.__fades[key] = fade
+
+        if Utils.is_deleted(AnimationClock.__timer):
+            AnimationClock.__timer = QTimer()
+            AnimationClock.__timer.timeout.connect(AnimationClock.__tick)
+
+        if not AnimationClock.__timer.isActive():
+            AnimationClock.__timer.start(Utils.get_frame_interval())
+
+    @staticmethod
+    def stop(key: object):
+        """Stop a fade without finishing it
+
+        :param key: key of the fade
+        """
+
+        AnimationClock.__fades.pop(key, None)
+
+    @staticmethod
+    def get_value(key: object) -> float | None:
+        """Get the current opacity of a fade
+
+        :param key: key of the fade
+        :return: opacity (None if the fade is not running)
+        """
+
+        fade = AnimationClock.__fades.get(key)
+        if fade is None:
+            return None
+        return fade.get_value(time.monotonic())
+
+    @staticmethod
+    def is_running(key: object) -> bool:
+        """Get whether a fade is running
+
+        :param key: key of the fade
+        :return: whether the fade is running
+        """
+
+        return key in AnimationClock.__fades
+
+    @staticmethod
+    def get_running_count() -> int:
+        """Get the number of running fades
+
+        :return: number of running fades
+        """
+
+        return len(AnimationClock.__fades)
+
+    @staticmethod
+    def __tick():
+        """Advance all the running fades to the current time"""
+
+        now = time.monotonic()
+
+        for key, fade in list(AnimationClock.__fades.items()):
+            # Fades can be stopped or replaced by the callbacks of other fades
+            if AnimationClock.__fades.get(key) is not fade:
+                continue
+
+            fade.apply(fade.get_value(now))
+            if fade.get_progress(now) >= 1.0:
+                del AnimationClock.__fades[key]
+                fade.finished()
+
+        if not AnimationClock.__fades:
+            AnimationClock.__timer.stop()
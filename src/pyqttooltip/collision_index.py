@@ -0,0 +1,120 @@
+from .placement_core import Rect
+from .constants import *
+
+
+class CollisionIndex:
+
+    # Rects of the visible tooltips by key and a grid that maps cells to the keys covering them
+    __rects = {}
+    __cells = {}
+
+    @staticmethod
+    def insert(key: object, rect: Rect):
+        """Insert the rect of a visible tooltip. A rect that
+        is already inserted with the same key is replaced.
+
+        :param key: key of the tooltip
+        :param rect: global rect of the tooltip
+        """
+
+        CollisionIndex.remove(key)
+        CollisionIndex.__rects[key] = rect
+
+        for cell in CollisionIndex.__get_cells(rect):
+            CollisionIndex.__cells.setdefault(cell, set()).add(key)
+
+    @staticmethod
+    def remove(key: object):
+        """Remove the rect of a tooltip
+
+        :param key: key of the tooltip
+        """
+
+        rect = CollisionIndex.__rects.pop(key, None)
+        if rect is None:
+            return
+
+        for cell in CollisionIndex.__get_cells(rect):
+            keys = CollisionIndex.__cells[cell]
+            keys.discard(key)
+            if not keys:
+                del CollisionIndex.__cells[cell]
+
+    @staticmethod
+    def get_rect(key: object) -> Rect | None:
+        """Get the inserted rect of a tooltip
+
+        :param key: key of the tooltip
+        :return: rect (None if not inserted)
+        """
+
+        return CollisionIndex.__rects.get(key)
+
+    @staticmethod
+    def query(rect: Rect, exclude: object = None) -> list[object]:
+        """Get the keys of the tooltips that intersect a rect. Only
+        the grid cells covered by the rect are searched.
+
+        :param rect: rect that should be checked
+        :param exclude: key of a tooltip that is ignored
+        :return: keys of the intersecting tooltips
+        """
+
+        keys = set()
+        for cell in CollisionIndex.__get_cells(rect):
+            keys.update(CollisionIndex.__cells.get(cell, ()))
+        keys.discard(exclude)
+
+        return [key for key in keys if CollisionIndex.__rects[key].get_intersection_area(rect) > 0]
+
+    @staticmethod
+    def get_overlap(rect: Rect, exclude: object = None) -> int:
+        """Get the total area of the tooltips that a rect overlaps
+
+        :param rect: rect that should be checked
+        :param exclude: key of a tooltip that is ignored
+        :return: overlapping area
+        """
+
+        return sum(
+            CollisionIndex.__rects[key].get_intersection_area(rect)
+            for key in CollisionIndex.query(rect, exclude)
+        )
+
+    @staticmethod
+    def get_count() -> int:
+        """Get the number of inserted rects
+
+        :return: number of rects
+        """
+
+        return len(CollisionIndex.__rects)
+
+    @staticmethod
+    def clear():
+        """Remove all the rects"""
+
+        CollisionIndex.__rects.clear()
+        CollisionIndex.__cells.clear()
+
+    @staticmethod
+    def __get_cells(rect: Rect) -> list[tuple[int, int]]:
+        """Get the grid cells covered by a rect
+
+        :param rect: rect
+        :return: cells
+        """
+
+        if rect.width <= 0 or rect.height <= 0:
+            return []
+
+        first_column = rect.x // COLLISION_GRID_SIZE
+        first_row = rect.y // COLLISION_GRID_SIZE
+        last_column = (rect.x + rect.width - 1) // COLLISION_GRID_SIZE
+        last_row = (rect.y + rect.height - 1) // COLLISION_GRID_SIZE
+
+        return [
+            (column, row)
+            for column in range(first_column, last_column + 1)
+            for row in range(first_row, last_row + 1)
+        ]
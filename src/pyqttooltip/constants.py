@@ -1,3 +1,10 @@
-
 QWIDGETSIZE_MAX = 16777215
 DROP_SHADOW_SIZE = 10
+DROP_SHADOW_RADIUS = 8
+DROP_SHADOW_CACHE_LIMIT = 4 * 1024 * 1024
+TRIANGLE_CACHE_LIMIT = 1024 * 1024
+TIMER_WHEEL_RESOLUTION = 10
+TIMER_WHEEL_SIZE = 256
+COLLISION_GRID_SIZE = 128
+COLLISION_SLIDE_STEPS = (0, -0.5, 0.5, -1, 1)
+IDLE_SLICE_BUDGET = 4
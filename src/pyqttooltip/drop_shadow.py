@@ -1,11 +1,16 @@
 from qtpy.QtWidgets import QWidget
-from qtpy.QtCore import QSize
+from qtpy.QtCore import Qt, QSize, QRect, QEvent
+from qtpy.QtGui import QPainter, QPainterPath, QPixmap, QColor
 from .tooltip_interface import TooltipInterface
+from .pixmap_cache import PixmapCache
 from .constants import *
 
 
 class DropShadow(QWidget):
 
+    # Rendered drop shadows shared between all tooltips
+    pixmap_cache = PixmapCache(DROP_SHADOW_CACHE_LIMIT)
+
     def __init__(self, tooltip: TooltipInterface):
         """Create a new DropShadow instance
 
@@ -16,44 +21,168 @@ class DropShadow(QWidget):
 
         self.tooltip = tooltip
 
-        # Drop shadow drawn manually since only one graphics effect can be applied
-        self.layers = []
+    def paintEvent(self, event: QEvent):
+        """Paint event that draws the cached drop shadow
 
-        for i in range(DROP_SHADOW_SIZE):
-            layer = QWidget(self)
-            self.__apply_layer_stylesheet(layer, i)
-            self.layers.append(layer)
+        :param event: event that is received
+        """
 
-    def update(self):
-        """Update the stylesheets of the layers"""
+        # Drop shadow drawn manually since only one graphics effect can be applied
+        painter = QPainter()
+        painter.begin(self)
+        DropShadow.draw_cached(
+            painter, self.rect(), self.tooltip.getDropShadowStrength(), self.devicePixelRatioF()
+        )
+        painter.end()
+
+    @staticmethod
+    def draw_cached(painter: QPainter, rect: QRect, strength: float, device_pixel_ratio: float,
+                    radius: int = DROP_SHADOW_RADIUS):
+        """Draw a drop shadow from the shared pixmap cache. Drop shadows that are
+        big enough are rendered once at a minimal size and stretched as a nine-patch,
+        so drop shadows of different sizes can reuse the same pixmap.
+
+        :param painter: painter to draw with
+        :param rect: rect of the drop shadow
+        :param strength: strength of the drop shadow
+        :param device_pixel_ratio: device pixel ratio of the paint device
+        :param radius: radius of the drop shadow layers
+        """
 
-        for i, layer in enumerate(self.layers):
-            self.__apply_layer_stylesheet(layer, i)
+        # Corners contain all the rounded parts of the layers, the edges between them are uniform
+        corner = DROP_SHADOW_SIZE + radius
+        pixmap = DropShadow.get_pixmap(rect.size(), strength, device_pixel_ratio, radius)
+
+        if DropShadow.__is_nine_patch(rect.size(), device_pixel_ratio, radius):
+            DropShadow.__draw_nine_patch(painter, rect, pixmap, corner, int(device_pixel_ratio))
+        else:
+            painter.drawPixmap(rect.topLeft(), pixmap)
+
+    @staticmethod
+    def get_pixmap(size: QSize, strength: float, device_pixel_ratio: float,
+                   radius: int = DROP_SHADOW_RADIUS) -> QPixmap:
+        """Get the pixmap that a drop shadow of a size is drawn from, rendering
+        it into the shared cache if needed. Drop shadows that are big enough
+        share a nine-patch pixmap of a minimal size.
+
+        :param size: size of the drop shadow
+        :param strength: strength of the drop shadow
+        :param device_pixel_ratio: device pixel ratio of the paint device
+        :param radius: radius of the drop shadow layers
+        :return: pixmap
+        """
 
-    def resize(self, size: QSize):
-        """Resize the drop shadow widget
+        if DropShadow.__is_nine_patch(size, device_pixel_ratio, radius):
+            nine_patch_size = (DROP_SHADOW_SIZE + radius) * 2 + 1
+            size = QSize(nine_patch_size, nine_patch_size)
+            key = ('drop_shadow', None, None, radius, strength, device_pixel_ratio)
+        else:
+            key = ('drop_shadow', size.width(), size.height(), radius, strength, device_pixel_ratio)
+
+        pixmap = DropShadow.pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = DropShadow.render_pixmap(size, strength, device_pixel_ratio, radius)
+            DropShadow.pixmap_cache.put(key, pixmap)
+        return pixmap
+
+    @staticmethod
+    def render_pixmap(size: QSize, strength: float, device_pixel_ratio: float = 1.0,
+                      radius: int = DROP_SHADOW_RADIUS) -> QPixmap:
+        """Render a drop shadow into a transparent pixmap
+
+        :param size: size of the drop shadow
+        :param strength: strength of the drop shadow
+        :param device_pixel_ratio: device pixel ratio of the pixmap
+        :param radius: radius of the drop shadow layers
+        :return: pixmap
+        """
 
-        :param size: new size
+        pixmap = QPixmap(size * device_pixel_ratio)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter()
+        painter.begin(pixmap)
+        DropShadow.draw(painter, QRect(0, 0, size.width(), size.height()), strength, radius)
+        painter.end()
+        return pixmap
+
+    @staticmethod
+    def draw(painter: QPainter, rect: QRect, strength: float, radius: int = DROP_SHADOW_RADIUS):
+        """Draw a drop shadow made up of stacked layers that get
+        smaller and more opaque towards the center
+
+        :param painter: painter to draw with
+        :param rect: rect of the drop shadow
+        :param strength: strength of the drop shadow
+        :param radius: radius of the drop shadow layers
         """
 
-        super().resize(size)
-        width = size.width()
-        height = size.height()
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        for i in range(DROP_SHADOW_SIZE):
+            layer_rect = rect.adjusted(i, i, -i, -i)
+            if layer_rect.isEmpty():
+                break
+            color = QColor(0, 0, 0, int((i + 1) * 0.001 * strength * 255))
+
+            # Layers that are too small for the radius are not rounded, same as with stylesheets
+            if min(layer_rect.width(), layer_rect.height()) < radius * 2:
+                painter.fillRect(layer_rect, color)
+                continue
+
+            path = QPainterPath()
+            path.addRoundedRect(
+                layer_rect.x(), layer_rect.y(), layer_rect.width(), layer_rect.height(), radius, radius
+            )
+            painter.fillPath(path, color)
+
+        painter.restore()
+
+    @staticmethod
+    def __is_nine_patch(size: QSize, device_pixel_ratio: float, radius: int) -> bool:
+        """Get whether a drop shadow is big enough to be drawn as a nine-patch
+
+        :param size: size of the drop shadow
+        :param device_pixel_ratio: device pixel ratio of the paint device
+        :param radius: radius of the drop shadow layers
+        :return: whether the drop shadow is drawn as a nine-patch
+        """
 
-        # Resize and move drop shadow layers
-        for i, layer in enumerate(self.layers):
-            layer.resize(width - i * 2, height - i * 2)
-            layer.move(i, i)
+        nine_patch_size = (DROP_SHADOW_SIZE + radius) * 2 + 1
+        return (size.width() >= nine_patch_size and size.height() >= nine_patch_size
+                and float(device_pixel_ratio).is_integer())
 
-    def __apply_layer_stylesheet(self, layer: QWidget, index: int):
-        """Apply stylesheet to a layer widget
+    @staticmethod
+    def __draw_nine_patch(painter: QPainter, rect: QRect, pixmap: QPixmap, corner: int, scale: int):
+        """Draw a pixmap stretched to a rect while keeping its corners unscaled
 
-        :param layer: layer to apply the stylesheet to
-        :param index: index of the layer
+        :param painter: painter to draw with
+        :param rect: target rect
+        :param pixmap: pixmap with a one pixel wide center row and column
+        :param corner: size of the corners
+        :param scale: device pixel ratio of the pixmap
         """
 
-        layer.setStyleSheet(
-            'background: rgba(0, 0, 0, {}); '
-            'border-radius: 8px;'
-            .format((index + 1) * 0.001 * self.tooltip.getDropShadowStrength())
-        )
+        source_size = pixmap.width() // scale
+        target_columns = [
+            (rect.x(), corner),
+            (rect.x() + corner, rect.width() - corner * 2),
+            (rect.x() + rect.width() - corner, corner)
+        ]
+        target_rows = [
+            (rect.y(), corner),
+            (rect.y() + corner, rect.height() - corner * 2),
+            (rect.y() + rect.height() - corner, corner)
+        ]
+        source_sections = [(0, corner), (corner, source_size - corner * 2), (source_size - corner, corner)]
+
+        for row, (target_y, target_height) in enumerate(target_rows):
+            source_y, source_height = source_sections[row]
+            for column, (target_x, target_width) in enumerate(target_columns):
+                source_x, source_width = source_sections[column]
+                painter.drawPixmap(
+                    QRect(target_x, target_y, target_width, target_height), pixmap,
+                    QRect(source_x * scale, source_y * scale, source_width * scale, source_height * scale)
+                )
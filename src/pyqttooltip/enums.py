@@ -1,9 +1,31 @@
-from enum import Enum
+from enum import Enum, IntEnum, IntFlag
 
 
-class TooltipPlacement(Enum):
+class TooltipPlacement(IntEnum):
     AUTO = 0
     LEFT = 1
     RIGHT = 2
     TOP = 3
     BOTTOM = 4
+
+
+class TooltipRenderer(Enum):
+    WIDGETS = 0
+    PAINTER = 1
+
+
+class TooltipFadeMode(Enum):
+    AUTO = 0
+    EFFECT = 1
+    WINDOW = 2
+    SNAPSHOT = 3
+
+
+class LayoutFlag(IntFlag):
+    NONE = 0
+    TEXT = 1
+    SIZE = 2
+    PLACEMENT = 4
+    POSITION = 8
+    STYLE = 16
+    ALL = TEXT | SIZE | PLACEMENT | POSITION
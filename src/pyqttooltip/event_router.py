@@ -0,0 +1,256 @@
+from functools import partial
+from weakref import ref, finalize
+from qtpy.QtWidgets import QWidget
+from qtpy.QtCore import QObject, QEvent
+from .tooltip_interface import TooltipInterface
+from .utils import Utils
+
+
+class EventRouter(QObject):
+
+    __instance = None
+
+    # Event types that are dispatched to the tooltips
+    HOVER_EVENTS = {QEvent.Type.HoverEnter, QEvent.Type.HoverLeave}
+    GEOMETRY_EVENTS = {QEvent.Type.Move, QEvent.Type.Resize, QEvent.Type.Show, QEvent.Type.Hide}
+    STRUCTURE_EVENTS = {QEvent.Type.ParentChange, QEvent.Type.DeferredDelete}
+
+    @staticmethod
+    def instance() -> 'EventRouter':
+        """Get the shared EventRouter instance
+
+        :return: event router
+        """
+
+        if EventRouter.__instance is None:
+            EventRouter.__instance = EventRouter()
+        return EventRouter.__instance
+
+    def __init__(self):
+        """Create a new EventRouter instance. A single event filter is installed
+        on every watched object, regardless of how many tooltips watch it."""
+
+        super(EventRouter, self).__init__(None)
+
+        # Tooltips are stored as weak references by their id,
+        # so watching a widget doesn't keep its tooltips alive
+        self.__watchers = {}
+        self.__hover_targets = {}
+        self.__watched_objects = {}
+        self.__finalizers = {}
+        self.__destroyed_slots = {}
+        self.__visible_tooltips = {}
+
+        # Version of the last geometry event of every watched object. Versions are taken from
+        # a single counter, so they are never reused when objects are watched again.
+        self.__geometry_versions = {}
+        self.__geometry_counter = 0
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Event filter that dispatches the relevant events of
+        a watched object to the tooltips that care about them
+
+        :param watched: object that is watched
+        :param event: event that is received
+        :return: whether further processing of the event is stopped
+        """
+
+        event_type = event.type()
+
+        if event_type in EventRouter.HOVER_EVENTS:
+            # Only the tooltips of the hovered widget (which can change while dispatching)
+            for tooltip in EventRouter.__get_tooltips(self.__hover_targets.get(watched, {})):
+                tooltip.eventFilter(watched, event)
+
+        elif event_type in EventRouter.GEOMETRY_EVENTS:
+            watchers = self.__watchers.get(watched)
+            if not watchers:
+                return False
+
+            # Hidden tooltips compare the geometry versions lazily, visible tooltips are notified
+            self.__geometry_counter += 1
+            self.__geometry_versions[watched] = self.__geometry_counter
+            if len(self.__visible_tooltips) < len(watchers):
+                tooltip_refs = {key: value for key, value in self.__visible_tooltips.items() if key in watchers}
+            else:
+                tooltip_refs = {key: value for key, value in watchers.items() if key in self.__visible_tooltips}
+            for tooltip in EventRouter.__get_tooltips(tooltip_refs):
+                tooltip.eventFilter(watched, event)
+
+        elif event_type in EventRouter.STRUCTURE_EVENTS:
+            for tooltip in EventRouter.__get_tooltips(self.__watchers.get(watched, {})):
+                tooltip.eventFilter(watched, event)
+        return False
+
+    def watch(self, tooltip: TooltipInterface, widget: QWidget | None, parents: bool = True):
+        """Watch a widget and all of its parents for a tooltip.
+        Objects watched before by the tooltip are no longer watched.
+
+        :param tooltip: tooltip that the events are dispatched to
+        :param widget: widget of the tooltip
+        :param parents: whether the parents are watched as well (not needed for hover events only)
+        """
+
+        self.unwatch(tooltip)
+        if widget is None:
+            return
+
+        tooltip_id = id(tooltip)
+        tooltip_ref = ref(tooltip)
+        watched_objects = [widget] + Utils.get_parents(widget) if parents else [widget]
+        self.__watched_objects[tooltip_id] = watched_objects
+        self.__hover_targets.setdefault(widget, {})[tooltip_id] = tooltip_ref
+
+        # Objects are no longer watched for the tooltip once it is garbage collected
+        self.__finalizers[tooltip_id] = finalize(tooltip, self.release, tooltip_id)
+
+        for watched in watched_objects:
+            watchers = self.__watchers.get(watched)
+            if watchers is None:
+                # First tooltip watching the object
+                watchers = self.__watchers[watched] = {}
+                self.__geometry_counter += 1
+                self.__geometry_versions[watched] = self.__geometry_counter
+                watched.installEventFilter(self)
+                slot = partial(self.__forget, watched)
+                watched.destroyed.connect(slot)
+                self.__destroyed_slots[watched] = slot
+            watchers[tooltip_id] = tooltip_ref
+
+    def unwatch(self, tooltip: TooltipInterface):
+        """Stop watching the objects watched for a tooltip
+
+        :param tooltip: tooltip to stop watching the objects for
+        """
+
+        self.release(id(tooltip))
+
+    def release(self, tooltip_id: int):
+        """Stop watching the objects watched for a tooltip by its id
+        (e.g. once the tooltip has been deleted or garbage collected)
+
+        :param tooltip_id: id of the tooltip
+        """
+
+        self.__visible_tooltips.pop(tooltip_id, None)
+        finalizer = self.__finalizers.pop(tooltip_id, None)
+        if finalizer is not None:
+            finalizer.detach()
+
+        watched_objects = self.__watched_objects.pop(tooltip_id, [])
+        if watched_objects:
+            self.__remove_hover_target(watched_objects[0], tooltip_id)
+
+        for watched in watched_objects:
+            watchers = self.__watchers.get(watched)
+            if watchers is None:
+                continue
+            watchers.pop(tooltip_id, None)
+
+            # Last tooltip watching the object
+            if not watchers:
+                del self.__watchers[watched]
+                del self.__geometry_versions[watched]
+                slot = self.__destroyed_slots.pop(watched)
+
+                # Router can be deleted before the tooltips while the interpreter shuts down
+                if not Utils.is_deleted(self):
+                    watched.removeEventFilter(self)
+                    watched.destroyed.disconnect(slot)
+
+    def set_visible(self, tooltip: TooltipInterface, visible: bool):
+        """Set whether a tooltip is visible. Geometry events are only
+        dispatched to visible tooltips.
+
+        :param tooltip: tooltip
+        :param visible: whether the tooltip is visible
+        """
+
+        if visible and id(tooltip) in self.__watched_objects:
+            self.__visible_tooltips[id(tooltip)] = ref(tooltip)
+        else:
+            self.__visible_tooltips.pop(id(tooltip), None)
+
+    def get_geometry_stamp(self, tooltip: TooltipInterface) -> tuple[int, ...]:
+        """Get the geometry versions of the objects watched for a tooltip. Every geometry
+        event of a watched object gives it a new version that has never been used before.
+        Hidden tooltips compare the stamp with the stamp of their last layout pass to find
+        out whether their placement is outdated.
+
+        :param tooltip: tooltip
+        :return: geometry stamp
+        """
+
+        return tuple(
+            self.__geometry_versions[watched] for watched in self.__watched_objects.get(id(tooltip), ())
+        )
+
+    def get_watcher_count(self, watched: QObject) -> int:
+        """Get the number of tooltips watching an object
+
+        :param watched: watched object
+        :return: number of tooltips
+        """
+
+        return len(self.__watchers.get(watched, ()))
+
+    def get_watched_object_count(self) -> int:
+        """Get the number of objects with an installed event filter
+
+        :return: number of watched objects
+        """
+
+        return len(self.__watchers)
+
+    def get_tooltip_count(self) -> int:
+        """Get the number of tooltips that objects are watched for
+
+        :return: number of tooltips
+        """
+
+        return len(self.__watched_objects)
+
+    def __remove_hover_target(self, widget: QWidget, tooltip_id: int):
+        """Stop dispatching the hover events of a widget to a tooltip
+
+        :param widget: hovered widget
+        :param tooltip_id: id of the tooltip of the widget
+        """
+
+        tooltip_refs = self.__hover_targets.get(widget)
+        if tooltip_refs is None:
+            return
+        tooltip_refs.pop(tooltip_id, None)
+        if not tooltip_refs:
+            del self.__hover_targets[widget]
+
+    def __forget(self, watched: QObject):
+        """Forget a watched object after it has been destroyed. Tooltips
+        whose widget has been destroyed don't watch any objects anymore.
+
+        :param watched: destroyed object
+        """
+
+        self.__destroyed_slots.pop(watched, None)
+        self.__hover_targets.pop(watched, None)
+        self.__geometry_versions.pop(watched, None)
+
+        for tooltip_id in self.__watchers.pop(watched, {}):
+            watched_objects = self.__watched_objects.get(tooltip_id)
+            if watched_objects is None or watched not in watched_objects:
+                continue
+            if watched is watched_objects[0]:
+                self.release(tooltip_id)
+            else:
+                watched_objects.remove(watched)
+
+    @staticmethod
+    def __get_tooltips(tooltip_refs: dict[int, ref]) -> list[TooltipInterface]:
+        """Get the tooltips of weak references that are still alive
+
+        :param tooltip_refs: weak references to the tooltips by id
+        :return: tooltips
+        """
+
+        return [tooltip for tooltip in (tooltip_ref() for tooltip_ref in list(tooltip_refs.values()))
+                if tooltip is not None]
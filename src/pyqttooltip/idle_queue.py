@@ -0,0 +1,77 @@
+import time
+from collections import OrderedDict
+from typing import Callable
+from qtpy.QtCore import QTimer
+from .utils import Utils
+from .constants import *
+
+
+class IdleQueue:
+
+    # Callbacks that are run while the event loop is idle (in the order they were scheduled)
+    __pending = OrderedDict()
+    __timer = None
+
+    @staticmethod
+    def schedule(key: object, callback: Callable[[], None]):
+        """Schedule a callback that is called once the event loop is idle.
+        A callback that is already scheduled with the same key is replaced.
+
+        :param key: key of the callback
+        :param callback: callback to call
+        """
+
+        IdleQueue.__pending[key] = callback
+
+        if Utils.is_deleted(IdleQueue.__timer):
+            # Timers with an interval of 0 time out once all pending events are processed
+            IdleQueue.__timer = QTimer()
+            IdleQueue.__timer.setInterval(0)
+            IdleQueue.__timer.timeout.connect(IdleQueue.__run_slice)
+
+        if not IdleQueue.__timer.isActive():
+            IdleQueue.__timer.start()
+
+    @staticmethod
+    def cancel(key: object):
+        """Cancel a scheduled callback
+
+        :param key: key of the callback
+        """
+
+        IdleQueue.__pending.pop(key, None)
+
+    @staticmethod
+    def is_pending(key: object) -> bool:
+        """Get whether a callback is scheduled
+
+        :param key: key of the callback
+        :return: whether the callback is scheduled
+        """
+
+        return key in IdleQueue.__pending
+
+    @staticmethod
+    def get_pending_count() -> int:
+        """Get the number of scheduled callbacks
+
+        :return: number of pending callbacks
+        """
+
+        return len(IdleQueue.__pending)
+
+    @staticmethod
+    def __run_slice():
+        """Call scheduled callbacks until the time budget of the slice is used up,
+        so input and paint events are processed between the slices"""
+
+        deadline = time.monotonic() + IDLE_SLICE_BUDGET / 1000
+
+        while IdleQueue.__pending:
+            key, callback = IdleQueue.__pending.popitem(last=False)
+            callback()
+            if time.monotonic() >= deadline:
+                break
+
+        if not IdleQueue.__pending:
+            IdleQueue.__timer.stop()
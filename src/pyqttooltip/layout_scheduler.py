@@ -0,0 +1,81 @@
+from typing import Callable
+from qtpy.QtCore import QTimer
+from .utils import Utils
+
+
+class LayoutScheduler:
+
+    # Callbacks of the objects that requested a layout pass in the current frame
+    __pending = {}
+    __timer = None
+
+    # Statistics
+    __request_count = 0
+    __coalesced_count = 0
+    __pass_count = 0
+
+    @staticmethod
+    def schedule(key: object, callback: Callable[[], None]):
+        """Schedule a layout pass for an object. All requests made during the
+        same display frame are collapsed into a single pass per object.
+
+        :param key: object the layout pass is scheduled for
+        :param callback: callback that performs the layout pass
+        """
+
+        LayoutScheduler.__request_count += 1
+
+        if key in LayoutScheduler.__pending:
+            LayoutScheduler.__coalesced_count += 1
+            return
+
+        LayoutScheduler.__pending[key] = callback
+
+        if Utils.is_deleted(LayoutScheduler.__timer):
+            LayoutScheduler.__timer = QTimer()
+            LayoutScheduler.__timer.setSingleShot(True)
+            LayoutScheduler.__timer.timeout.connect(LayoutScheduler.flush)
+
+        if not LayoutScheduler.__timer.isActive():
+            LayoutScheduler.__timer.start(Utils.get_frame_interval())
+
+    @staticmethod
+    def cancel(key: object):
+        """Cancel a scheduled layout pass
+
+        :param key: object the layout pass was scheduled for
+        """
+
+        LayoutScheduler.__pending.pop(key, None)
+
+    @staticmethod
+    def flush():
+        """Run all the scheduled layout passes immediately"""
+
+        pending = LayoutScheduler.__pending
+        LayoutScheduler.__pending = {}
+
+        for callback in pending.values():
+            LayoutScheduler.__pass_count += 1
+            callback()
+
+    @staticmethod
+    def get_stats() -> dict[str, int]:
+        """Get the statistics of the scheduler
+
+        :return: number of requests, coalesced requests, and executed layout passes
+        """
+
+        return {
+            'requests': LayoutScheduler.__request_count,
+            'coalesced': LayoutScheduler.__coalesced_count,
+            'passes': LayoutScheduler.__pass_count
+        }
+
+    @staticmethod
+    def reset_stats():
+        """Reset the statistics of the scheduler"""
+
+        LayoutScheduler.__request_count = 0
+        LayoutScheduler.__coalesced_count = 0
+        LayoutScheduler.__pass_count = 0
@@ -0,0 +1,118 @@
+from collections import OrderedDict
+from qtpy.QtGui import QPixmap
+
+
+class PixmapCache:
+
+    def __init__(self, memory_limit: int):
+        """Create a new PixmapCache instance that evicts the least
+        recently used pixmaps once the memory limit is exceeded
+
+        :param memory_limit: maximum memory used by the pixmaps in bytes
+        """
+
+        self.__pixmaps = OrderedDict()
+        self.__memory_limit = memory_limit
+        self.__memory_usage = 0
+        self.__hits = 0
+        self.__misses = 0
+
+    def get(self, key: tuple) -> QPixmap | None:
+        """Get a pixmap and mark it as recently used
+
+        :param key: key of the pixmap
+        :return: pixmap (None if not cached)
+        """
+
+        pixmap = self.__pixmaps.get(key)
+
+        if pixmap is None:
+            self.__misses += 1
+            return None
+
+        self.__hits += 1
+        self.__pixmaps.move_to_end(key)
+        return pixmap
+
+    def put(self, key: tuple, pixmap: QPixmap):
+        """Store a pixmap and evict the least recently used ones if the memory limit is exceeded
+
+        :param key: key of the pixmap
+        :param pixmap: pixmap to store
+        """
+
+        self.remove(key)
+        self.__pixmaps[key] = pixmap
+        self.__memory_usage += PixmapCache.get_pixmap_memory(pixmap)
+        self.__evict()
+
+    def remove(self, key: tuple):
+        """Remove a pixmap
+
+        :param key: key of the pixmap
+        """
+
+        pixmap = self.__pixmaps.pop(key, None)
+        if pixmap is not None:
+            self.__memory_usage -= PixmapCache.get_pixmap_memory(pixmap)
+
+    def clear(self):
+        """Remove all the pixmaps"""
+
+        self.__pixmaps.clear()
+        self.__memory_usage = 0
+
+    def get_memory_usage(self) -> int:
+        """Get the memory used by the cached pixmaps
+
+        :return: memory usage in bytes
+        """
+
+        return self.__memory_usage
+
+    def get_memory_limit(self) -> int:
+        """Get the maximum memory used by the cached pixmaps
+
+        :return: memory limit in bytes
+        """
+
+        return self.__memory_limit
+
+    def set_memory_limit(self, memory_limit: int):
+        """Set the maximum memory used by the cached pixmaps
+
+        :param memory_limit: new memory limit in bytes
+        """
+
+        self.__memory_limit = memory_limit
+        self.__evict()
+
+    def get_stats(self) -> dict[str, int]:
+        """Get the statistics of the cache
+
+        :return: number of hits, misses, cached pixmaps, and memory usage in bytes
+        """
+
+        return {
+            'hits': self.__hits,
+            'misses': self.__misses,
+            'size': len(self.__pixmaps),
+            'memory': self.__memory_usage
+        }
+
+    def __evict(self):
+        """Evict the least recently used pixmaps until the memory limit is no longer exceeded"""
+
+        while self.__pixmaps and self.__memory_usage > self.__memory_limit:
+            _, pixmap = self.__pixmaps.popitem(last=False)
+            self.__memory_usage -= PixmapCache.get_pixmap_memory(pixmap)
+
+    @staticmethod
+    def get_pixmap_memory(pixmap: QPixmap) -> int:
+        """Get the memory used by a pixmap
+
+        :param pixmap: pixmap
+        :return: memory in bytes
+        """
+
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
@@ -0,0 +1,601 @@
+from typing import Callable, Iterable, Sequence
+from .enums import TooltipPlacement
+from .constants import *
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Offsets of the placements as (x, y) tuples by placement (or indexed by placement)
+Offsets = dict[TooltipPlacement, tuple[int, int]] | Sequence[tuple[int, int]]
+
+# Order of the placements in the columns of the vectorized calculation
+VECTORIZED_PLACEMENTS = [
+    TooltipPlacement.RIGHT, TooltipPlacement.LEFT, TooltipPlacement.TOP, TooltipPlacement.BOTTOM
+]
+
+
+class Rect:
+
+    __slots__ = ('x', 'y', 'width', 'height')
+
+    def __init__(self, x: int, y: int, width: int, height: int):
+        """Create a new Rect instance that doesn't depend on Qt.
+        Like a QRect, the right and bottom edges are inclusive.
+
+        :param x: x coordinate of the left edge
+        :param y: y coordinate of the top edge
+        :param width: width
+        :param height: height
+        """
+
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    def right(self) -> int:
+        """Get the x coordinate of the right edge
+
+        :return: right edge
+        """
+
+        return self.x + self.width - 1
+
+    def bottom(self) -> int:
+        """Get the y coordinate of the bottom edge
+
+        :return: bottom edge
+        """
+
+        return self.y + self.height - 1
+
+    def contains(self, rect: 'Rect') -> bool:
+        """Check if another rect is fully contained by the rect
+
+        :param rect: rect that should be checked
+        :return: whether the rect is contained
+        """
+
+        return (self.x <= rect.x and self.y <= rect.y
+                and rect.x + rect.width <= self.x + self.width
+                and rect.y + rect.height <= self.y + self.height)
+
+    def get_intersection_area(self, rect: 'Rect') -> int:
+        """Get the area of the intersection with another rect
+
+        :param rect: other rect
+        :return: intersection area (0 if the rects don't intersect)
+        """
+
+        width = min(self.x + self.width, rect.x + rect.width) - max(self.x, rect.x)
+        height = min(self.y + self.height, rect.y + rect.height) - max(self.y, rect.y)
+        if width <= 0 or height <= 0:
+            return 0
+        return width * height
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Rect):
+            return NotImplemented
+        return (self.x, self.y, self.width, self.height) == (other.x, other.y, other.width, other.height)
+
+    def __repr__(self) -> str:
+        return 'Rect({}, {}, {}, {})'.format(self.x, self.y, self.width, self.height)
+
+    @staticmethod
+    def create(rect: 'Rect | tuple[int, int, int, int]') -> 'Rect':
+        """Get a rect from a rect or an (x, y, width, height) tuple
+
+        :param rect: rect or tuple
+        :return: rect
+        """
+
+        if isinstance(rect, Rect):
+            return rect
+        return Rect(*rect)
+
+
+class PlacementCore:
+
+    @staticmethod
+    def get_tooltip_rect(anchor: Rect, placement: TooltipPlacement, size: tuple[int, int],
+                         triangle_size: int, offset: tuple[int, int]) -> Rect:
+        """Get the rect of a tooltip based on the anchor rect,
+        placement, size, triangle size, and offset of the tooltip
+
+        :param anchor: global rect of the widget of the tooltip
+        :param placement: placement of the tooltip
+        :param size: width and height of the tooltip
+        :param triangle_size: size of the triangle
+        :param offset: offset of the placement
+        :return: rect of the tooltip
+        """
+
+        width, height = size
+        offset_x, offset_y = offset
+
+        # Calculate rect depending on placement
+        if placement == TooltipPlacement.TOP:
+            x = int(anchor.x + anchor.width / 2 - width / 2) + offset_x
+            y = anchor.y - height - triangle_size + offset_y
+            return Rect(x, y, width + 1, height + triangle_size + 1)
+        elif placement == TooltipPlacement.BOTTOM:
+            x = int(anchor.x + anchor.width / 2 - width / 2) + offset_x
+            y = anchor.y + anchor.height + offset_y
+            return Rect(x, y, width + 1, height + triangle_size + 1)
+        elif placement == TooltipPlacement.LEFT:
+            x = anchor.x - width - triangle_size + offset_x
+            y = int(anchor.y + anchor.height / 2 - width / 2) + offset_y
+            return Rect(x, y, width + triangle_size + 1, height + 1)
+        elif placement == TooltipPlacement.RIGHT:
+            x = anchor.x + anchor.width + offset_x
+            y = int(anchor.y + anchor.height / 2 - width / 2) + offset_y
+            return Rect(x, y, width + triangle_size + 1, height + 1)
+        return Rect(0, 0, 0, 0)
+
+    @staticmethod
+    def is_contained_by_screen(rect: Rect, screens: Iterable[Rect]) -> bool:
+        """Check if a rect is fully contained by a single screen
+
+        :param rect: rect that should be checked
+        :param screens: geometries of the screens
+        :return: whether the rect is contained by a screen
+        """
+
+        for screen in screens:
+            if screen.contains(rect):
+                return True
+        return False
+
+    @staticmethod
+    def get_optimal_placement(anchor: Rect, bounds: Rect, size: tuple[int, int], triangle_size: int,
+                              offsets: Offsets,
+                              screens: Iterable[Rect]) -> TooltipPlacement:
+        """Calculate the optimal placement of a tooltip based on the space
+        around the anchor rect inside the bounds of its top level parent
+
+        :param anchor: global rect of the widget of the tooltip
+        :param bounds: global rect of the top level parent of the widget
+        :param size: width and height of the tooltip
+        :param triangle_size: size of the triangle
+        :param offsets: offsets of the placements
+        :param screens: geometries of the screens
+        :return: optimal placement
+        """
+
+        # Calculate available space for placements
+        left_space = anchor.x - bounds.x
+        right_space = bounds.right() - (anchor.x + anchor.width)
+        top_space = anchor.y - bounds.y
+        bottom_space = bounds.bottom() - (anchor.y + anchor.height)
+        space_placement_map = {
+            right_space:  TooltipPlacement.RIGHT,
+            left_space:   TooltipPlacement.LEFT,
+            top_space:    TooltipPlacement.TOP,
+            bottom_space: TooltipPlacement.BOTTOM
+        }
+
+        # Return most optimal placement that also fits on screen
+        optimal_placement = None
+        for space, placement in sorted(space_placement_map.items(), reverse=True):
+            if not optimal_placement:
+                optimal_placement = placement
+
+            tooltip_rect = PlacementCore.get_tooltip_rect(
+                anchor, placement, size, triangle_size, offsets[placement]
+            )
+            if PlacementCore.is_contained_by_screen(tooltip_rect, screens):
+                return placement
+
+        return optimal_placement
+
+    @staticmethod
+    def get_fallback_placement(anchor: Rect, primary_placement: TooltipPlacement,
+                               fallback_placements: Iterable[TooltipPlacement], size: tuple[int, int],
+                               triangle_size: int, offsets: Offsets,
+                               screens: Iterable[Rect]) -> TooltipPlacement | None:
+        """Calculate fallback placement if the primary placement would
+        lead to a tooltip that doesn't entirely fit on the screen
+
+        :param anchor: global rect of the widget of the tooltip
+        :param primary_placement: primary placement of the tooltip
+        :param fallback_placements: fallback placements that are available
+        :param size: width and height of the tooltip
+        :param triangle_size: size of the triangle
+        :param offsets: offsets of the placements
+        :param screens: geometries of the screens
+        :return: fallback placement (None if primary placement is valid)
+        """
+
+        tooltip_rect = PlacementCore.get_tooltip_rect(
+            anchor, primary_placement, size, triangle_size, offsets[primary_placement]
+        )
+
+        # Return None if primary placement is valid
+        if PlacementCore.is_contained_by_screen(tooltip_rect, screens):
+            return None
+
+        # Check all fallback placements and return first valid placement
+        for placement in fallback_placements:
+            if placement == primary_placement or placement == TooltipPlacement.AUTO:
+                continue
+            tooltip_rect = PlacementCore.get_tooltip_rect(
+                anchor, placement, size, triangle_size, offsets[placement]
+            )
+            if PlacementCore.is_contained_by_screen(tooltip_rect, screens):
+                return placement
+        return None
+
+    @staticmethod
+    def get_placed_rect(anchor: Rect, placement: TooltipPlacement, size: tuple[int, int],
+                        triangle_size: int, offset: tuple[int, int], slide: int = 0) -> Rect:
+        """Get the rect that a tooltip covers (body and triangle) when it is placed
+        and its body is slid along the edge of the anchor rect
+
+        :param anchor: global rect of the widget of the tooltip
+        :param placement: placement of the tooltip
+        :param size: width and height of the body
+        :param triangle_size: size of the triangle
+        :param offset: offset of the placement
+        :param slide: distance the body is slid along the edge of the anchor rect
+        :return: covered rect
+        """
+
+        width, height = size
+        offset_x, offset_y = offset
+
+        if placement == TooltipPlacement.TOP or placement == TooltipPlacement.BOTTOM:
+            x = int(anchor.x + anchor.width / 2 - width / 2) + offset_x + slide
+            if placement == TooltipPlacement.TOP:
+                y = anchor.y - height - triangle_size + offset_y
+            else:
+                y = anchor.y + anchor.height + offset_y
+            return Rect(x, y, width, height + triangle_size)
+
+        y = int(anchor.y + anchor.height / 2 - height / 2) + offset_y + slide
+        if placement == TooltipPlacement.LEFT:
+            x = anchor.x - width - triangle_size + offset_x
+        else:
+            x = anchor.x + anchor.width + offset_x
+        return Rect(x, y, width + triangle_size, height)
+
+    @staticmethod
+    def get_max_slide(placement: TooltipPlacement, size: tuple[int, int], triangle_size: int, margin: int) -> int:
+        """Get the distance the body can be slid in each direction
+        while the triangle stays on the straight part of its edge
+
+        :param placement: placement of the tooltip
+        :param size: width and height of the body
+        :param triangle_size: size of the triangle
+        :param margin: distance the triangle keeps to the corners of the body
+        :return: maximum slide
+        """
+
+        if placement == TooltipPlacement.TOP or placement == TooltipPlacement.BOTTOM:
+            length = size[0]
+        else:
+            length = size[1]
+        return max(0, length // 2 - triangle_size - margin)
+
+    @staticmethod
+    def get_fitting_slide(rect: Rect, placement: TooltipPlacement, max_slide: int,
+                          screens: Iterable[Rect]) -> int | None:
+        """Calculate the smallest slide along the edge of the anchor rect
+        that moves a placed rect fully onto a single screen
+
+        :param rect: covered rect of the tooltip without any slide
+        :param placement: placement of the tooltip
+        :param max_slide: maximum slide in each direction
+        :param screens: geometries of the screens
+        :return: slide (None if the rect can't be slid onto a screen)
+        """
+
+        horizontal = placement == TooltipPlacement.TOP or placement == TooltipPlacement.BOTTOM
+        best_slide = None
+
+        for screen in screens:
+            # Rect must already fit the screen perpendicular to the slide
+            if horizontal:
+                fits = screen.y <= rect.y and rect.y + rect.height <= screen.y + screen.height
+                lowest = screen.x - rect.x
+                highest = screen.x + screen.width - (rect.x + rect.width)
+            else:
+                fits = screen.x <= rect.x and rect.x + rect.width <= screen.x + screen.width
+                lowest = screen.y - rect.y
+                highest = screen.y + screen.height - (rect.y + rect.height)
+            if not fits or lowest > highest:
+                continue
+
+            # Slide closest to the centered position that keeps the rect on the screen
+            slide = min(max(0, lowest), highest)
+            if abs(slide) <= max_slide and (best_slide is None or abs(slide) < abs(best_slide)):
+                best_slide = slide
+
+        return best_slide
+
+    @staticmethod
+    def get_sliding_placement(anchor: Rect, candidates: Iterable[TooltipPlacement], size: tuple[int, int],
+                              triangle_size: int, offsets: Offsets,
+                              screens: Iterable[Rect], margin: int) -> tuple[TooltipPlacement, int, Rect] | None:
+        """Choose the first candidate placement that fits on the screen once
+        its body is slid along the edge of the anchor rect
+
+        :param anchor: global rect of the widget of the tooltip
+        :param candidates: candidate placements in the order of preference
+        :param size: width and height of the body
+        :param triangle_size: size of the triangle
+        :param offsets: offsets of the placements
+        :param screens: geometries of the screens
+        :param margin: distance the triangle keeps to the corners of the body
+        :return: placement, slide, and covered rect (None if no candidate fits)
+        """
+
+        screens = list(screens)
+
+        for placement in candidates:
+            rect = PlacementCore.get_placed_rect(anchor, placement, size, triangle_size, offsets[placement])
+            max_slide = PlacementCore.get_max_slide(placement, size, triangle_size, margin)
+            slide = PlacementCore.get_fitting_slide(rect, placement, max_slide, screens)
+
+            if slide is not None:
+                return placement, slide, PlacementCore.get_placed_rect(
+                    anchor, placement, size, triangle_size, offsets[placement], slide
+                )
+        return None
+
+    @staticmethod
+    def get_candidate_placements(anchor: Rect, bounds: Rect, size: tuple[int, int], triangle_size: int,
+                                 offsets: Offsets, screens: Iterable[Rect],
+                                 placement: TooltipPlacement = TooltipPlacement.AUTO,
+                                 fallback_placements: Iterable[TooltipPlacement] = ()) -> list[TooltipPlacement]:
+        """Get the placements a tooltip can choose from in the order of preference.
+        With AUTO, the optimal placement comes first and the others follow by their space,
+        otherwise the placement comes first and the fallback placements follow.
+
+        :param anchor: global rect of the widget of the tooltip
+        :param bounds: global rect of the top level parent of the widget
+        :param size: width and height of the tooltip
+        :param triangle_size: size of the triangle
+        :param offsets: offsets of the placements
+        :param screens: geometries of the screens
+        :param placement: placement of the tooltip
+        :param fallback_placements: fallback placements that are available
+        :return: candidate placements
+        """
+
+        if placement == TooltipPlacement.AUTO:
+            spaces = [
+                (bounds.right() - (anchor.x + anchor.width), TooltipPlacement.RIGHT),
+                (anchor.x - bounds.x, TooltipPlacement.LEFT),
+                (anchor.y - bounds.y, TooltipPlacement.TOP),
+                (bounds.bottom() - (anchor.y + anchor.height), TooltipPlacement.BOTTOM)
+            ]
+            candidates = [PlacementCore.get_optimal_placement(
+                anchor, bounds, size, triangle_size, offsets, screens
+            )]
+            for space, candidate in sorted(spaces, key=lambda item: item[0], reverse=True):
+                if candidate not in candidates:
+                    candidates.append(candidate)
+            return candidates
+
+        candidates = [placement]
+        for candidate in fallback_placements:
+            if candidate not in candidates and candidate != TooltipPlacement.AUTO:
+                candidates.append(candidate)
+        return candidates
+
+    @staticmethod
+    def get_least_overlapping_placement(anchor: Rect, candidates: Iterable[TooltipPlacement],
+                                        size: tuple[int, int], triangle_size: int,
+                                        offsets: Offsets, screens: Iterable[Rect],
+                                        margin: int, get_overlap: Callable[[Rect], int]) \
+            -> tuple[TooltipPlacement, int, Rect]:
+        """Choose the placement and slide of a tooltip that fits on the screen and
+        overlaps the least with other tooltips. Every candidate placement is tried
+        centered, slid by fractions of its maximum slide (COLLISION_SLIDE_STEPS),
+        and slid by the smallest distance that moves it onto the screen.
+
+        :param anchor: global rect of the widget of the tooltip
+        :param candidates: candidate placements in the order of preference
+        :param size: width and height of the body
+        :param triangle_size: size of the triangle
+        :param offsets: offsets of the placements
+        :param screens: geometries of the screens
+        :param margin: distance the triangle keeps to the corners of the body
+        :param get_overlap: callback that returns the area of other tooltips a rect overlaps
+        :return: placement, slide, and covered rect
+        """
+
+        screens = list(screens)
+        best = None
+        best_score = None
+        rank = 0
+
+        for placement in candidates:
+            max_slide = PlacementCore.get_max_slide(placement, size, triangle_size, margin)
+            slides = [int(max_slide * step) for step in COLLISION_SLIDE_STEPS]
+
+            # Slide that moves the tooltip onto the screen is also a candidate
+            fitting_slide = PlacementCore.get_fitting_slide(
+                PlacementCore.get_placed_rect(anchor, placement, size, triangle_size, offsets[placement]),
+                placement, max_slide, screens
+            )
+            if fitting_slide is not None:
+                slides.append(fitting_slide)
+
+            for slide in dict.fromkeys(slides):
+                rect = PlacementCore.get_placed_rect(
+                    anchor, placement, size, triangle_size, offsets[placement], slide
+                )
+                fits = PlacementCore.is_contained_by_screen(rect, screens)
+                overlap = get_overlap(rect)
+
+                # Candidates that fit the screen win, then the ones with less overlap
+                score = (not fits, overlap, rank)
+                rank += 1
+                if best_score is None or score < best_score:
+                    best = (placement, slide, rect)
+                    best_score = score
+                if fits and overlap == 0:
+                    return best
+
+        return best
+
+    @staticmethod
+    def get_placements(items: Iterable[tuple[Rect | tuple, tuple[int, int]]], bounds: Rect | tuple,
+                       screens: Iterable[Rect | tuple], triangle_size: int,
+                       offsets: Offsets,
+                       placement: TooltipPlacement = TooltipPlacement.AUTO,
+                       fallback_placements: Iterable[TooltipPlacement] = ()) -> list[TooltipPlacement]:
+        """Calculate the actual placements of many tooltips at once.
+        Rects can be passed as (x, y, width, height) tuples.
+
+        :param items: global anchor rects and tooltip sizes (width and height)
+        :param bounds: global rect of the top level parent of the anchors
+        :param screens: geometries of the screens
+        :param triangle_size: size of the triangles
+        :param offsets: offsets of the placements
+        :param placement: placement of the tooltips (AUTO for the optimal placement)
+        :param fallback_placements: fallback placements that are available
+        :return: actual placement for every item
+        """
+
+        bounds = Rect.create(bounds)
+        screens = [Rect.create(screen) for screen in screens]
+        fallback_placements = list(fallback_placements)
+        placements = []
+
+        for anchor, size in items:
+            anchor = Rect.create(anchor)
+
+            if placement == TooltipPlacement.AUTO:
+                placements.append(PlacementCore.get_optimal_placement(
+                    anchor, bounds, size, triangle_size, offsets, screens
+                ))
+                continue
+
+            fallback_placement = None
+            if fallback_placements:
+                fallback_placement = PlacementCore.get_fallback_placement(
+                    anchor, placement, fallback_placements, size, triangle_size, offsets, screens
+                )
+            placements.append(fallback_placement or placement)
+
+        return placements
+
+    @staticmethod
+    def get_optimal_placements(anchors: Sequence[Rect | tuple], sizes: Sequence[tuple[int, int]],
+                               triangle_sizes: int | Sequence[int],
+                               offsets: dict[TooltipPlacement, tuple[int, int] | Sequence[tuple[int, int]]]
+                               | Sequence[tuple[int, int]],
+                               bounds: Rect | tuple, screens: Iterable[Rect | tuple]) -> list[TooltipPlacement]:
+        """Calculate the optimal placements of many tooltips at once. If NumPy is
+        installed, all the candidate rects and fit checks are calculated as arrays.
+        Results are the same as with get_optimal_placement for every row.
+
+        :param anchors: global anchor rects (n rects or an array of shape (n, 4))
+        :param sizes: widths and heights of the tooltips (array of shape (n, 2))
+        :param triangle_sizes: size of the triangles (one for all rows or one per row)
+        :param offsets: offsets of the placements (one for all rows or one per row,
+                        by placement or indexed by placement)
+        :param bounds: global rect of the top level parent of the anchors
+        :param screens: geometries of the screens
+        :return: optimal placement for every row
+        """
+
+        bounds = Rect.create(bounds)
+        screens = [Rect.create(screen) for screen in screens]
+
+        # Both calculations take the offsets by placement
+        if not isinstance(offsets, dict):
+            offsets = {placement: offsets[placement] for placement in VECTORIZED_PLACEMENTS}
+
+        if numpy is not None:
+            return PlacementCore.__get_optimal_placements_vectorized(
+                anchors, sizes, triangle_sizes, offsets, bounds, screens
+            )
+
+        placements = []
+        for i, (anchor, size) in enumerate(zip(anchors, sizes)):
+            triangle_size = triangle_sizes if isinstance(triangle_sizes, int) else triangle_sizes[i]
+            row_offsets = {
+                placement: offset if isinstance(offset[0], int) else offset[i]
+                for placement, offset in offsets.items()
+            }
+            placements.append(PlacementCore.get_optimal_placement(
+                Rect.create(tuple(anchor)), bounds, tuple(size), triangle_size, row_offsets, screens
+            ))
+        return placements
+
+    @staticmethod
+    def __get_optimal_placements_vectorized(anchors, sizes, triangle_sizes, offsets,
+                                            bounds: Rect, screens: list[Rect]) -> list[TooltipPlacement]:
+        """Calculate the optimal placements of many tooltips with NumPy
+
+        :param anchors: global anchor rects (array of shape (n, 4))
+        :param sizes: widths and heights of the tooltips (array of shape (n, 2))
+        :param triangle_sizes: size of the triangles (one for all rows or one per row)
+        :param offsets: offsets of the placements (one for all rows or one per row)
+        :param bounds: global rect of the top level parent of the anchors
+        :param screens: geometries of the screens
+        :return: optimal placement for every row
+        """
+
+        if not isinstance(anchors, numpy.ndarray):
+            anchors = [
+                (anchor.x, anchor.y, anchor.width, anchor.height) if isinstance(anchor, Rect) else anchor
+                for anchor in anchors
+            ]
+        anchors = numpy.asarray(anchors, dtype=numpy.int64).reshape(-1, 4)
+        sizes = numpy.asarray(sizes, dtype=numpy.int64).reshape(-1, 2)
+        rows = len(anchors)
+        if rows == 0:
+            return []
+
+        anchor_x, anchor_y, anchor_width, anchor_height = anchors.T
+        width, height = sizes.T
+        triangle_size = numpy.broadcast_to(numpy.asarray(triangle_sizes, dtype=numpy.int64), (rows,))
+
+        # Available space for the placements (one column per placement)
+        spaces = numpy.stack([
+            bounds.right() - (anchor_x + anchor_width),
+            anchor_x - bounds.x,
+            anchor_y - bounds.y,
+            bounds.bottom() - (anchor_y + anchor_height)
+        ], axis=1)
+
+        # Candidate rects of the placements
+        centered_x = numpy.trunc(anchor_x + anchor_width / 2 - width / 2).astype(numpy.int64)
+        centered_y = numpy.trunc(anchor_y + anchor_height / 2 - width / 2).astype(numpy.int64)
+        x = numpy.stack([anchor_x + anchor_width, anchor_x - width - triangle_size, centered_x, centered_x], axis=1)
+        y = numpy.stack([centered_y, centered_y, anchor_y - height - triangle_size, anchor_y + anchor_height], axis=1)
+        rect_width = numpy.stack([width + triangle_size + 1] * 2 + [width + 1] * 2, axis=1)
+        rect_height = numpy.stack([height + 1] * 2 + [height + triangle_size + 1] * 2, axis=1)
+
+        for column, placement in enumerate(VECTORIZED_PLACEMENTS):
+            offset = numpy.broadcast_to(numpy.asarray(offsets[placement], dtype=numpy.int64), (rows, 2))
+            x[:, column] += offset[:, 0]
+            y[:, column] += offset[:, 1]
+
+        # Candidate fits if a single screen contains it
+        fits = numpy.zeros((rows, 4), dtype=bool)
+        for screen in screens:
+            fits |= ((screen.x <= x) & (screen.y <= y)
+                     & (x + rect_width <= screen.x + screen.width)
+                     & (y + rect_height <= screen.y + screen.height))
+
+        # Placements with the same space replace each other (like the keys of a dict)
+        candidates = numpy.ones((rows, 4), dtype=bool)
+        for column in range(3):
+            candidates[:, column] = ~(spaces[:, column:column + 1] == spaces[:, column + 1:]).any(axis=1)
+
+        # Candidate with the most space that fits, otherwise the candidate with the most space
+        minimum = numpy.iinfo(numpy.int64).min
+        best = numpy.where(candidates, spaces, minimum).argmax(axis=1)
+        fitting = candidates & fits
+        best_fitting = numpy.where(fitting, spaces, minimum).argmax(axis=1)
+        chosen = numpy.where(fitting.any(axis=1), best_fitting, best)
+
+        return [VECTORIZED_PLACEMENTS[column] for column in chosen.tolist()]
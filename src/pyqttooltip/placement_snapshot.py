@@ -0,0 +1,32 @@
+from typing import NamedTuple
+from qtpy.QtWidgets import QWidget
+from qtpy.QtCore import QRect, QSize, QPoint
+from .screen_geometry import ScreenGeometryCache
+from .utils import Utils
+
+
+class PlacementSnapshot(NamedTuple):
+
+    widget_pos: QPoint
+    widget_size: QSize
+    top_level_pos: QPoint
+    top_level_geometry: QRect
+    screen_geometries: tuple[QRect, ...]
+
+    @staticmethod
+    def capture(widget: QWidget) -> 'PlacementSnapshot':
+        """Capture the geometry of a widget, its top level parent, and the screens,
+        so a layout pass doesn't have to query the widget tree more than once
+
+        :param widget: widget of the tooltip
+        :return: snapshot
+        """
+
+        top_level_parent = Utils.get_top_level_parent(widget)
+        return PlacementSnapshot(
+            Utils.map_to_global(top_level_parent, widget.pos()),
+            QSize(widget.size()),
+            QPoint(top_level_parent.pos()),
+            QRect(top_level_parent.geometry()),
+            tuple(ScreenGeometryCache.get_geometries())
+        )
@@ -1,59 +1,43 @@
-from qtpy.QtWidgets import QWidget, QApplication
-from qtpy.QtCore import QRect, QSize, QPoint
+from qtpy.QtWidgets import QWidget
+from qtpy.QtCore import QSize, QPoint
 from .enums import TooltipPlacement
-from .utils import Utils
+from .placement_core import PlacementCore, Rect
+from .collision_index import CollisionIndex
+from .placement_snapshot import PlacementSnapshot
 
 
 class PlacementUtils:
 
     @staticmethod
     def get_optimal_placement(widget: QWidget, size: QSize, triangle_size: int,
-                              offsets: dict[TooltipPlacement, QPoint]) -> TooltipPlacement:
+                              offsets: dict[TooltipPlacement, QPoint] | list[tuple[int, int]],
+                              snapshot: PlacementSnapshot = None) -> TooltipPlacement:
         """Calculate the optimal placement of a tooltip based on the widget,
         size, triangle size, and offsets.
 
         :param widget: widget of the tooltip
         :param size: size of the tooltip
         :param triangle_size: size of the triangle
-        :param offsets: offsets of the tooltip
+        :param offsets: offsets of the tooltip (QPoints by placement or tuples indexed by placement)
+        :param snapshot: geometry of the widget and screens (captured if None)
         :return: optimal placement
         """
 
-        top_level_parent = Utils.get_top_level_parent(widget)
-        top_level_parent_pos = top_level_parent.pos()
-        top_level_parent_geometry = top_level_parent.geometry()
-        widget_pos = top_level_parent.mapToGlobal(widget.pos())
-
-        # Calculate available space for placements
-        left_space = widget_pos.x() - top_level_parent_pos.x()
-        right_space = top_level_parent_geometry.right() - (widget_pos.x() + widget.width())
-        top_space = widget_pos.y() - top_level_parent_pos.y()
-        bottom_space = top_level_parent_geometry.bottom() - (widget_pos.y() + widget.height())
-        space_placement_map = {
-            right_space:  TooltipPlacement.RIGHT,
-            left_space:   TooltipPlacement.LEFT,
-            top_space:    TooltipPlacement.TOP,
-            bottom_space: TooltipPlacement.BOTTOM
-        }
-
-        # Return most optimal placement that also fits on screen
-        optimal_placement = None
-        for space, placement in sorted(space_placement_map.items(), reverse=True):
-            if not optimal_placement:
-                optimal_placement = placement
-
-            tooltip_rect = PlacementUtils.__get_tooltip_rect(
-                widget, placement, size, triangle_size, offsets
-            )
-            if PlacementUtils.__rect_contained_by_screen(tooltip_rect):
-                return placement
-
-        return optimal_placement
+        if snapshot is None:
+            snapshot = PlacementSnapshot.capture(widget)
+
+        return PlacementCore.get_optimal_placement(
+            PlacementUtils.__get_anchor(snapshot), PlacementUtils.__get_bounds(snapshot),
+            (size.width(), size.height()), triangle_size,
+            PlacementUtils.__get_offsets(offsets), PlacementUtils.__get_screens(snapshot)
+        )
 
     @staticmethod
     def get_fallback_placement(widget: QWidget, primary_placement: TooltipPlacement, fallback_placements:
                                list[TooltipPlacement], size: QSize, triangle_size: int, offsets:
-                               dict[TooltipPlacement, QPoint]) -> TooltipPlacement | None:
+                               dict[TooltipPlacement, QPoint] | list[tuple[int, int]],
+                               snapshot: PlacementSnapshot = None) \
+            -> TooltipPlacement | None:
         """Calculate fallback placement if the current placement would
         lead to a tooltip that doesn't entirely fit on the screen
         
@@ -62,80 +46,149 @@ class PlacementUtils:
         :param fallback_placements: fallback placements that are available
         :param size: size of the tooltip
         :param triangle_size: size of the triangle
-        :param offsets: offsets of the tooltip
+        :param offsets: offsets of the tooltip (QPoints by placement or tuples indexed by placement)
+        :param snapshot: geometry of the widget and screens (captured if None)
         :return: fallback placement (None if current placement is valid)
         """
 
-        tooltip_rect = PlacementUtils.__get_tooltip_rect(
-            widget, primary_placement, size, triangle_size, offsets
-        )
+        if snapshot is None:
+            snapshot = PlacementSnapshot.capture(widget)
 
-        # Return None if current placement is valid
-        if PlacementUtils.__rect_contained_by_screen(tooltip_rect):
-            return None
-
-        # Check all fallback placements and return first valid placement
-        for placement in fallback_placements:
-            if placement == primary_placement or placement == TooltipPlacement.AUTO:
-                continue
-            tooltip_rect = PlacementUtils.__get_tooltip_rect(
-                widget, placement, size, triangle_size, offsets
-            )
-            if PlacementUtils.__rect_contained_by_screen(tooltip_rect):
-                return placement
-        return None
+        return PlacementCore.get_fallback_placement(
+            PlacementUtils.__get_anchor(snapshot), primary_placement, fallback_placements,
+            (size.width(), size.height()), triangle_size,
+            PlacementUtils.__get_offsets(offsets), PlacementUtils.__get_screens(snapshot)
+        )
 
     @staticmethod
-    def __rect_contained_by_screen(rect: QRect) -> bool:
-        """Check if a rect is fully contained by a single screen
+    def get_sliding_placement(widget: QWidget, placement: TooltipPlacement,
+                              fallback_placements: list[TooltipPlacement], size: QSize, triangle_size: int,
+                              offsets: dict[TooltipPlacement, QPoint] | list[tuple[int, int]], margin: int,
+                              snapshot: PlacementSnapshot = None) -> tuple[TooltipPlacement, int, Rect] | None:
+        """Calculate the first placement of a tooltip that fits on the
+        screen once its body is slid along the edge of the widget
 
-        :param rect: rect that should be checked
-        :return: whether the rect is contained by a screen
+        :param widget: widget of the tooltip
+        :param placement: placement of the tooltip (AUTO to consider all placements)
+        :param fallback_placements: fallback placements that are available
+        :param size: size of the tooltip
+        :param triangle_size: size of the triangle
+        :param offsets: offsets of the tooltip (QPoints by placement or tuples indexed by placement)
+        :param margin: distance the triangle keeps to the corners of the body
+        :param snapshot: geometry of the widget and screens (captured if None)
+        :return: placement, slide, and global rect of the tooltip (None if no placement fits)
         """
 
-        for screen in QApplication.screens():
-            if screen.geometry().contains(rect):
-                return True
-        return False
+        if snapshot is None:
+            snapshot = PlacementSnapshot.capture(widget)
+
+        anchor = PlacementUtils.__get_anchor(snapshot)
+        screens = PlacementUtils.__get_screens(snapshot)
+        size = (size.width(), size.height())
+        offsets = PlacementUtils.__get_offsets(offsets)
+
+        candidates = PlacementCore.get_candidate_placements(
+            anchor, PlacementUtils.__get_bounds(snapshot), size, triangle_size,
+            offsets, screens, placement, fallback_placements
+        )
+        return PlacementCore.get_sliding_placement(
+            anchor, candidates, size, triangle_size, offsets, screens, margin
+        )
 
     @staticmethod
-    def __get_tooltip_rect(widget: QWidget, placement: TooltipPlacement, size: QSize,
-                           triangle_size: int, offsets: dict[TooltipPlacement, QPoint]) -> QRect:
-        """Get the rect of a tooltip based on the widget position,
-        placement, size, triangle size, and offsets of the tooltip
+    def get_least_overlapping_placement(widget: QWidget, placement: TooltipPlacement,
+                                        fallback_placements: list[TooltipPlacement], size: QSize,
+                                        triangle_size: int,
+                                        offsets: dict[TooltipPlacement, QPoint] | list[tuple[int, int]],
+                                        margin: int, key: object, snapshot: PlacementSnapshot = None) \
+            -> tuple[TooltipPlacement, int, Rect]:
+        """Calculate the placement and slide of a tooltip that fits on the screen
+        and overlaps the least with the other visible tooltips of the collision index
 
         :param widget: widget of the tooltip
-        :param placement: placement of the tooltip
+        :param placement: placement of the tooltip (AUTO to consider all placements)
+        :param fallback_placements: fallback placements that are available
         :param size: size of the tooltip
         :param triangle_size: size of the triangle
-        :param offsets: offsets of the tooltip
-        :return: rect of the tooltip
+        :param offsets: offsets of the tooltip (QPoints by placement or tuples indexed by placement)
+        :param margin: distance the triangle keeps to the corners of the body
+        :param key: key of the tooltip in the collision index
+        :param snapshot: geometry of the widget and screens (captured if None)
+        :return: placement, slide, and global rect of the tooltip
+        """
+
+        if snapshot is None:
+            snapshot = PlacementSnapshot.capture(widget)
+
+        anchor = PlacementUtils.__get_anchor(snapshot)
+        screens = PlacementUtils.__get_screens(snapshot)
+        size = (size.width(), size.height())
+        offsets = PlacementUtils.__get_offsets(offsets)
+
+        candidates = PlacementCore.get_candidate_placements(
+            anchor, PlacementUtils.__get_bounds(snapshot), size, triangle_size,
+            offsets, screens, placement, fallback_placements
+        )
+        return PlacementCore.get_least_overlapping_placement(
+            anchor, candidates, size, triangle_size, offsets, screens, margin,
+            lambda rect: CollisionIndex.get_overlap(rect, key)
+        )
+
+    @staticmethod
+    def __get_anchor(snapshot: PlacementSnapshot) -> Rect:
+        """Get the global rect of the widget of a snapshot
+
+        :param snapshot: geometry of the widget and screens
+        :return: anchor rect
+        """
+
+        return Rect(
+            snapshot.widget_pos.x(), snapshot.widget_pos.y(),
+            snapshot.widget_size.width(), snapshot.widget_size.height()
+        )
+
+    @staticmethod
+    def __get_bounds(snapshot: PlacementSnapshot) -> Rect:
+        """Get the global rect of the top level parent of a snapshot
+        (from its position to the bottom right corner of its geometry)
+
+        :param snapshot: geometry of the widget and screens
+        :return: bounds rect
+        """
+
+        x = snapshot.top_level_pos.x()
+        y = snapshot.top_level_pos.y()
+        return Rect(
+            x, y,
+            snapshot.top_level_geometry.right() - x + 1,
+            snapshot.top_level_geometry.bottom() - y + 1
+        )
+
+    @staticmethod
+    def __get_screens(snapshot: PlacementSnapshot) -> list[Rect]:
+        """Get the screen geometries of a snapshot
+
+        :param snapshot: geometry of the widget and screens
+        :return: screen rects
+        """
+
+        return [
+            Rect(geometry.x(), geometry.y(), geometry.width(), geometry.height())
+            for geometry in snapshot.screen_geometries
+        ]
+
+    @staticmethod
+    def __get_offsets(offsets: dict[TooltipPlacement, QPoint] | list[tuple[int, int]]) -> list[tuple[int, int]]:
+        """Get the offsets of the placements as tuples indexed by placement
+
+        :param offsets: offsets of the tooltip (QPoints by placement or tuples indexed by placement)
+        :return: offsets indexed by placement
         """
 
-        top_level_parent = Utils.get_top_level_parent(widget)
-        widget_pos = top_level_parent.mapToGlobal(widget.pos())
-        rect = QRect()
-
-        # Calculate rect depending on placement
-        if placement == TooltipPlacement.TOP:
-            rect.setX(int(widget_pos.x() + widget.width() / 2 - size.width() / 2) + offsets[placement].x())
-            rect.setY(widget_pos.y() - size.height() - triangle_size + offsets[placement].y())
-            rect.setRight(rect.x() + size.width())
-            rect.setBottom(rect.y() + size.height() + triangle_size)
-        elif placement == TooltipPlacement.BOTTOM:
-            rect.setX(int(widget_pos.x() + widget.width() / 2 - size.width() / 2) + offsets[placement].x())
-            rect.setY(widget_pos.y() + widget.height() + offsets[placement].y())
-            rect.setRight(rect.x() + size.width())
-            rect.setBottom(rect.y() + size.height() + triangle_size)
-        elif placement == TooltipPlacement.LEFT:
-            rect.setX(widget_pos.x() - size.width() - triangle_size + offsets[placement].x())
-            rect.setY(int(widget_pos.y() + widget.height() / 2 - size.width() / 2) + offsets[placement].y())
-            rect.setRight(rect.x() + size.width() + triangle_size)
-            rect.setBottom(rect.y() + size.height())
-        elif placement == TooltipPlacement.RIGHT:
-            rect.setX(widget_pos.x() + widget.width() + offsets[placement].x())
-            rect.setY(int(widget_pos.y() + widget.height() / 2 - size.width() / 2) + offsets[placement].y())
-            rect.setRight(rect.x() + size.width() + triangle_size)
-            rect.setBottom(rect.y() + size.height())
-
-        return rect
+        if not isinstance(offsets, dict):
+            return offsets
+
+        indexed_offsets = [(0, 0)] * len(TooltipPlacement)
+        for placement, offset in offsets.items():
+            indexed_offsets[placement] = (offset.x(), offset.y())
+        return indexed_offsets
@@ -0,0 +1,109 @@
+from qtpy.QtCore import QRect
+from qtpy.QtGui import QGuiApplication, QScreen
+
+
+class ScreenGeometryCache:
+
+    # Geometries of all screens, rebuilt lazily after a screen changed
+    __geometries = None
+    __available_geometries = None
+    __available_geometry_used = False
+    __connected = False
+
+    # Statistics
+    __refreshes = 0
+
+    @staticmethod
+    def get_geometries() -> list[QRect]:
+        """Get the geometries of all screens. If available geometry is used,
+        the areas reserved for taskbars, docks, and panels are excluded.
+
+        :return: screen geometries
+        """
+
+        if ScreenGeometryCache.__geometries is None:
+            ScreenGeometryCache.__refresh()
+
+        if ScreenGeometryCache.__available_geometry_used:
+            return ScreenGeometryCache.__available_geometries
+        return ScreenGeometryCache.__geometries
+
+    @staticmethod
+    def clear():
+        """Clear the cached geometries, so they are rebuilt when they are needed next"""
+
+        ScreenGeometryCache.__geometries = None
+        ScreenGeometryCache.__available_geometries = None
+
+    @staticmethod
+    def is_available_geometry_used() -> bool:
+        """Get whether the available geometry of the screens is used
+
+        :return: whether available geometry is used
+        """
+
+        return ScreenGeometryCache.__available_geometry_used
+
+    @staticmethod
+    def set_available_geometry_used(used: bool):
+        """Set whether the available geometry of the screens should be used,
+        so tooltips are not placed under taskbars, docks, and panels
+
+        :param used: whether available geometry should be used
+        """
+
+        ScreenGeometryCache.__available_geometry_used = used
+
+    @staticmethod
+    def get_stats() -> dict[str, int]:
+        """Get the statistics of the cache
+
+        :return: number of refreshes
+        """
+
+        return {
+            'refreshes': ScreenGeometryCache.__refreshes
+        }
+
+    @staticmethod
+    def reset_stats():
+        """Reset the statistics of the cache"""
+
+        ScreenGeometryCache.__refreshes = 0
+
+    @staticmethod
+    def __refresh():
+        """Capture the geometries of all screens"""
+
+        ScreenGeometryCache.__connect_invalidation_signals()
+        ScreenGeometryCache.__refreshes += 1
+
+        screens = QGuiApplication.screens()
+        ScreenGeometryCache.__geometries = [QRect(screen.geometry()) for screen in screens]
+        ScreenGeometryCache.__available_geometries = [QRect(screen.availableGeometry()) for screen in screens]
+
+    @staticmethod
+    def __connect_invalidation_signals():
+        """Clear the cache whenever a screen is added, removed, or changes its geometry"""
+
+        app = QGuiApplication.instance()
+        if ScreenGeometryCache.__connected or app is None:
+            return
+        ScreenGeometryCache.__connected = True
+
+        app.screenAdded.connect(ScreenGeometryCache.__connect_screen)
+        app.screenAdded.connect(ScreenGeometryCache.clear)
+        app.screenRemoved.connect(ScreenGeometryCache.clear)
+
+        for screen in app.screens():
+            ScreenGeometryCache.__connect_screen(screen)
+
+    @staticmethod
+    def __connect_screen(screen: QScreen):
+        """Clear the cache whenever the geometry of a screen changes
+
+        :param screen: screen to watch
+        """
+
+        screen.geometryChanged.connect(ScreenGeometryCache.clear)
+        screen.availableGeometryChanged.connect(ScreenGeometryCache.clear)
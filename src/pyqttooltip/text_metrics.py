@@ -0,0 +1,180 @@
+from collections import OrderedDict
+from typing import Callable
+from qtpy.QtCore import QMargins
+from qtpy.QtGui import QGuiApplication, QFont, QScreen
+from .enums import TooltipRenderer
+
+
+class TextMetricsCache:
+
+    # Measured sizes by (font key, text, maximum width, margins, renderer, screen DPI and pixel ratio)
+    __entries = OrderedDict()
+    __capacity = 1024
+    __connected = False
+
+    # Statistics
+    __hits = 0
+    __misses = 0
+
+    @staticmethod
+    def create_key(font: QFont, text: str, maximum_width: int, margins: QMargins,
+                   renderer: TooltipRenderer = TooltipRenderer.WIDGETS, screen: QScreen = None) -> tuple:
+        """Create the key of a measurement
+
+        :param font: font of the text
+        :param text: text that is measured
+        :param maximum_width: maximum width of the tooltip
+        :param margins: margins of the text
+        :param renderer: renderer the text is measured with
+        :param screen: screen the text is measured on (default: primary screen)
+        :return: key
+        """
+
+        # Same font can have different metrics on screens with a different DPI or pixel ratio
+        if screen is None:
+            screen = QGuiApplication.primaryScreen()
+        if screen is not None:
+            screen_key = (screen.devicePixelRatio(), screen.logicalDotsPerInch())
+        else:
+            screen_key = None
+
+        return (
+            font.key(), text, maximum_width,
+            margins.left(), margins.top(), margins.right(), margins.bottom(), renderer, screen_key
+        )
+
+    @staticmethod
+    def get(key: tuple) -> tuple | None:
+        """Get a measurement and mark it as recently used
+
+        :param key: key of the measurement
+        :return: text size, body size, and whether the text is wrapped (None if not cached)
+        """
+
+        TextMetricsCache.__connect_invalidation_signals()
+        entry = TextMetricsCache.__entries.get(key)
+
+        if entry is None:
+            TextMetricsCache.__misses += 1
+            return None
+
+        TextMetricsCache.__hits += 1
+        TextMetricsCache.__entries.move_to_end(key)
+        return entry
+
+    @staticmethod
+    def put(key: tuple, text_size: tuple[int, int], body_size: tuple[int, int], wrapped: bool):
+        """Store a measurement and evict the least recently used ones if full
+
+        :param key: key of the measurement
+        :param text_size: width and height of the text
+        :param body_size: width and height of the body
+        :param wrapped: whether the text is wrapped
+        """
+
+        TextMetricsCache.__entries[key] = (text_size, body_size, wrapped)
+        TextMetricsCache.__entries.move_to_end(key)
+
+        while len(TextMetricsCache.__entries) > TextMetricsCache.__capacity:
+            TextMetricsCache.__entries.popitem(last=False)
+
+    @staticmethod
+    def clear():
+        """Remove all the measurements"""
+
+        TextMetricsCache.__entries.clear()
+
+    @staticmethod
+    def get_capacity() -> int:
+        """Get the maximum number of measurements
+
+        :return: capacity
+        """
+
+        return TextMetricsCache.__capacity
+
+    @staticmethod
+    def set_capacity(capacity: int):
+        """Set the maximum number of measurements
+
+        :param capacity: new capacity
+        """
+
+        TextMetricsCache.__capacity = capacity
+
+        while len(TextMetricsCache.__entries) > capacity:
+            TextMetricsCache.__entries.popitem(last=False)
+
+    @staticmethod
+    def get_stats() -> dict[str, int]:
+        """Get the statistics of the cache
+
+        :return: number of hits, misses, and cached measurements
+        """
+
+        return {
+            'hits': TextMetricsCache.__hits,
+            'misses': TextMetricsCache.__misses,
+            'size': len(TextMetricsCache.__entries)
+        }
+
+    @staticmethod
+    def reset_stats():
+        """Reset the statistics of the cache"""
+
+        TextMetricsCache.__hits = 0
+        TextMetricsCache.__misses = 0
+
+    @staticmethod
+    def __connect_invalidation_signals():
+        """Clear the cache whenever fonts or the DPI of a screen change"""
+
+        app = QGuiApplication.instance()
+        if TextMetricsCache.__connected or app is None:
+            return
+        TextMetricsCache.__connected = True
+
+        app.fontDatabaseChanged.connect(TextMetricsCache.clear)
+        app.screenAdded.connect(TextMetricsCache.__connect_screen)
+        app.screenAdded.connect(TextMetricsCache.clear)
+        app.screenRemoved.connect(TextMetricsCache.clear)
+
+        for screen in app.screens():
+            TextMetricsCache.__connect_screen(screen)
+
+    @staticmethod
+    def __connect_screen(screen):
+        """Clear the cache whenever the DPI of a screen changes
+
+        :param screen: screen to watch
+        """
+
+        screen.logicalDotsPerInchChanged.connect(TextMetricsCache.clear)
+        screen.physicalDotsPerInchChanged.connect(TextMetricsCache.clear)
+
+
+class TextMetrics:
+
+    @staticmethod
+    def get_minimal_wrap_width(height_for_width: Callable[[int], int], width: int) -> int:
+        """Get the minimal width at which wrapped text still has the same height
+        as at the given width. Since the height never decreases when the width
+        gets smaller, a binary search needs a logarithmic number of probes.
+
+        :param height_for_width: function that calculates the height of the text for a width
+        :param width: width the text is wrapped at
+        :return: minimal width
+        """
+
+        height = height_for_width(width)
+
+        # Invariant: the height at the upper bound matches, the height at the lower bound doesn't
+        lower = 0
+        upper = width
+        while upper - lower > 1:
+            middle = (lower + upper) // 2
+            if height_for_width(middle) == height:
+                upper = middle
+            else:
+                lower = middle
+        return upper
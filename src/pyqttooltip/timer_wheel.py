@@ -0,0 +1,119 @@
+import math
+import time
+from typing import Callable
+from qtpy.QtCore import QTimer
+from .utils import Utils
+from .constants import *
+
+
+class TimerWheel:
+
+    # Hashed timing wheel, each slot maps keys to [callback, remaining rotations]
+    __slots = [{} for _ in range(TIMER_WHEEL_SIZE)]
+    __slot_indices = {}
+    __current_tick = 0
+    __start_time = 0.0
+    __timer = None
+
+    @staticmethod
+    def schedule(key: object, delay: int, callback: Callable[[], None]):
+        """Schedule a callback that is called once after a delay. A callback
+        that is already scheduled with the same key is rescheduled.
+
+        :param key: key of the callback
+        :param delay: delay in milliseconds
+        :param callback: callback to call
+        """
+
+        TimerWheel.cancel(key)
+
+        if Utils.is_deleted(TimerWheel.__timer):
+            TimerWheel.__timer = QTimer()
+            TimerWheel.__timer.setInterval(TIMER_WHEEL_RESOLUTION)
+            TimerWheel.__timer.timeout.connect(TimerWheel.__advance)
+
+        if not TimerWheel.__timer.isActive():
+            # Wheel is idle, so it starts turning from the current time
+            TimerWheel.__current_tick = 0
+            TimerWheel.__start_time = time.monotonic()
+
+        # Deadlines are rounded up to the next tick
+        ticks = max(1, math.ceil(delay / TIMER_WHEEL_RESOLUTION))
+        deadline = TimerWheel.__get_elapsed_ticks() + ticks
+        rotations = (deadline - TimerWheel.__current_tick - 1) // TIMER_WHEEL_SIZE
+        slot_index = deadline % TIMER_WHEEL_SIZE
+
+        TimerWheel.__slots[slot_index][key] = [callback, rotations]
+        TimerWheel.__slot_indices[key] = slot_index
+
+        if not TimerWheel.__timer.isActive():
+            TimerWheel.__timer.start()
+
+    @staticmethod
+    def cancel(key: object):
+        """Cancel a scheduled callback
+
+        :param key: key of the callback
+        """
+
+        slot_index = TimerWheel.__slot_indices.pop(key, None)
+        if slot_index is not None:
+            del TimerWheel.__slots[slot_index][key]
+
+    @staticmethod
+    def is_pending(key: object) -> bool:
+        """Get whether a callback is scheduled
+
+        :param key: key of the callback
+        :return: whether the callback is scheduled
+        """
+
+        return key in TimerWheel.__slot_indices
+
+    @staticmethod
+    def get_pending_count() -> int:
+        """Get the number of scheduled callbacks
+
+        :return: number of pending deadlines
+        """
+
+        return len(TimerWheel.__slot_indices)
+
+    @staticmethod
+    def __get_elapsed_ticks() -> int:
+        """Get the number of ticks since the wheel started turning
+
+        :return: elapsed ticks
+        """
+
+        elapsed = (time.monotonic() - TimerWheel.__start_time) * 1000
+        return int(elapsed // TIMER_WHEEL_RESOLUTION)
+
+    @staticmethod
+    def __advance():
+        """Advance the wheel to the current time and call the expired callbacks"""
+
+        # Timer events can be late, so all the ticks since the last event are processed
+        elapsed_ticks = TimerWheel.__get_elapsed_ticks()
+
+        while TimerWheel.__current_tick < elapsed_ticks and TimerWheel.__slot_indices:
+            TimerWheel.__current_tick += 1
+            slot = TimerWheel.__slots[TimerWheel.__current_tick % TIMER_WHEEL_SIZE]
+            expired = []
+
+            for key, entry in slot.items():
+                if entry[1] == 0:
+                    expired.append((key, entry))
+                else:
+                    entry[1] -= 1
+
+            for key, entry in expired:
+                # Callbacks can cancel or reschedule the other expired callbacks
+                if slot.get(key) is not entry:
+                    continue
+                del slot[key]
+                del TimerWheel.__slot_indices[key]
+                entry[0]()
+
+        if not TimerWheel.__slot_indices:
+            TimerWheel.__timer.stop()
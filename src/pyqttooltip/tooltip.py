@@ -1,25 +1,83 @@
 import math
+from contextlib import contextmanager
+from functools import partial
+from typing import Callable
+from weakref import WeakSet
 from qtpy.QtWidgets import QWidget, QLabel, QGraphicsOpacityEffect
 from qtpy.QtCore import (
-    Qt, Signal, QMargins, QPoint, QSize, QTimer,
-    QPropertyAnimation, QEasingCurve, QEvent, QObject
+    Qt, Signal, QMargins, QPoint, QSize,
+    QEasingCurve, QEvent, QObject, QRect
 )
-from qtpy.QtGui import QColor, QFont
+from qtpy.QtGui import QColor, QFont, QPainter, QPixmap, QRegion
 from .tooltip_interface import TooltipInterface
 from .tooltip_triangle import TooltipTriangle
-from .enums import TooltipPlacement
+from .tooltip_canvas import TooltipCanvas
+from .enums import TooltipPlacement, TooltipRenderer, TooltipFadeMode, LayoutFlag
 from .drop_shadow import DropShadow
 from .placement_utils import PlacementUtils
+from .placement_snapshot import PlacementSnapshot
+from .layout_scheduler import LayoutScheduler
+from .timer_wheel import TimerWheel
+from .animation_clock import AnimationClock, Fade
+from .idle_queue import IdleQueue
+from .event_router import EventRouter
+from .collision_index import CollisionIndex
+from .tooltip_style import TooltipStyle
+from .text_metrics import TextMetricsCache, TextMetrics
 from .utils import Utils
 from .constants import *
 
 
+# Placements that have an offset (the offsets are stored as (x, y) tuples indexed by placement)
+OFFSET_PLACEMENTS = [TooltipPlacement.LEFT, TooltipPlacement.RIGHT, TooltipPlacement.TOP, TooltipPlacement.BOTTOM]
+
+
 class Tooltip(TooltipInterface):
 
     # Signals
     shown = Signal()
     hidden = Signal()
 
+    # Properties that can be set with configure() and the getters of their current values
+    PROPERTIES = {
+        'duration': 'getDuration',
+        'placement': 'getPlacement',
+        'fallbackPlacements': 'getFallbackPlacements',
+        'triangleEnabled': 'isTriangleEnabled',
+        'triangleSize': 'getTriangleSize',
+        'offsets': 'getOffsets',
+        'showDelay': 'getShowDelay',
+        'hideDelay': 'getHideDelay',
+        'fadeInDuration': 'getFadeInDuration',
+        'fadeOutDuration': 'getFadeOutDuration',
+        'fadeInEasingCurve': 'getFadeInEasingCurve',
+        'fadeOutEasingCurve': 'getFadeOutEasingCurve',
+        'textCenteringEnabled': 'isTextCenteringEnabled',
+        'borderRadius': 'getBorderRadius',
+        'borderEnabled': 'isBorderEnabled',
+        'backgroundColor': 'getBackgroundColor',
+        'textColor': 'getTextColor',
+        'borderColor': 'getBorderColor',
+        'opacity': 'getOpacity',
+        'font': 'getFont',
+        'margins': 'getMargins',
+        'dropShadowEnabled': 'isDropShadowEnabled',
+        'dropShadowStrength': 'getDropShadowStrength',
+        'showingOnDisabled': 'isShowingOnDisabled',
+        'maximumWidth': 'maximumWidth',
+        'renderer': 'getRenderer',
+        'collisionAvoidanceEnabled': 'isCollisionAvoidanceEnabled',
+        'edgeSlidingEnabled': 'isEdgeSlidingEnabled',
+        'tooltipStyle': 'getTooltipStyle'
+    }
+
+    # Fade mode of all the tooltips that don't set their own
+    __default_fade_mode = TooltipFadeMode.AUTO
+
+    # Style of all the tooltips that don't set their own and the tooltips it is propagated to
+    __default_tooltip_style = TooltipStyle()
+    __instances = WeakSet()
+
     def __init__(self, widget: QWidget = None, text: str = ''):
         """Create a new Tooltip instance
 
@@ -37,34 +95,42 @@ class Tooltip(TooltipInterface):
         self.__fallback_placements = []
         self.__triangle_enabled = True
         self.__triangle_size = 5
-        self.__offsets = {
-            TooltipPlacement.LEFT:   QPoint(0, 0),
-            TooltipPlacement.RIGHT:  QPoint(0, 0),
-            TooltipPlacement.TOP:    QPoint(0, 0),
-            TooltipPlacement.BOTTOM: QPoint(0, 0)
-        }
+        self.__offsets = [(0, 0)] * len(TooltipPlacement)
         self.__show_delay = 50
         self.__hide_delay = 50
         self.__fade_in_duration = 150
         self.__fade_out_duration = 150
         self.__fade_in_easing_curve = QEasingCurve.Type.Linear
         self.__fade_out_easing_curve = QEasingCurve.Type.Linear
-        self.__text_centering_enabled = True
-        self.__border_radius = 2
-        self.__border_enabled = False
-        self.__background_color = QColor('#111214')
-        self.__text_color = QColor('#CFD2D5')
-        self.__border_color = QColor('#403E41')
-        self.__font = QFont('Arial', 9, QFont.Weight.Bold)
-        self.__margins = QMargins(12, 8, 12, 7)
-        self.__drop_shadow_enabled = True
-        self.__drop_shadow_strength = 2.0
+        self.__tooltip_style = None
+        self.__style_overrides = {}
         self.__showing_on_disabled = False
         self.__maximum_width = QWIDGETSIZE_MAX
+        self.__renderer = TooltipRenderer.WIDGETS
+        self.__fade_mode = None
+        self.__opacity = 1.0
+        self.__collision_avoidance_enabled = False
+        self.__edge_sliding_enabled = False
 
         self.__actual_placement = None
+        self.__actual_tooltip_style = Tooltip.__default_tooltip_style
+        self.__slide = 0
+        self.__placed_rect = None
+        self.__actual_fade_mode = None
         self.__current_opacity = 0.0
-        self.__watched_widgets = []
+
+        # Snapshot of the tooltip that is painted while fading with TooltipFadeMode.SNAPSHOT
+        self.__snapshot = None
+        self.__snapshot_opacity = None
+
+        # Layout state (only the parts marked as dirty are recalculated)
+        self.__dirty = LayoutFlag.ALL
+        self.__batch_depth = 0
+        self.__geometry_stamp = None
+        self.__text_bounds = QSize()
+        self.__text_size = QSize()
+        self.__body_size = QSize()
+        self.__text_wrapped = False
 
         # Widget settings
         self.setWindowFlags(
@@ -75,57 +141,50 @@ class Tooltip(TooltipInterface):
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
 
-        # Opacity effect for fading animations
-        self.__opacity_effect = QGraphicsOpacityEffect()
-        self.setGraphicsEffect(self.__opacity_effect)
-
-        # Create widgets
-        self.__drop_shadow_widget = DropShadow(self)
-        self.__tooltip_body = QLabel(self)
-        self.__triangle_widget = TooltipTriangle(self)
-
-        self.__text_widget = QLabel(self.__tooltip_body)
-        self.__text_widget.setText(text)
-        self.__text_widget.setFont(self.__font)
-        self.__text_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        # Init delay timers
-        self.__show_delay_timer = QTimer(self)
-        self.__show_delay_timer.setInterval(self.__show_delay)
-        self.__show_delay_timer.setSingleShot(True)
-        self.__show_delay_timer.timeout.connect(self.__start_fade_in)
-
-        self.__hide_delay_timer = QTimer(self)
-        self.__hide_delay_timer.setInterval(self.__hide_delay)
-        self.__hide_delay_timer.setSingleShot(True)
-        self.__hide_delay_timer.timeout.connect(self.__start_fade_out)
-
-        # Init duration timer
-        self.__duration_timer = QTimer(self)
-        self.__duration_timer.setInterval(self.__duration)
-        self.__duration_timer.setSingleShot(True)
-        self.__duration_timer.timeout.connect(self.__start_fade_out)
-
-        # Init fade animations
-        self.__fade_in_animation = QPropertyAnimation(self.__opacity_effect, b'opacity')
-        self.__fade_in_animation.setDuration(self.__fade_in_duration)
-        self.__fade_in_animation.setEasingCurve(self.__fade_in_easing_curve)
-        self.__fade_in_animation.valueChanged.connect(self.__update_current_opacity)
-        self.__fade_in_animation.finished.connect(self.__start_duration_timer)
-
-        self.__fade_out_animation = QPropertyAnimation(self.__opacity_effect, b'opacity')
-        self.__fade_out_animation.setDuration(self.__fade_out_duration)
-        self.__fade_out_animation.setEasingCurve(self.__fade_out_easing_curve)
-        self.__fade_out_animation.valueChanged.connect(self.__update_current_opacity)
-        self.__fade_out_animation.finished.connect(self.__hide)
-
-        # Init stylesheet and event filters
-        self.__update_stylesheet()
+        # Opacity effect for fading animations (only used with TooltipFadeMode.EFFECT)
+        self.__opacity_effect = None
+        self.__update_fade_mode()
+
+        # Widgets depending on the renderer (created on the first layout pass)
+        self.__widgets_created = False
+        self.__drop_shadow_widget = None
+        self.__tooltip_body = None
+        self.__triangle_widget = None
+        self.__text_widget = None
+        self.__canvas = None
+
+        # Keys of the delay and duration timers in the shared timer wheel
+        self.__show_delay_timer = (id(self), 'show_delay')
+        self.__hide_delay_timer = (id(self), 'hide_delay')
+        self.__duration_timer = (id(self), 'duration')
+        self.__prewarm_task = (id(self), 'prewarm')
+
+        # Install event filters
         self.__install_event_filters()
+        Tooltip.__instances.add(self)
+
+        # Cancel scheduled work and stop receiving events once deleted (single connection)
+        self.destroyed.connect(partial(Tooltip.__release, id(self)))
+
+    @staticmethod
+    def __release(tooltip_id: int):
+        """Cancel everything that is scheduled or registered for a deleted tooltip
+
+        :param tooltip_id: id of the deleted tooltip
+        """
+
+        LayoutScheduler.cancel(tooltip_id)
+        AnimationClock.stop(tooltip_id)
+        for timer_name in ['show_delay', 'hide_delay', 'duration']:
+            TimerWheel.cancel((tooltip_id, timer_name))
+        EventRouter.instance().release(tooltip_id)
+        CollisionIndex.remove(tooltip_id)
+        IdleQueue.cancel((tooltip_id, 'prewarm'))
 
     def eventFilter(self, watched: QObject, event: QEvent) -> bool:
-        """Event filter that watched widget and all of its parents
-        and updates the tooltip or event filters when necessary
+        """Handle the events of the watched widget and all of its parents that
+        are dispatched by the event router and update the tooltip or the
+        watched widgets when necessary
 
         :param watched: object that is watched
         :param event: event that is received
@@ -145,11 +204,12 @@ class Tooltip(TooltipInterface):
         # Widget or parent moved, resized, shown or hidden
         if (event.type() == event.Type.Move or event.type() == event.Type.Resize
                 or event.type() == event.Type.Show or event.type() == event.Type.Hide):
-            self.__update_ui()
+            self.__invalidate(LayoutFlag.PLACEMENT)
 
         # One of the parents changed
         if event.type() == event.Type.ParentChange:
             self.__install_event_filters()
+            self.__invalidate(LayoutFlag.PLACEMENT)
 
         # Parent or widget deleted
         if event.type() == event.Type.DeferredDelete:
@@ -159,6 +219,53 @@ class Tooltip(TooltipInterface):
                 self.__widget = None
         return False
 
+    def showEvent(self, event: QEvent):
+        """Start receiving the geometry events of the watched widgets when shown
+
+        :param event: event that is received
+        """
+
+        EventRouter.instance().set_visible(self, True)
+        self.__update_collision_index()
+        super().showEvent(event)
+
+    def hideEvent(self, event: QEvent):
+        """Stop receiving the geometry events of the watched widgets when hidden
+
+        :param event: event that is received
+        """
+
+        EventRouter.instance().set_visible(self, False)
+        CollisionIndex.remove(id(self))
+        super().hideEvent(event)
+
+    def paintEvent(self, event: QEvent):
+        """Paint the snapshot of the tooltip while fading with TooltipFadeMode.SNAPSHOT
+
+        :param event: event that is received
+        """
+
+        if self.__snapshot_opacity is None:
+            return
+
+        if self.__snapshot is None:
+            self.__snapshot = self.__render_snapshot()
+
+        painter = QPainter()
+        painter.begin(self)
+        painter.setOpacity(self.__snapshot_opacity)
+        painter.drawPixmap(0, 0, self.__snapshot)
+        painter.end()
+
+    def resizeEvent(self, event: QEvent):
+        """Invalidate the snapshot when the tooltip is resized
+
+        :param event: event that is received
+        """
+
+        self.__snapshot = None
+        super().resizeEvent(event)
+
     def getWidget(self) -> QWidget:
         """Get the widget that triggers the tooltip
 
@@ -173,10 +280,11 @@ class Tooltip(TooltipInterface):
         :param widget: new widget
         """
 
-        if self.__current_opacity != 0:
+        if self.__get_current_opacity() != 0:
             super().hide()
         self.__widget = widget
         self.__install_event_filters()
+        self.__invalidate(LayoutFlag.PLACEMENT)
 
     def getText(self) -> str:
         """Get the text of the tooltip
@@ -193,8 +301,9 @@ class Tooltip(TooltipInterface):
         """
 
         self.__text = text
-        self.__text_widget.setText(text)
-        self.__update_ui()
+        if self.__text_widget is not None:
+            self.__text_widget.setText(text)
+        self.__invalidate(LayoutFlag.TEXT)
 
     def getDuration(self) -> int:
         """Get the duration of the tooltip. If the duration is 0,
@@ -213,7 +322,6 @@ class Tooltip(TooltipInterface):
         """
 
         self.__duration = duration
-        self.__duration_timer.setInterval(duration)
 
     def getPlacement(self) -> TooltipPlacement:
         """Get the placement of the tooltip
@@ -230,7 +338,7 @@ class Tooltip(TooltipInterface):
         """
 
         self.__placement = placement
-        self.__update_ui()
+        self.__invalidate(LayoutFlag.PLACEMENT)
 
     def getActualPlacement(self) -> TooltipPlacement:
         """Get the actual placement of the tooltip. This will be different
@@ -240,6 +348,7 @@ class Tooltip(TooltipInterface):
         :return: actual placement (LEFT / RIGHT / TOP / BOTTOM)
         """
 
+        self.__update_ui()
         return self.__actual_placement
 
     def getFallbackPlacements(self) -> list[TooltipPlacement]:
@@ -261,7 +370,7 @@ class Tooltip(TooltipInterface):
         """
 
         self.__fallback_placements = fallback_placements
-        self.__update_ui()
+        self.__invalidate(LayoutFlag.PLACEMENT)
 
     def isTriangleEnabled(self) -> bool:
         """Get whether the triangle is enabled
@@ -278,7 +387,7 @@ class Tooltip(TooltipInterface):
         """
 
         self.__triangle_enabled = enabled
-        self.__update_ui()
+        self.__invalidate(LayoutFlag.PLACEMENT)
 
     def getTriangleSize(self) -> int:
         """Get the size of the triangle
@@ -295,7 +404,7 @@ class Tooltip(TooltipInterface):
         """
 
         self.__triangle_size = size
-        self.__update_ui()
+        self.__invalidate(LayoutFlag.PLACEMENT)
 
     def getOffsets(self) -> dict[TooltipPlacement, QPoint]:
         """Get the offsets of the tooltip
@@ -303,7 +412,7 @@ class Tooltip(TooltipInterface):
         :return: offsets
         """
 
-        return self.__offsets
+        return {placement: QPoint(*self.__offsets[placement]) for placement in OFFSET_PLACEMENTS}
 
     def getOffsetByPlacement(self, placement: TooltipPlacement) -> QPoint:
         """Get a specific offset of the tooltip
@@ -312,7 +421,7 @@ class Tooltip(TooltipInterface):
         :return: offset
         """
 
-        return self.__offsets[placement]
+        return QPoint(*self.__offsets[placement])
 
     def setOffsets(self, offsets: dict[TooltipPlacement, QPoint]):
         """Set the offsets of the tooltip individually
@@ -321,8 +430,8 @@ class Tooltip(TooltipInterface):
         """
 
         for placement, offset in offsets.items():
-            self.__offsets[placement] = offset
-        self.__update_ui()
+            self.__offsets[placement] = (offset.x(), offset.y())
+        self.__invalidate(LayoutFlag.PLACEMENT)
 
     def setOffsetByPlacement(self, placement: TooltipPlacement, offset: QPoint):
         """Set a specific offset of the tooltip
@@ -331,8 +440,8 @@ class Tooltip(TooltipInterface):
         :param offset: new offset
         """
 
-        self.__offsets[placement] = offset
-        self.__update_ui()
+        self.__offsets[placement] = (offset.x(), offset.y())
+        self.__invalidate(LayoutFlag.PLACEMENT)
 
     def setOffsetsAll(self, offset: QPoint):
         """Set the offsets of all the placements to a value
@@ -340,9 +449,9 @@ class Tooltip(TooltipInterface):
         :param offset: new offset for all the placements
         """
 
-        for placement, _ in self.__offsets.items():
-            self.__offsets[placement] = offset
-        self.__update_ui()
+        for placement in OFFSET_PLACEMENTS:
+            self.__offsets[placement] = (offset.x(), offset.y())
+        self.__invalidate(LayoutFlag.PLACEMENT)
 
     def getShowDelay(self) -> int:
         """Get the delay before the tooltip is starting to fade in
@@ -359,7 +468,6 @@ class Tooltip(TooltipInterface):
         """
 
         self.__show_delay = delay
-        self.__show_delay_timer.setInterval(delay)
 
     def getHideDelay(self) -> int:
         """Get the delay before the tooltip is starting to fade out
@@ -376,7 +484,6 @@ class Tooltip(TooltipInterface):
         """
 
         self.__hide_delay = delay
-        self.__hide_delay_timer.setInterval(delay)
 
     def getFadeInDuration(self) -> int:
         """Get the duration of the fade in animation
@@ -393,8 +500,6 @@ class Tooltip(TooltipInterface):
         """
 
         self.__fade_in_duration = duration
-        self.__fade_in_animation.setStartValue(self.__current_opacity)
-        self.__fade_in_animation.setDuration(duration)
 
     def getFadeOutDuration(self) -> int:
         """Get the duration of the fade out animation
@@ -411,8 +516,6 @@ class Tooltip(TooltipInterface):
         """
 
         self.__fade_out_duration = duration
-        self.__fade_out_animation.setStartValue(self.__current_opacity)
-        self.__fade_out_animation.setDuration(duration)
 
     def getFadeInEasingCurve(self) -> QEasingCurve.Type:
         """Get the easing curve of the fade in animation
@@ -432,7 +535,6 @@ class Tooltip(TooltipInterface):
             easing_curve = QEasingCurve.Type.Linear
 
         self.__fade_in_easing_curve = easing_curve
-        self.__fade_in_animation.setEasingCurve(easing_curve)
 
     def getFadeOutEasingCurve(self) -> QEasingCurve.Type:
         """Get the easing curve of the fade out animation
@@ -452,7 +554,6 @@ class Tooltip(TooltipInterface):
             easing_curve = QEasingCurve.Type.Linear
 
         self.__fade_out_easing_curve = easing_curve
-        self.__fade_out_animation.setEasingCurve(easing_curve)
 
     def isTextCenteringEnabled(self) -> bool:
         """Get whether text centering is enabled
@@ -460,7 +561,7 @@ class Tooltip(TooltipInterface):
         :return: whether text centering is enabled
         """
 
-        return self.__text_centering_enabled
+        return self.__actual_tooltip_style.isTextCenteringEnabled()
 
     def setTextCenteringEnabled(self, enabled: bool):
         """Set whether text centering should be enabled
@@ -468,12 +569,7 @@ class Tooltip(TooltipInterface):
         :param enabled: whether text centering should be enabled
         """
 
-        self.__text_centering_enabled = enabled
-        if enabled:
-            self.__text_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        else:
-            self.__text_widget.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        self.__update_ui()
+        self.__set_style_property('text_centering_enabled', enabled, LayoutFlag.STYLE | LayoutFlag.POSITION)
 
     def getBorderRadius(self) -> int:
         """Get the border radius of the tooltip
@@ -481,7 +577,7 @@ class Tooltip(TooltipInterface):
         :return: border radius
         """
 
-        return self.__border_radius
+        return self.__actual_tooltip_style.getBorderRadius()
 
     def setBorderRadius(self, border_radius: int):
         """Set the border radius of the tooltip
@@ -489,9 +585,7 @@ class Tooltip(TooltipInterface):
         :param border_radius: new border radius
         """
 
-        self.__border_radius = border_radius
-        self.__update_stylesheet()
-        self.__update_ui()
+        self.__set_style_property('border_radius', border_radius, LayoutFlag.STYLE | LayoutFlag.POSITION)
 
     def isBorderEnabled(self) -> bool:
         """Get whether the border is enabled
@@ -499,7 +593,7 @@ class Tooltip(TooltipInterface):
         :return: whether the border is enabled
         """
 
-        return self.__border_enabled
+        return self.__actual_tooltip_style.isBorderEnabled()
 
     def setBorderEnabled(self, enabled: bool):
         """Set whether the border should be enabled
@@ -507,9 +601,7 @@ class Tooltip(TooltipInterface):
         :param enabled: whether the border should be enabled
         """
 
-        self.__border_enabled = enabled
-        self.__update_stylesheet()
-        self.__update_ui()
+        self.__set_style_property('border_enabled', enabled, LayoutFlag.STYLE | LayoutFlag.PLACEMENT)
 
     def getBackgroundColor(self) -> QColor:
         """Get the background color of the tooltip
@@ -517,7 +609,7 @@ class Tooltip(TooltipInterface):
         :return: background color
         """
 
-        return self.__background_color
+        return self.__actual_tooltip_style.getBackgroundColor()
 
     def setBackgroundColor(self, color: QColor):
         """Set the background color of the tooltip
@@ -525,9 +617,7 @@ class Tooltip(TooltipInterface):
         :param color: new background color
         """
 
-        self.__background_color = color
-        self.__update_stylesheet()
-        self.__update_ui()
+        self.__set_style_property('background_color', QColor(color), LayoutFlag.STYLE | LayoutFlag.POSITION)
 
     def getTextColor(self) -> QColor:
         """Get the text color of the tooltip
@@ -535,7 +625,7 @@ class Tooltip(TooltipInterface):
         :return: text color
         """
 
-        return self.__text_color
+        return self.__actual_tooltip_style.getTextColor()
 
     def setTextColor(self, color: QColor):
         """Set the text color of the tooltip
@@ -543,9 +633,7 @@ class Tooltip(TooltipInterface):
         :param color: new text color
         """
 
-        self.__text_color = color
-        self.__update_stylesheet()
-        self.__update_ui()
+        self.__set_style_property('text_color', QColor(color), LayoutFlag.STYLE | LayoutFlag.POSITION)
 
     def getBorderColor(self) -> QColor:
         """Get the border color of the tooltip
@@ -553,7 +641,7 @@ class Tooltip(TooltipInterface):
         :return: border color
         """
 
-        return self.__border_color
+        return self.__actual_tooltip_style.getBorderColor()
 
     def setBorderColor(self, color: QColor):
         """Set the border color of the tooltip
@@ -561,9 +649,7 @@ class Tooltip(TooltipInterface):
         :param color: new border color
         """
 
-        self.__border_color = color
-        self.__update_stylesheet()
-        self.__update_ui()
+        self.__set_style_property('border_color', QColor(color), LayoutFlag.STYLE | LayoutFlag.POSITION)
 
     def getOpacity(self) -> float:
         """Get the opacity of the tooltip
@@ -571,7 +657,7 @@ class Tooltip(TooltipInterface):
         :return: opacity
         """
 
-        return self.windowOpacity()
+        return self.__opacity
 
     def setOpacity(self, opacity: float):
         """Set the opacity of the tooltip
@@ -579,7 +665,118 @@ class Tooltip(TooltipInterface):
         :param opacity: new opacity
         """
 
-        self.setWindowOpacity(opacity)
+        self.__opacity = opacity
+        if self.__actual_fade_mode == TooltipFadeMode.WINDOW:
+            self.__apply_window_opacity(self.__get_current_opacity())
+        else:
+            self.setWindowOpacity(opacity)
+
+    def getFadeMode(self) -> TooltipFadeMode:
+        """Get the fade mode of the tooltip. If no fade mode is set,
+        the default fade mode of all the tooltips is used.
+
+        :return: fade mode
+        """
+
+        if self.__fade_mode is None:
+            return Tooltip.getDefaultFadeMode()
+        return self.__fade_mode
+
+    def setFadeMode(self, fade_mode: TooltipFadeMode | None):
+        """Set the fade mode of the tooltip. TooltipFadeMode.EFFECT fades with an
+        opacity effect, TooltipFadeMode.WINDOW fades the opacity of the window,
+        TooltipFadeMode.SNAPSHOT fades a pixmap of the tooltip that is rendered
+        once, and TooltipFadeMode.AUTO picks the cheapest mode the platform supports.
+
+        :param fade_mode: new fade mode (or None to use the default fade mode)
+        """
+
+        self.__fade_mode = fade_mode
+
+        # Running fades switch to the new mode with the next fade
+        if not AnimationClock.is_running(id(self)):
+            self.__update_fade_mode()
+
+    def getActualFadeMode(self) -> TooltipFadeMode:
+        """Get the actual fade mode of the tooltip. This will be different
+        from the fade mode if the fade mode is TooltipFadeMode.AUTO.
+
+        :return: actual fade mode (EFFECT / WINDOW / SNAPSHOT)
+        """
+
+        return self.__actual_fade_mode
+
+    @staticmethod
+    def getDefaultFadeMode() -> TooltipFadeMode:
+        """Get the fade mode of all the tooltips that don't set their own
+
+        :return: default fade mode
+        """
+
+        return Tooltip.__default_fade_mode
+
+    @staticmethod
+    def setDefaultFadeMode(fade_mode: TooltipFadeMode):
+        """Set the fade mode of all the tooltips that don't set their own.
+        Tooltips switch to the new mode with their next fade.
+
+        :param fade_mode: new default fade mode
+        """
+
+        Tooltip.__default_fade_mode = fade_mode
+
+    def getTooltipStyle(self) -> TooltipStyle | None:
+        """Get the style the tooltip is based on. If no style is set,
+        the default style of all the tooltips is used.
+
+        :return: style (None if the default style is used)
+        """
+
+        return self.__tooltip_style
+
+    def setTooltipStyle(self, tooltip_style: TooltipStyle | None):
+        """Set the style the tooltip is based on. The style is shared instead of
+        copied and the style properties that were set individually are reset.
+
+        :param tooltip_style: new style (or None to use the default style)
+        """
+
+        self.__tooltip_style = tooltip_style
+        self.__style_overrides = {}
+        self.__update_actual_tooltip_style()
+
+    def getActualTooltipStyle(self) -> TooltipStyle:
+        """Get the actual style of the tooltip. This is the style (or default style)
+        with the style properties that were set individually applied.
+
+        :return: actual style
+        """
+
+        return self.__actual_tooltip_style
+
+    @staticmethod
+    def getDefaultTooltipStyle() -> TooltipStyle:
+        """Get the style of all the tooltips that don't set their own
+
+        :return: default style
+        """
+
+        return Tooltip.__default_tooltip_style
+
+    @staticmethod
+    def setDefaultTooltipStyle(tooltip_style: TooltipStyle):
+        """Set the style of all the tooltips that don't set their own (e.g. to
+        change the theme of the application). The tooltips only update their
+        style and layout when they are shown the next time.
+
+        :param tooltip_style: new default style
+        """
+
+        Tooltip.__default_tooltip_style = tooltip_style
+
+        for tooltip in list(Tooltip.__instances):
+            if tooltip.__tooltip_style is None and not Utils.is_deleted(tooltip):
+                tooltip.__update_actual_tooltip_style()
 
     def font(self) -> QFont:
         """Get the font of the tooltip
@@ -595,7 +792,7 @@ class Tooltip(TooltipInterface):
         :return: font
         """
 
-        return self.__font
+        return self.__actual_tooltip_style.getFont()
 
     def setFont(self, font: QFont):
         """Set the font of the tooltip
@@ -603,9 +800,7 @@ class Tooltip(TooltipInterface):
         :param font: new font
         """
 
-        self.__font = font
-        self.__text_widget.setFont(font)
-        self.__update_ui()
+        self.__set_style_property('font', QFont(font), LayoutFlag.STYLE | LayoutFlag.TEXT)
 
     def getMargins(self) -> QMargins:
         """Get the margins of the tooltip
@@ -613,7 +808,7 @@ class Tooltip(TooltipInterface):
         :return: margins
         """
 
-        return self.__margins
+        return self.__actual_tooltip_style.getMargins()
 
     def setMargins(self, margins: QMargins):
         """Get the margins of the tooltip
@@ -621,8 +816,7 @@ class Tooltip(TooltipInterface):
         :param margins: new margins
         """
 
-        self.__margins = margins
-        self.__update_ui()
+        self.__set_style_property('margins', QMargins(margins), LayoutFlag.SIZE)
 
     def setMarginLeft(self, margin: int):
         """Set the left margin of the tooltip
@@ -630,8 +824,10 @@ class Tooltip(TooltipInterface):
         :param margin: new margin
         """
 
-        self.__margins.setLeft(margin)
-        self.__update_ui()
+        # Margins of the style are shared and changed on a copy
+        margins = self.getMargins()
+        margins.setLeft(margin)
+        self.__set_style_property('margins', margins, LayoutFlag.SIZE)
 
     def setMarginTop(self, margin: int):
         """Set the top margin of the tooltip
@@ -639,8 +835,10 @@ class Tooltip(TooltipInterface):
         :param margin: new margin
         """
 
-        self.__margins.setTop(margin)
-        self.__update_ui()
+        # Margins of the style are shared and changed on a copy
+        margins = self.getMargins()
+        margins.setTop(margin)
+        self.__set_style_property('margins', margins, LayoutFlag.SIZE)
 
     def setMarginRight(self, margin: int):
         """Set the right margin of the tooltip
@@ -648,8 +846,10 @@ class Tooltip(TooltipInterface):
         :param margin: new margin
         """
 
-        self.__margins.setRight(margin)
-        self.__update_ui()
+        # Margins of the style are shared and changed on a copy
+        margins = self.getMargins()
+        margins.setRight(margin)
+        self.__set_style_property('margins', margins, LayoutFlag.SIZE)
 
     def setMarginBottom(self, margin: int):
         """Set the bottom margin of the tooltip
@@ -657,8 +857,10 @@ class Tooltip(TooltipInterface):
         :param margin: new margin
         """
 
-        self.__margins.setBottom(margin)
-        self.__update_ui()
+        # Margins of the style are shared and changed on a copy
+        margins = self.getMargins()
+        margins.setBottom(margin)
+        self.__set_style_property('margins', margins, LayoutFlag.SIZE)
 
     def isDropShadowEnabled(self) -> bool:
         """Get whether the drop shadow is enabled
@@ -666,7 +868,7 @@ class Tooltip(TooltipInterface):
         :return: whether the drop shadow is enabled
         """
 
-        return self.__drop_shadow_enabled
+        return self.__actual_tooltip_style.isDropShadowEnabled()
 
     def setDropShadowEnabled(self, enabled: bool):
         """Set whether the drop shadow should be enabled
@@ -674,8 +876,7 @@ class Tooltip(TooltipInterface):
         :param enabled: whether the drop shadow should be enabled
         """
 
-        self.__drop_shadow_enabled = enabled
-        self.__update_ui()
+        self.__set_style_property('drop_shadow_enabled', enabled, LayoutFlag.POSITION)
 
     def getDropShadowStrength(self) -> float:
         """Get the strength of the drop shadow
@@ -683,7 +884,7 @@ class Tooltip(TooltipInterface):
         :return: strength
         """
 
-        return self.__drop_shadow_strength
+        return self.__actual_tooltip_style.getDropShadowStrength()
 
     def setDropShadowStrength(self, strength: float):
         """Set the strength of the drop shadow
@@ -691,8 +892,7 @@ class Tooltip(TooltipInterface):
         :param strength: new strength
         """
 
-        self.__drop_shadow_strength = strength
-        self.__drop_shadow_widget.update()
+        self.__set_style_property('drop_shadow_strength', strength, LayoutFlag.STYLE)
 
     def isShowingOnDisabled(self) -> bool:
         """Get whether the tooltip will also be shown on disabled widgets
@@ -726,7 +926,7 @@ class Tooltip(TooltipInterface):
 
         self.__maximum_width = max_size.width()
         self.setMaximumHeight(max_size.height())
-        self.__update_ui()
+        self.__invalidate(LayoutFlag.SIZE)
 
     def maximumWidth(self) -> int:
         """Get the maximum width of the tooltip
@@ -743,7 +943,72 @@ class Tooltip(TooltipInterface):
         """
 
         self.__maximum_width = max_width
-        self.__update_ui()
+        self.__invalidate(LayoutFlag.SIZE)
+
+    def getRenderer(self) -> TooltipRenderer:
+        """Get the renderer of the tooltip
+
+        :return: renderer
+        """
+
+        return self.__renderer
+
+    def setRenderer(self, renderer: TooltipRenderer):
+        """Set the renderer of the tooltip. TooltipRenderer.WIDGETS builds the tooltip
+        from styled child widgets, TooltipRenderer.PAINTER paints it in a single widget.
+
+        :param renderer: new renderer
+        """
+
+        if renderer == self.__renderer:
+            return
+
+        self.__renderer = renderer
+        if self.__widgets_created:
+            self.__delete_widgets()
+            self.__create_widgets()
+        self.__invalidate(LayoutFlag.ALL)
+
+    def isEdgeSlidingEnabled(self) -> bool:
+        """Get whether the body of the tooltip is slid along the widget to fit on the screen
+
+        :return: whether edge sliding is enabled
+        """
+
+        return self.__edge_sliding_enabled
+
+    def setEdgeSlidingEnabled(self, enabled: bool):
+        """Set whether the body of the tooltip should be slid along the widget (with the
+        triangle still pointing at the widget) if it doesn't fit on the screen otherwise.
+        The first placement that fits once slid is chosen before any other fallback.
+
+        :param enabled: whether edge sliding should be enabled
+        """
+
+        self.__edge_sliding_enabled = enabled
+        self.__invalidate(LayoutFlag.PLACEMENT)
+
+    def isCollisionAvoidanceEnabled(self) -> bool:
+        """Get whether the tooltip avoids overlapping other visible tooltips
+
+        :return: whether collision avoidance is enabled
+        """
+
+        return self.__collision_avoidance_enabled
+
+    def setCollisionAvoidanceEnabled(self, enabled: bool):
+        """Set whether the tooltip should avoid overlapping other visible tooltips that
+        also have collision avoidance enabled. The placement (or, with AUTO, all placements)
+        and the fallback placements are tried with the body slid along the widget, and the
+        candidate that fits on the screen with the least overlap is chosen.
+
+        :param enabled: whether collision avoidance should be enabled
+        """
+
+        self.__collision_avoidance_enabled = enabled
+        if not enabled:
+            CollisionIndex.remove(id(self))
+        self.__invalidate(LayoutFlag.PLACEMENT)
 
     def show(self, delay: bool = False):
         """Start the process of showing the tooltip
@@ -751,8 +1016,7 @@ class Tooltip(TooltipInterface):
         :param delay: whether the tooltip should be shown with the delay (default: False)
         """
 
-        self.__duration_timer.stop()
-        self.__update_ui()
+        TimerWheel.cancel(self.__duration_timer)
 
         if delay:
             self.__start_show_delay()
@@ -770,29 +1034,193 @@ class Tooltip(TooltipInterface):
         else:
             self.__start_fade_out()
 
+    def configure(self, **properties):
+        """Set any number of the properties in PROPERTIES at once (e.g. backgroundColor=QColor('#FFFFFF')).
+        The style and the layout are only updated once for all of them.
+
+        :param properties: new values of the properties by name
+        """
+
+        # Only tooltip properties can be set (not the properties of QWidget)
+        for name in properties:
+            if name not in Tooltip.PROPERTIES:
+                raise TypeError('Unsupported tooltip property: {}'.format(name))
+        setters = {name: getattr(self, 'set' + name[:1].upper() + name[1:]) for name in properties}
+
+        # Style is set first, so the style properties are applied on top of it
+        with self.batchUpdate():
+            for name in sorted(properties, key=lambda name: name != 'tooltipStyle'):
+                setters[name](properties[name])
+
+    @contextmanager
+    def batchUpdate(self):
+        """Get a context in which any number of setters can be called while the
+        style and the layout are only updated once when the context is left
+
+        :return: context manager
+        """
+
+        self.__batch_depth += 1
+        try:
+            yield self
+        finally:
+            self.__batch_depth -= 1
+            if not self.__batch_depth and self.isVisible():
+                self.__update_ui()
+
+    def prewarm(self):
+        """Prepare the tooltip for its first show while the event loop is idle.
+        The widgets and the native window are created, the style sheets are
+        polished, and the text metrics, drop shadow, and triangle caches are filled,
+        so the first hover is as fast as the following ones.
+        """
+
+        IdleQueue.schedule(self.__prewarm_task, self.__prewarm)
+
     def update(self):
         """Update the tooltip"""
 
+        self.__dirty |= LayoutFlag.PLACEMENT
         self.__update_ui()
         super().update()
 
+    def x(self) -> int:
+        """Get the x position of the tooltip
+
+        :return: x position
+        """
+
+        self.__update_ui()
+        return super().x()
+
+    def y(self) -> int:
+        """Get the y position of the tooltip
+
+        :return: y position
+        """
+
+        self.__update_ui()
+        return super().y()
+
+    def pos(self) -> QPoint:
+        """Get the position of the tooltip
+
+        :return: position
+        """
+
+        self.__update_ui()
+        return super().pos()
+
+    def width(self) -> int:
+        """Get the width of the tooltip
+
+        :return: width
+        """
+
+        self.__update_ui()
+        return super().width()
+
+    def height(self) -> int:
+        """Get the height of the tooltip
+
+        :return: height
+        """
+
+        self.__update_ui()
+        return super().height()
+
+    def size(self) -> QSize:
+        """Get the size of the tooltip
+
+        :return: size
+        """
+
+        self.__update_ui()
+        return super().size()
+
+    def geometry(self) -> QRect:
+        """Get the geometry of the tooltip
+
+        :return: geometry
+        """
+
+        self.__update_ui()
+        return super().geometry()
+
+    def __prewarm(self):
+        """Do the work of the first show that doesn't depend on the tooltip being visible"""
+
+        if not self.__widgets_created:
+            self.__create_widgets()
+        self.__update_ui()
+
+        # Polish the style sheets and create the native window
+        self.ensurePolished()
+        for widget in self.findChildren(QWidget):
+            widget.ensurePolished()
+        self.winId()
+
+        # Paint once offscreen to fill the pixmap caches (only possible once laid out)
+        if self.__actual_placement is not None:
+            self.__render_snapshot()
+        else:
+            self.__fill_caches()
+
+    def __fill_caches(self):
+        """Fill the text metrics, drop shadow, and triangle caches for a tooltip
+        that can't be laid out because it has no widget (e.g. a pooled tooltip)"""
+
+        self.__update_body_size(True)
+        style = self.__actual_tooltip_style
+        device_pixel_ratio = self.devicePixelRatioF()
+
+        if style.isDropShadowEnabled():
+            DropShadow.get_pixmap(
+                self.__body_size + QSize(DROP_SHADOW_SIZE * 2, DROP_SHADOW_SIZE * 2),
+                style.getDropShadowStrength(), device_pixel_ratio
+            )
+
+        # Triangles of all the placements the tooltip can end up with
+        if not self.__triangle_enabled:
+            return
+        if self.__placement == TooltipPlacement.AUTO:
+            placements = OFFSET_PLACEMENTS
+        else:
+            placements = [self.__placement] + self.__fallback_placements
+        for placement in dict.fromkeys(placements):
+            TooltipTriangle.get_pixmap(
+                placement, self.__triangle_size, style.getBackgroundColor(),
+                style.getBorderColor(), style.isBorderEnabled(), device_pixel_ratio
+            )
+
     def __start_show_delay(self):
         """Start a delay that will start the fade in animation when finished"""
 
-        self.__hide_delay_timer.stop()
-        self.__show_delay_timer.start()
+        TimerWheel.cancel(self.__hide_delay_timer)
+        TimerWheel.schedule(self.__show_delay_timer, self.__show_delay, self.__start_fade_in)
 
     def __start_fade_in(self):
         """Start the fade in animation"""
 
         # Emit shown signal if currently hidden
-        if self.__current_opacity == 0.0:
+        current_opacity = self.__get_current_opacity()
+        if current_opacity == 0.0:
             self.shown.emit()
 
+        # Other tooltips might have been shown since the last placement
+        if current_opacity == 0.0 and self.__collision_avoidance_enabled:
+            self.__dirty |= LayoutFlag.PLACEMENT
+
+        # Apply pending layout changes right before becoming visible
+        if not self.__widgets_created:
+            self.__create_widgets()
+        self.__update_ui()
+
         # Start fade in animation and show
-        self.__fade_in_animation.setStartValue(self.__current_opacity)
-        self.__fade_in_animation.setEndValue(1)
-        self.__fade_in_animation.start()
+        self.__start_fade(
+            current_opacity, 1.0, self.__fade_in_duration, self.__fade_in_easing_curve,
+            self.__start_duration_timer
+        )
         super().show()
 
     def __start_duration_timer(self):
@@ -800,95 +1228,450 @@ class Tooltip(TooltipInterface):
          a specific amount of time if enabled"""
 
         if self.__duration != 0:
-            self.__duration_timer.start()
+            TimerWheel.schedule(self.__duration_timer, self.__duration, self.__start_fade_out)
 
     def __start_hide_delay(self):
         """Start a delay that will start the fade out animation when finished"""
 
-        self.__show_delay_timer.stop()
-        self.__hide_delay_timer.start()
+        TimerWheel.cancel(self.__show_delay_timer)
+        TimerWheel.schedule(self.__hide_delay_timer, self.__hide_delay, self.__start_fade_out)
 
     def __start_fade_out(self):
         """Start the fade out animation"""
 
-        self.__fade_out_animation.setStartValue(self.__current_opacity)
-        self.__fade_out_animation.setEndValue(0)
-        self.__fade_out_animation.start()
+        self.__start_fade(
+            self.__get_current_opacity(), 0.0, self.__fade_out_duration, self.__fade_out_easing_curve,
+            self.__hide
+        )
 
     def __hide(self):
         """Hide the tooltip"""
 
-        self.__duration_timer.stop()
+        TimerWheel.cancel(self.__duration_timer)
         super().hide()
         self.hidden.emit()
 
-    def __update_current_opacity(self, value: float):
-        """Update the current_opacity attribute with the new value of the animation
+    def __start_fade(self, start_value: float, end_value: float, duration: int,
+                     easing_curve: QEasingCurve.Type, finished: Callable[[], None]):
+        """Start fading the opacity of the tooltip on the shared animation clock
+
+        :param start_value: opacity at the start of the fade
+        :param end_value: opacity at the end of the fade
+        :param duration: duration of the fade
+        :param easing_curve: easing curve of the fade
+        :param finished: callback that is called once the fade finished
+        """
+
+        self.__update_fade_mode()
+        if self.__actual_fade_mode == TooltipFadeMode.WINDOW:
+            apply = self.__apply_window_opacity
+        elif self.__actual_fade_mode == TooltipFadeMode.SNAPSHOT:
+            # Widgets are hidden and the snapshot is painted instead until the fade finished
+            self.__snapshot_opacity = start_value
+            self.__set_content_visible(False)
+            apply = self.__apply_snapshot_opacity
+            finished = partial(self.__finish_snapshot_fade, finished)
+        else:
+            apply = self.__opacity_effect.setOpacity
+
+        # Opacity is calculated on demand while fading and settles at the end value
+        self.__current_opacity = end_value
+        AnimationClock.start(id(self), Fade(
+            duration, start_value, end_value, easing_curve, apply, finished
+        ))
 
-        :param value: value received by the valueChanged event
+    def __apply_snapshot_opacity(self, value: float):
+        """Apply the opacity of a fade to the snapshot and repaint it
+
+        :param value: opacity of the fade
         """
 
-        self.__current_opacity = value
+        self.__snapshot_opacity = value
+        QWidget.update(self)
 
-    def __update_stylesheet(self):
-        """Update the stylesheet of the widgets that are part of the tooltip"""
+    def __finish_snapshot_fade(self, finished: Callable[[], None]):
+        """Stop painting the snapshot and show the widgets again after a fade finished
 
-        self.__tooltip_body.setStyleSheet(
-            'background: {}; '
-            'border-radius: {}px; '
-            'border: {}px solid {};'
-            .format(
-                self.__background_color.name(),
-                self.__border_radius,
-                1 if self.__border_enabled else 0,
-                self.__border_color.name()
-            )
-        )
-        self.__text_widget.setStyleSheet(
-            'border: none;'
-            'color: {}'.format(self.__text_color.name())
-        )
+        :param finished: callback of the fade
+        """
+
+        # Widgets are shown after the callback, so a fade out is hidden before the widgets are shown
+        finished()
+        self.__end_snapshot_fade()
+
+    def __end_snapshot_fade(self):
+        """Stop painting the snapshot and show the widgets again"""
+
+        if self.__snapshot_opacity is None:
+            return
+
+        self.__snapshot_opacity = None
+        self.__set_content_visible(True)
+        QWidget.update(self)
+
+    def __render_snapshot(self) -> QPixmap:
+        """Render the widgets of the tooltip into a pixmap
+
+        :return: snapshot
+        """
+
+        device_pixel_ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(QWidget.size(self) * device_pixel_ratio)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        # Hidden widgets can still be rendered
+        painter = QPainter()
+        painter.begin(pixmap)
+        for widget in self.__get_content_widgets():
+            if widget is self.__drop_shadow_widget and not self.isDropShadowEnabled():
+                continue
+            widget.render(painter, widget.pos(), QRegion(), QWidget.RenderFlag.DrawChildren)
+        painter.end()
+        return pixmap
+
+    def __get_content_widgets(self) -> list[QWidget]:
+        """Get the widgets that are part of the tooltip
+
+        :return: widgets
+        """
+
+        return [
+            widget for widget in
+            [self.__drop_shadow_widget, self.__tooltip_body, self.__triangle_widget, self.__canvas]
+            if widget is not None
+        ]
+
+    def __set_content_visible(self, visible: bool):
+        """Show or hide the widgets that are part of the tooltip
+
+        :param visible: whether the widgets should be visible
+        """
+
+        for widget in self.__get_content_widgets():
+            if widget is self.__drop_shadow_widget:
+                widget.setVisible(visible and self.isDropShadowEnabled())
+            else:
+                widget.setVisible(visible)
+
+    def __apply_window_opacity(self, value: float):
+        """Apply the opacity of a fade to the window
+
+        :param value: opacity of the fade
+        """
+
+        self.setWindowOpacity(self.__opacity * value)
+
+    def __update_fade_mode(self):
+        """Resolve the fade mode and set up the opacity effect or window opacity for it"""
+
+        fade_mode = self.getFadeMode()
+        if fade_mode == TooltipFadeMode.AUTO:
+            if Utils.is_window_opacity_supported():
+                fade_mode = TooltipFadeMode.WINDOW
+            else:
+                fade_mode = TooltipFadeMode.SNAPSHOT
+
+        if fade_mode == self.__actual_fade_mode:
+            return
+        self.__actual_fade_mode = fade_mode
+
+        # Hidden tooltips are fully opaque until they start fading in
+        current_opacity = self.__get_current_opacity() if self.isVisible() else 1.0
+
+        if fade_mode != TooltipFadeMode.SNAPSHOT:
+            self.__end_snapshot_fade()
+
+        if fade_mode == TooltipFadeMode.EFFECT:
+            self.__opacity_effect = QGraphicsOpacityEffect()
+            self.__opacity_effect.setOpacity(current_opacity)
+            self.setGraphicsEffect(self.__opacity_effect)
+            self.setWindowOpacity(self.__opacity)
+        else:
+            # Removing the opacity effect deletes it
+            self.setGraphicsEffect(None)
+            self.__opacity_effect = None
+
+            if fade_mode == TooltipFadeMode.WINDOW:
+                self.__apply_window_opacity(current_opacity)
+            else:
+                self.setWindowOpacity(self.__opacity)
+
+    def __get_current_opacity(self) -> float:
+        """Get the current opacity of the fade animations
+
+        :return: current opacity
+        """
+
+        value = AnimationClock.get_value(id(self))
+        if value is None:
+            return self.__current_opacity
+        return value
+
+    def __create_widgets(self):
+        """Create the widgets that are part of the tooltip depending on the renderer"""
+
+        self.__widgets_created = True
+
+        if self.__renderer == TooltipRenderer.PAINTER:
+            self.__canvas = TooltipCanvas(self)
+        else:
+            self.__drop_shadow_widget = DropShadow(self)
+            self.__tooltip_body = QLabel(self)
+            self.__triangle_widget = TooltipTriangle(self)
+            self.__text_widget = QLabel(self.__tooltip_body)
+            self.__text_widget.setText(self.__text)
+        self.__set_content_visible(self.__snapshot_opacity is None)
+        self.__update_style()
+        self.__dirty &= ~LayoutFlag.STYLE
+
+    def __delete_widgets(self):
+        """Delete the widgets that are part of the tooltip"""
+
+        for widget in [self.__drop_shadow_widget, self.__tooltip_body, self.__triangle_widget, self.__canvas]:
+            if widget is not None:
+                widget.hide()
+                widget.deleteLater()
+
+        self.__drop_shadow_widget = None
+        self.__tooltip_body = None
+        self.__triangle_widget = None
+        self.__text_widget = None
+        self.__canvas = None
+
+    def __update_style(self):
+        """Update the style of the widgets that are part of the tooltip"""
+
+        # Style is applied once the widgets are created
+        if not self.__widgets_created:
+            return
+
+        # Painted tooltips only have to update their cached pens, brushes, and font
+        if self.__canvas is not None:
+            self.__canvas.update_style()
+            return
+
+        # Style sheets are created once per style and shared by all the tooltips using it
+        style = self.__actual_tooltip_style
+        self.__text_widget.setFont(style.getFont())
+        if style.isTextCenteringEnabled():
+            self.__text_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        else:
+            self.__text_widget.setAlignment(Qt.AlignmentFlag.AlignLeft)
+
+        self.__tooltip_body.setStyleSheet(style.get_body_style_sheet())
+        self.__text_widget.setStyleSheet(style.get_text_style_sheet())
+        if self.__drop_shadow_widget is not None:
+            self.__drop_shadow_widget.update()
+
+    def __set_style_property(self, name: str, value, flags: LayoutFlag):
+        """Set a property of the style of the tooltip. The shared style
+        isn't changed, instead a changed copy is used by the tooltip.
+
+        :param name: name of the style property
+        :param value: new value
+        :param flags: parts of the layout that depend on the property
+        """
+
+        self.__style_overrides[name] = value
+        self.__update_actual_tooltip_style(flags)
+
+    def __update_actual_tooltip_style(self, flags: LayoutFlag = LayoutFlag.STYLE | LayoutFlag.TEXT):
+        """Update the actual style based on the style (or default style) and the
+        style properties that were set individually
+
+        :param flags: parts of the layout that depend on the changed properties
+        """
+
+        tooltip_style = self.__tooltip_style
+        if tooltip_style is None:
+            tooltip_style = Tooltip.__default_tooltip_style
+        if self.__style_overrides:
+            tooltip_style = tooltip_style.replace(**self.__style_overrides)
+
+        changed = tooltip_style != self.__actual_tooltip_style
+        self.__actual_tooltip_style = tooltip_style
+        if changed:
+            self.__invalidate(flags)
+
+    def __invalidate(self, flags: LayoutFlag):
+        """Mark parts of the layout as dirty. The layout is recalculated lazily
+        right before the tooltip becomes visible or once per display frame
+        while it is visible.
+
+        :param flags: parts of the layout that are dirty
+        """
+
+        self.__dirty |= flags
+
+        # Batched changes are applied together once the batch ends
+        if self.isVisible() and not self.__batch_depth:
+            LayoutScheduler.schedule(id(self), self.__update_ui_if_visible)
+
+    def __update_ui_if_visible(self):
+        """Update the dirty parts of the UI of the tooltip if it is visible"""
+
+        if self.isVisible():
+            self.__update_ui()
 
     def __update_ui(self):
-        """Update the UI of the tooltip"""
+        """Update the dirty parts of the UI of the tooltip"""
+
+        # Placement is outdated if the widget or one of its parents changed its geometry since the last pass
+        geometry_stamp = EventRouter.instance().get_geometry_stamp(self)
+        if geometry_stamp != self.__geometry_stamp:
+            self.__geometry_stamp = geometry_stamp
+            self.__dirty |= LayoutFlag.PLACEMENT
+
+        # Style doesn't depend on the widget and is applied once per pass
+        if self.__dirty & LayoutFlag.STYLE and self.__widgets_created:
+            self.__dirty &= ~LayoutFlag.STYLE
+            self.__snapshot = None
+            self.__update_style()
 
-        if not self.__widget:
+        if not self.__widget or not self.__dirty:
             return
 
-        # Calculate text width and height
-        self.__text_widget.setMaximumSize(QWIDGETSIZE_MAX, QWIDGETSIZE_MAX)
-        font_metrics = self.__text_widget.fontMetrics()
+        # Widget can be deleted together with one of its parents
+        if Utils.is_deleted(self.__widget):
+            self.__widget = None
+            return
+        self.__snapshot = None
+
+        # Tooltips that are never shown or measured never create their widgets
+        if not self.__widgets_created:
+            self.__create_widgets()
+
+        # Later stages always depend on the results of earlier stages
+        dirty = self.__dirty
+        self.__dirty = LayoutFlag.NONE
+
+        if dirty & (LayoutFlag.TEXT | LayoutFlag.SIZE):
+            self.__update_body_size(bool(dirty & LayoutFlag.TEXT))
+            dirty |= LayoutFlag.PLACEMENT
+
+        # Widget tree and screens are only queried once per pass
+        snapshot = PlacementSnapshot.capture(self.__widget)
+        if dirty & LayoutFlag.PLACEMENT:
+            self.__update_actual_placement(snapshot)
+        self.__update_positions(snapshot)
+
+    def __update_text_bounds(self):
+        """Measure the unwrapped size of the text"""
+
+        if self.__canvas is not None:
+            font_metrics = self.__canvas.fontMetrics()
+        else:
+            font_metrics = self.__text_widget.fontMetrics()
         bounding_rect = font_metrics.boundingRect(self.__text)
-        text_size = QSize(bounding_rect.width() + 2, bounding_rect.height())
+        self.__text_bounds = QSize(bounding_rect.width() + 2, bounding_rect.height())
+
+    def __update_body_size(self, text_changed: bool):
+        """Update the size of the text and the body. Measurements are shared
+        between all tooltips and only calculated if they are not cached yet.
+
+        :param text_changed: whether the text or font changed since the last measurement
+        """
+
+        if self.__text_widget is not None:
+            self.__text_widget.setMaximumSize(QWIDGETSIZE_MAX, QWIDGETSIZE_MAX)
+        if text_changed:
+            self.__text_bounds = QSize()
+
+        style = self.__actual_tooltip_style
+        key = TextMetricsCache.create_key(
+            style.getFont(), self.__text, self.__maximum_width, style.getMargins(), self.__renderer, self.screen()
+        )
+        measurement = TextMetricsCache.get(key)
+
+        if measurement is None:
+            if not self.__text_bounds.isValid():
+                self.__update_text_bounds()
+            measurement = self.__measure_body_size()
+            TextMetricsCache.put(key, *measurement)
+
+        text_size, body_size, wrapped = measurement
+        if wrapped and self.__text_widget is not None:
+            self.__text_widget.setWordWrap(True)
+        self.__text_wrapped = wrapped
+        self.__text_size = QSize(*text_size)
+        self.__body_size = QSize(*body_size)
+
+    def __measure_body_size(self) -> tuple[tuple[int, int], tuple[int, int], bool]:
+        """Measure the size of the text and the body based on
+        the text bounds, margins, and maximum width
+
+        :return: text size, body size, and whether the text is wrapped
+        """
+
+        # Calculate text width and height
+        text_size = QSize(self.__text_bounds)
+        margins = self.__actual_tooltip_style.getMargins()
 
         # Calculate body width and height
         body_size = QSize(
-            self.__margins.left() + text_size.width() + self.__margins.right(),
-            self.__margins.top() + text_size.height() + self.__margins.bottom()
+            margins.left() + text_size.width() + margins.right(),
+            margins.top() + text_size.height() + margins.bottom()
         )
+        wrapped = body_size.width() > self.__maximum_width
 
         # Handle width greater than maximum width
-        if body_size.width() > self.__maximum_width:
-            self.__text_widget.setWordWrap(True)
-            text_size.setWidth(self.__maximum_width - self.__margins.left() - self.__margins.right())
-            text_size.setHeight(self.__text_widget.heightForWidth(text_size.width()))
+        if wrapped:
+            if self.__canvas is not None:
+                height_for_width = self.__canvas.text_height_for_width
+            else:
+                self.__text_widget.setWordWrap(True)
+                height_for_width = self.__text_widget.heightForWidth
+
+            text_size.setWidth(self.__maximum_width - margins.left() - margins.right())
+            text_size.setHeight(height_for_width(text_size.width()))
 
             # Minimize text width for calculated text height
-            new_text_height = self.__text_widget.heightForWidth(text_size.width() - 1)
-            new_text_width = text_size.width()
-            while new_text_height == text_size.height():
-                new_text_width -= 1
-                new_text_height = self.__text_widget.heightForWidth(new_text_width)
-            text_size.setWidth(new_text_width + 1)
+            text_size.setWidth(TextMetrics.get_minimal_wrap_width(height_for_width, text_size.width()))
 
             # Recalculate body width and height
-            body_size.setWidth(self.__margins.left() + text_size.width() + self.__margins.right())
-            body_size.setHeight(self.__margins.top() + text_size.height() + self.__margins.bottom())
+            body_size.setWidth(margins.left() + text_size.width() + margins.right())
+            body_size.setHeight(margins.top() + text_size.height() + margins.bottom())
+
+        return (
+            (text_size.width(), text_size.height()),
+            (body_size.width(), body_size.height()),
+            wrapped
+        )
+
+    def __update_actual_placement(self, snapshot: PlacementSnapshot):
+        """Calculate the actual placement of the tooltip
+
+        :param snapshot: geometry of the widget and screens
+        """
+
+        body_size = self.__body_size
+        self.__slide = 0
+        self.__placed_rect = None
+
+        if self.__collision_avoidance_enabled:
+            self.__actual_placement, self.__slide, self.__placed_rect = \
+                PlacementUtils.get_least_overlapping_placement(
+                    self.__widget, self.__placement, self.__fallback_placements, body_size,
+                    self.__triangle_size, self.__offsets, self.getBorderRadius(), id(self), snapshot
+                )
+            if self.isVisible():
+                self.__update_collision_index()
+            return
+
+        # Slide the body along the widget until it fits instead of trying the fallback placements
+        if self.__edge_sliding_enabled:
+            sliding_placement = PlacementUtils.get_sliding_placement(
+                self.__widget, self.__placement, self.__fallback_placements, body_size,
+                self.__triangle_size, self.__offsets, self.getBorderRadius(), snapshot
+            )
+            if sliding_placement is not None:
+                self.__actual_placement, self.__slide, self.__placed_rect = sliding_placement
+                return
 
-        # Calculate actual tooltip placement
         if self.__placement == TooltipPlacement.AUTO:
             self.__actual_placement = PlacementUtils.get_optimal_placement(
-                self.__widget, body_size, self.__triangle_size, self.__offsets
+                self.__widget, body_size, self.__triangle_size, self.__offsets, snapshot
             )
         else:
             self.__actual_placement = self.__placement
@@ -896,111 +1679,119 @@ class Tooltip(TooltipInterface):
             if self.__fallback_placements:
                 fallback_placement = PlacementUtils.get_fallback_placement(
                     self.__widget, self.__actual_placement, self.__fallback_placements,
-                    body_size, self.__triangle_size, self.__offsets
+                    body_size, self.__triangle_size, self.__offsets, snapshot
                 )
                 if fallback_placement:
                     self.__actual_placement = fallback_placement
 
+    def __update_positions(self, snapshot: PlacementSnapshot):
+        """Move and resize the tooltip and its widgets based on the actual placement
+
+        :param snapshot: geometry of the widget and screens
+        """
+
+        text_size = self.__text_size
+        body_size = self.__body_size
+        style = self.__actual_tooltip_style
+        triangle_size = TooltipTriangle.get_size(
+            self.__triangle_enabled, self.__triangle_size, self.__actual_placement, style.isBorderEnabled()
+        )
+
         # Calculate total size and widget positions based on placement
         size = QSize(body_size.width(), body_size.height())
         tooltip_triangle_pos = QPoint(0, 0)
         tooltip_body_pos = QPoint(0, 0)
         tooltip_pos = QPoint(0, 0)
-        widget_pos = Utils.get_top_level_parent(self.__widget).mapToGlobal(self.__widget.pos())
-        border_width = 1 if self.__border_enabled else 0
-        self.__triangle_widget.update()
+        widget_pos = snapshot.widget_pos
+        widget_size = snapshot.widget_size
+        border_width = 1 if style.isBorderEnabled() else 0
+        offset_x, offset_y = self.__offsets[self.__actual_placement]
 
         if self.__actual_placement == TooltipPlacement.TOP:
-            size.setHeight(body_size.height() + self.__triangle_widget.height() - border_width)
+            size.setHeight(body_size.height() + triangle_size.height() - border_width)
             tooltip_triangle_pos.setX(math.ceil(size.width() / 2 - self.__triangle_size))
             tooltip_triangle_pos.setY(body_size.height() - border_width)
-            tooltip_pos.setX(
-                int(widget_pos.x() + self.__widget.width() / 2 - size.width() / 2)
-                + self.__offsets[self.__actual_placement].x()
-            )
-            tooltip_pos.setY(widget_pos.y() - size.height() + self.__offsets[self.__actual_placement].y())
+            tooltip_pos.setX(int(widget_pos.x() + widget_size.width() / 2 - size.width() / 2) + offset_x)
+            tooltip_pos.setY(widget_pos.y() - size.height() + offset_y)
 
         elif self.__actual_placement == TooltipPlacement.BOTTOM:
-            size.setHeight(body_size.height() + self.__triangle_widget.height() - border_width)
+            size.setHeight(body_size.height() + triangle_size.height() - border_width)
             tooltip_triangle_pos.setX(math.ceil(size.width() / 2 - self.__triangle_size))
-            tooltip_body_pos.setY(self.__triangle_widget.height() - border_width)
-            tooltip_pos.setX(
-                int(widget_pos.x() + self.__widget.width() / 2 - size.width() / 2)
-                + self.__offsets[self.__actual_placement].x()
-            )
-            tooltip_pos.setY(
-                widget_pos.y() + self.__widget.height() + self.__offsets[self.__actual_placement].y()
-            )
+            tooltip_body_pos.setY(triangle_size.height() - border_width)
+            tooltip_pos.setX(int(widget_pos.x() + widget_size.width() / 2 - size.width() / 2) + offset_x)
+            tooltip_pos.setY(widget_pos.y() + widget_size.height() + offset_y)
 
         elif self.__actual_placement == TooltipPlacement.LEFT:
-            size.setWidth(body_size.width() + self.__triangle_widget.width() - border_width)
+            size.setWidth(body_size.width() + triangle_size.width() - border_width)
             tooltip_triangle_pos.setX(body_size.width() - border_width)
             tooltip_triangle_pos.setY(math.ceil(size.height() / 2 - self.__triangle_size))
-            tooltip_pos.setX(widget_pos.x() - size.width() + self.__offsets[self.__actual_placement].x())
-            tooltip_pos.setY(
-                int(widget_pos.y() + self.__widget.height() / 2 - size.height() / 2)
-                + self.__offsets[self.__actual_placement].y()
-            )
+            tooltip_pos.setX(widget_pos.x() - size.width() + offset_x)
+            tooltip_pos.setY(int(widget_pos.y() + widget_size.height() / 2 - size.height() / 2) + offset_y)
 
         elif self.__actual_placement == TooltipPlacement.RIGHT:
-            size.setWidth(body_size.width() + self.__triangle_widget.width() - border_width)
+            size.setWidth(body_size.width() + triangle_size.width() - border_width)
             tooltip_triangle_pos.setY(math.ceil(size.height() / 2 - self.__triangle_size))
-            tooltip_body_pos.setX(self.__triangle_widget.width() - border_width)
-            tooltip_pos.setX(
-                widget_pos.x() + self.__widget.width()
-                + self.__offsets[self.__actual_placement].x()
+            tooltip_body_pos.setX(triangle_size.width() - border_width)
+            tooltip_pos.setX(widget_pos.x() + widget_size.width() + offset_x)
+            tooltip_pos.setY(int(widget_pos.y() + widget_size.height() / 2 - size.height() / 2) + offset_y)
+
+        # Slide the body along the widget while the triangle keeps pointing at the widget
+        if self.__actual_placement == TooltipPlacement.TOP or self.__actual_placement == TooltipPlacement.BOTTOM:
+            tooltip_pos += QPoint(self.__slide, 0)
+            tooltip_triangle_pos -= QPoint(self.__slide, 0)
+        else:
+            tooltip_pos += QPoint(0, self.__slide)
+            tooltip_triangle_pos -= QPoint(0, self.__slide)
+
+        # Adjust positions and size for drop shadow if enabled
+        drop_shadow_rect = None
+        if style.isDropShadowEnabled():
+            drop_shadow_rect = QRect(
+                tooltip_body_pos,
+                QSize(body_size.width() + DROP_SHADOW_SIZE * 2, body_size.height() + DROP_SHADOW_SIZE * 2)
             )
-            tooltip_pos.setY(
-                int(widget_pos.y() + self.__widget.height() / 2 - size.height() / 2)
-                + self.__offsets[self.__actual_placement].y()
+            tooltip_body_pos += QPoint(DROP_SHADOW_SIZE, DROP_SHADOW_SIZE)
+            tooltip_triangle_pos += QPoint(DROP_SHADOW_SIZE, DROP_SHADOW_SIZE)
+            tooltip_pos -= QPoint(DROP_SHADOW_SIZE, DROP_SHADOW_SIZE)
+            size = QSize(
+                max(size.width(), drop_shadow_rect.right() + 1),
+                max(size.height(), drop_shadow_rect.bottom() + 1)
             )
 
         # Move and resize widgets
-        self.__text_widget.resize(text_size)
-        self.__text_widget.move(self.__margins.left(), self.__margins.top())
-        self.__tooltip_body.resize(body_size)
-
-        if self.__drop_shadow_enabled:
-            # Adjust positions and sizes for drop shadow if enabled
-            self.__tooltip_body.move(
-                tooltip_body_pos.x() + DROP_SHADOW_SIZE, tooltip_body_pos.y() + DROP_SHADOW_SIZE
-            )
-            self.__triangle_widget.move(
-                tooltip_triangle_pos.x() + DROP_SHADOW_SIZE, tooltip_triangle_pos.y() + DROP_SHADOW_SIZE
+        margins = style.getMargins()
+        text_pos = QPoint(margins.left(), margins.top())
+
+        if self.__canvas is not None:
+            self.__canvas.resize(size)
+            self.__canvas.update_layout(
+                drop_shadow_rect, QRect(tooltip_body_pos, body_size),
+                QRect(tooltip_body_pos + text_pos, text_size), tooltip_triangle_pos, self.__text_wrapped,
+                self.__actual_placement
             )
-            self.__drop_shadow_widget.resize(
-                QSize(body_size.width() + DROP_SHADOW_SIZE * 2, body_size.height() + DROP_SHADOW_SIZE * 2)
-            )
-            self.__drop_shadow_widget.move(tooltip_body_pos)
-            self.__drop_shadow_widget.update()
-            self.__drop_shadow_widget.setVisible(True)
-            self.setFixedSize(
-                max(size.width(), self.__drop_shadow_widget.width() + tooltip_body_pos.x()),
-                max(size.height(), self.__drop_shadow_widget.height() + tooltip_body_pos.y())
-            )
-            self.move(tooltip_pos.x() - DROP_SHADOW_SIZE, tooltip_pos.y() - DROP_SHADOW_SIZE)
         else:
+            self.__text_widget.resize(text_size)
+            self.__text_widget.move(text_pos)
+            self.__tooltip_body.resize(body_size)
             self.__tooltip_body.move(tooltip_body_pos)
+            self.__triangle_widget.update_layout(self.__actual_placement)
             self.__triangle_widget.move(tooltip_triangle_pos)
-            self.setFixedSize(size)
-            self.move(tooltip_pos)
-            self.__drop_shadow_widget.setVisible(False)
 
-    def __install_event_filters(self):
-        """Install / reinstall event filters on widget and its parents"""
+            if drop_shadow_rect is not None:
+                self.__drop_shadow_widget.setGeometry(drop_shadow_rect)
+                self.__drop_shadow_widget.update()
+            self.__drop_shadow_widget.setVisible(drop_shadow_rect is not None and self.__snapshot_opacity is None)
 
-        self.__remove_event_filters()
-        if not self.__widget:
-            return
-        self.__watched_widgets.append(self.__widget)
-        self.__watched_widgets += Utils.get_parents(self.__widget)
+        self.setFixedSize(size)
+        self.move(tooltip_pos)
+
+    def __update_collision_index(self):
+        """Insert the rect of the tooltip into the collision index if collision avoidance is enabled"""
 
-        for widget in self.__watched_widgets:
-            widget.installEventFilter(self)
+        if self.__collision_avoidance_enabled and self.__placed_rect is not None:
+            CollisionIndex.insert(id(self), self.__placed_rect)
 
-    def __remove_event_filters(self):
-        """Remove installed event filters"""
+    def __install_event_filters(self):
+        """Install / reinstall event filters on widget and its parents"""
 
-        for widget in self.__watched_widgets:
-            widget.removeEventFilter(self)
-        self.__watched_widgets.clear()
+        EventRouter.instance().watch(self, self.__widget)
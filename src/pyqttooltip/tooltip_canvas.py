@@ -0,0 +1,131 @@
+from qtpy.QtWidgets import QWidget
+from qtpy.QtCore import Qt, QRect, QRectF, QPoint, QEvent
+from qtpy.QtGui import QPainter, QPen, QBrush, QFont
+from .tooltip_interface import TooltipInterface
+from .tooltip_triangle import TooltipTriangle
+from .enums import TooltipPlacement
+from .drop_shadow import DropShadow
+from .utils import Utils
+from .constants import *
+
+
+class TooltipCanvas(QWidget):
+
+    def __init__(self, tooltip: TooltipInterface):
+        """Create a new TooltipCanvas instance that paints the drop shadow,
+        body, border, text, and triangle of a tooltip in a single widget
+
+        :param tooltip: tooltip the canvas belongs to
+        """
+
+        super(TooltipCanvas, self).__init__(tooltip)
+
+        self.tooltip = tooltip
+
+        # Layout calculated by the tooltip
+        self.__drop_shadow_rect = None
+        self.__body_rect = QRect()
+        self.__text_rect = QRect()
+        self.__triangle_pos = QPoint(0, 0)
+        self.__text_wrapped = False
+        self.__placement = None
+
+        # Cached painting objects
+        self.__background_brush = QBrush()
+        self.__border_pen = QPen()
+        self.__text_pen = QPen()
+        self.__text_font = QFont()
+        self.__text_flags = 0
+        self.update_style()
+
+    def paintEvent(self, event: QEvent):
+        """Paint event that paints the tooltip based on the cached style and layout
+
+        :param event: event that is received
+        """
+
+        painter = QPainter()
+        painter.begin(self)
+
+        # Drop shadow
+        if self.__drop_shadow_rect is not None:
+            DropShadow.draw_cached(
+                painter, self.__drop_shadow_rect, self.tooltip.getDropShadowStrength(),
+                self.devicePixelRatioF()
+            )
+
+        # Body with background and border
+        border_radius = self.tooltip.getBorderRadius()
+        body_rect = QRectF(self.__body_rect)
+        if self.tooltip.isBorderEnabled():
+            # Pen is centered on the outline, same as the stylesheet border
+            body_rect.adjust(0.5, 0.5, -0.5, -0.5)
+            border_radius = max(border_radius - 0.5, 0)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(self.__border_pen)
+        painter.setBrush(self.__background_brush)
+        painter.drawRoundedRect(body_rect, border_radius, border_radius)
+        painter.restore()
+
+        # Text
+        text_flags = self.__text_flags
+        if self.__text_wrapped:
+            text_flags |= Utils.get_enum_value(Qt.TextFlag.TextWordWrap)
+        painter.setFont(self.__text_font)
+        painter.setPen(self.__text_pen)
+        painter.drawText(self.__text_rect, text_flags, self.tooltip.getText())
+
+        # Triangle
+        if self.tooltip.isTriangleEnabled() and self.__placement is not None:
+            TooltipTriangle.draw_cached(
+                painter, self.__triangle_pos, self.__placement,
+                self.tooltip.getTriangleSize(), self.tooltip.getBackgroundColor(),
+                self.tooltip.getBorderColor(), self.tooltip.isBorderEnabled(), self.devicePixelRatioF()
+            )
+        painter.end()
+
+    def update_style(self):
+        """Update the cached pens, brushes, and font and repaint the canvas"""
+
+        # Painting objects are created once per style and shared by all the canvases using it
+        tooltip_style = self.tooltip.getActualTooltipStyle()
+        self.__border_pen, self.__background_brush, self.__text_pen, self.__text_font = \
+            tooltip_style.get_painting_objects()
+        self.setFont(self.__text_font)
+        self.__text_flags = tooltip_style.get_text_alignment()
+        self.update()
+
+    def update_layout(self, drop_shadow_rect: QRect | None, body_rect: QRect, text_rect: QRect,
+                      triangle_pos: QPoint, text_wrapped: bool, placement: TooltipPlacement):
+        """Update the layout of the canvas and repaint it
+
+        :param drop_shadow_rect: rect of the drop shadow (None if disabled)
+        :param body_rect: rect of the body
+        :param text_rect: rect of the text
+        :param triangle_pos: position of the triangle
+        :param text_wrapped: whether the text is wrapped
+        :param placement: actual placement of the tooltip
+        """
+
+        self.__drop_shadow_rect = drop_shadow_rect
+        self.__body_rect = body_rect
+        self.__text_rect = text_rect
+        self.__triangle_pos = triangle_pos
+        self.__text_wrapped = text_wrapped
+        self.__placement = placement
+        self.update()
+
+    def text_height_for_width(self, width: int) -> int:
+        """Get the height of the wrapped text for a width
+
+        :param width: width the text is wrapped at
+        :return: height
+        """
+
+        return self.fontMetrics().boundingRect(
+            QRect(0, 0, width, QWIDGETSIZE_MAX),
+            self.__text_flags | Utils.get_enum_value(Qt.TextFlag.TextWordWrap),
+            self.tooltip.getText()
+        ).height()
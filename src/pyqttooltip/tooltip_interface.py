@@ -1,10 +1,14 @@
 from qtpy.QtWidgets import QWidget
-from qtpy.QtGui import QColor
+from qtpy.QtGui import QColor, QFont
 from .enums import TooltipPlacement
+from .tooltip_style import TooltipStyle
 
 
 class TooltipInterface(QWidget):
 
+    def getText(self) -> str:
+        pass
+
     def isTriangleEnabled(self) -> bool:
         pass
 
@@ -14,14 +18,29 @@ class TooltipInterface(QWidget):
     def getActualPlacement(self) -> TooltipPlacement | None:
         pass
 
+    def isTextCenteringEnabled(self) -> bool:
+        pass
+
+    def getBorderRadius(self) -> int:
+        pass
+
     def isBorderEnabled(self) -> bool:
         pass
 
     def getBackgroundColor(self) -> QColor:
         pass
 
+    def getTextColor(self) -> QColor:
+        pass
+
     def getBorderColor(self) -> QColor:
         pass
 
+    def getFont(self) -> QFont:
+        pass
+
     def getDropShadowStrength(self) -> float:
         pass
+
+    def getActualTooltipStyle(self) -> TooltipStyle:
+        pass
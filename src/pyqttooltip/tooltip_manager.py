@@ -0,0 +1,320 @@
+from functools import partial
+from qtpy.QtWidgets import QWidget
+from qtpy.QtCore import QObject, QEvent, QPoint, QMargins
+from qtpy.QtGui import QColor, QFont
+from .tooltip import Tooltip
+from .event_router import EventRouter
+
+
+class TooltipSpec:
+
+    __slots__ = ('manager', 'widget', 'text', 'properties', '__weakref__')
+
+    def __init__(self, manager: 'TooltipManager', widget: QWidget, text: str, properties: dict):
+        """Create a new TooltipSpec instance that describes a tooltip
+        without creating any widgets for it
+
+        :param manager: manager the spec belongs to
+        :param widget: widget to show the tooltip for
+        :param text: text that will be displayed on the tooltip
+        :param properties: properties of the tooltip by name (e.g. placement, backgroundColor)
+        """
+
+        self.manager = manager
+        self.widget = widget
+        self.text = text
+        self.properties = properties
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Show a pooled tooltip for the spec when its widget is hovered.
+        Called by the event router.
+
+        :param watched: object that is watched
+        :param event: event that is received
+        :return: whether further processing of the event is stopped
+        """
+
+        if event.type() == event.Type.HoverEnter and watched == self.widget:
+            # Pooled tooltip handles the event (and the following ones) like its own
+            tooltip = self.manager.acquire(self)
+            tooltip.eventFilter(watched, event)
+        return False
+
+
+class TooltipManager(QObject):
+
+    # Supported properties and the getters of their current values (same as configure())
+    PROPERTIES = Tooltip.PROPERTIES
+
+    # Properties that are part of the style of a tooltip
+    STYLE_PROPERTIES = {
+        'textCenteringEnabled', 'borderRadius', 'borderEnabled', 'backgroundColor', 'textColor',
+        'borderColor', 'font', 'margins', 'dropShadowEnabled', 'dropShadowStrength', 'tooltipStyle'
+    }
+
+    def __init__(self, pool_size: int = 2):
+        """Create a new TooltipManager instance. Widgets register lightweight
+        tooltip specs and a small pool of tooltips is reused to display them.
+
+        :param pool_size: maximum number of tooltips in the pool
+        """
+
+        super(TooltipManager, self).__init__(None)
+
+        self.__pool_size = pool_size
+        self.__specs = {}
+        self.__destroyed_slots = {}
+
+        # Pooled tooltips with the spec they currently display (least recently used first)
+        self.__pool = []
+        self.__pool_specs = {}
+        self.__default_properties = None
+
+    def addTooltip(self, widget: QWidget, text: str, **properties) -> TooltipSpec:
+        """Add a tooltip to a widget. A tooltip added to the
+        widget before is replaced.
+
+        :param widget: widget to show the tooltip for
+        :param text: text that will be displayed on the tooltip
+        :param properties: properties of the tooltip by name (e.g. placement=TooltipPlacement.TOP)
+        :return: spec of the tooltip
+        """
+
+        for name in properties:
+            if name not in TooltipManager.PROPERTIES:
+                raise TypeError('Unsupported tooltip property: {}'.format(name))
+
+        self.removeTooltip(widget)
+        spec = TooltipSpec(self, widget, text, properties)
+        self.__specs[widget] = spec
+        # Specs only show a pooled tooltip on hover, so the parents don't need to be watched
+        EventRouter.instance().watch(spec, widget, parents=False)
+
+        slot = partial(self.removeTooltip, widget)
+        widget.destroyed.connect(slot)
+        self.__destroyed_slots[widget] = slot
+        return spec
+
+    def removeTooltip(self, widget: QWidget):
+        """Remove the tooltip of a widget
+
+        :param widget: widget to remove the tooltip from
+        """
+
+        spec = self.__specs.pop(widget, None)
+        if spec is None:
+            return
+
+        EventRouter.instance().unwatch(spec)
+        slot = self.__destroyed_slots.pop(widget)
+        try:
+            widget.destroyed.disconnect(slot)
+        except (RuntimeError, TypeError):
+            # Widget is already being destroyed
+            pass
+
+        # Stop displaying the spec and reset the properties it applied
+        for tooltip in self.__pool:
+            if self.__pool_specs.get(id(tooltip)) is spec:
+                tooltip.hide()
+                with tooltip.batchUpdate():
+                    tooltip.configure(**self.__get_reset_properties(spec))
+                    tooltip.setWidget(None)
+                self.__pool_specs[id(tooltip)] = None
+
+    def getTooltipSpec(self, widget: QWidget) -> TooltipSpec | None:
+        """Get the spec of the tooltip of a widget
+
+        :param widget: widget
+        :return: spec (None if the widget has no tooltip)
+        """
+
+        return self.__specs.get(widget)
+
+    def getTooltipCount(self) -> int:
+        """Get the number of widgets with a tooltip
+
+        :return: number of tooltips
+        """
+
+        return len(self.__specs)
+
+    def getPool(self) -> list[Tooltip]:
+        """Get the tooltips that were created for the pool
+
+        :return: pooled tooltips
+        """
+
+        return list(self.__pool)
+
+    def getPoolSize(self) -> int:
+        """Get the maximum number of tooltips in the pool
+
+        :return: pool size
+        """
+
+        return self.__pool_size
+
+    def setPoolSize(self, pool_size: int):
+        """Set the maximum number of tooltips in the pool
+
+        :param pool_size: new pool size
+        """
+
+        self.__pool_size = pool_size
+
+        # Delete least recently used tooltips that exceed the new size
+        while len(self.__pool) > max(pool_size, 1):
+            tooltip = self.__pool.pop(0)
+            self.__pool_specs.pop(id(tooltip), None)
+            tooltip.deleteLater()
+
+    def prewarm(self, count: int = None):
+        """Create pooled tooltips and prepare them for their first show while
+        the event loop is idle (see Tooltip.prewarm). Pooled tooltips that don't
+        display a spec are assigned the specs that aren't displayed yet.
+
+        :param count: number of tooltips to prewarm (default: pool size)
+        """
+
+        pool_size = max(self.__pool_size, 1)
+        count = pool_size if count is None else min(count, pool_size)
+
+        while len(self.__pool) < count:
+            self.__pool.insert(0, self.__create_tooltip())
+
+        # Hidden tooltips that don't display a spec are prepared for specs that aren't
+        # displayed yet, so their texts are measured with the properties of the specs
+        displayed_specs = set(self.__pool_specs.values())
+        specs = [spec for spec in self.__specs.values() if spec not in displayed_specs]
+
+        for tooltip in self.__pool[:count]:
+            if specs and self.__pool_specs.get(id(tooltip)) is None and not tooltip.isVisible():
+                self.__apply_spec(tooltip, specs.pop(0))
+            tooltip.prewarm()
+
+    def acquire(self, spec: TooltipSpec) -> Tooltip:
+        """Get a pooled tooltip that displays a spec. The tooltip already
+        displaying the spec, a hidden tooltip, a new tooltip, or the least
+        recently used tooltip is chosen (in this order).
+
+        :param spec: spec to display
+        :return: tooltip
+        """
+
+        tooltip = self.__find_tooltip(spec)
+
+        # Most recently used tooltips are at the end of the pool
+        self.__pool.remove(tooltip)
+        self.__pool.append(tooltip)
+
+        if self.__pool_specs.get(id(tooltip)) is not spec:
+            self.__apply_spec(tooltip, spec)
+        return tooltip
+
+    def __find_tooltip(self, spec: TooltipSpec) -> Tooltip:
+        """Find the tooltip of the pool that should display a spec
+
+        :param spec: spec to display
+        :return: tooltip
+        """
+
+        for tooltip in self.__pool:
+            if self.__pool_specs.get(id(tooltip)) is spec:
+                return tooltip
+
+        for tooltip in self.__pool:
+            if not tooltip.isVisible():
+                return tooltip
+
+        if len(self.__pool) < max(self.__pool_size, 1):
+            tooltip = self.__create_tooltip()
+            self.__pool.append(tooltip)
+            return tooltip
+
+        return self.__pool[0]
+
+    def __create_tooltip(self) -> Tooltip:
+        """Create a tooltip for the pool (without adding it to the pool)
+
+        :return: tooltip
+        """
+
+        tooltip = Tooltip()
+        if self.__default_properties is None:
+            self.__default_properties = self.__get_properties(tooltip)
+        self.__pool_specs[id(tooltip)] = None
+        tooltip.destroyed.connect(partial(self.__forget_tooltip, id(tooltip)))
+        return tooltip
+
+    def __apply_spec(self, tooltip: Tooltip, spec: TooltipSpec):
+        """Apply the text and properties of a spec to a pooled tooltip
+
+        :param tooltip: pooled tooltip
+        :param spec: spec to apply
+        """
+
+        properties = {}
+
+        # Properties of the previous spec that the new spec doesn't set are reset
+        previous_spec = self.__pool_specs.get(id(tooltip))
+        if previous_spec is not None:
+            properties = self.__get_reset_properties(previous_spec, spec.properties)
+
+        properties.update(spec.properties)
+        with tooltip.batchUpdate():
+            tooltip.configure(**properties)
+            tooltip.setText(spec.text)
+            tooltip.setWidget(spec.widget)
+        self.__pool_specs[id(tooltip)] = spec
+
+    def __get_reset_properties(self, spec: TooltipSpec, kept_properties: dict = None) -> dict:
+        """Get the default values of the properties that a spec applied to a pooled tooltip
+
+        :param spec: spec that was applied
+        :param kept_properties: properties that are set again and don't need to be reset
+        :return: default properties by name
+        """
+
+        kept_properties = kept_properties or {}
+        properties = {}
+
+        for name in spec.properties:
+            if name in TooltipManager.STYLE_PROPERTIES:
+                # Resetting the style also resets all the style properties, so the
+                # tooltip keeps following the default style instead of copies of it
+                properties['tooltipStyle'] = self.__default_properties['tooltipStyle']
+            elif name not in kept_properties:
+                properties[name] = self.__default_properties[name]
+        return properties
+
+    def __forget_tooltip(self, tooltip_id: int):
+        """Remove a pooled tooltip after it has been destroyed
+
+        :param tooltip_id: id of the destroyed tooltip
+        """
+
+        self.__pool = [tooltip for tooltip in self.__pool if id(tooltip) != tooltip_id]
+        self.__pool_specs.pop(tooltip_id, None)
+
+    @staticmethod
+    def __get_properties(tooltip: Tooltip) -> dict:
+        """Get copies of all the supported properties of a tooltip
+
+        :param tooltip: tooltip
+        :return: properties by name
+        """
+
+        properties = {}
+        for name, getter in TooltipManager.PROPERTIES.items():
+            value = getattr(tooltip, getter)()
+
+            # Mutable values are copied, so they can't be changed through the tooltip
+            if isinstance(value, dict):
+                value = {key: QPoint(offset) for key, offset in value.items()}
+            elif isinstance(value, list):
+                value = list(value)
+            elif isinstance(value, (QColor, QFont, QMargins)):
+                value = type(value)(value)
+            properties[name] = value
+        return properties
@@ -0,0 +1,260 @@
+from weakref import WeakValueDictionary
+from qtpy.QtCore import Qt, QMargins
+from qtpy.QtGui import QColor, QFont, QPen, QBrush
+from .utils import Utils
+
+
+class TooltipStyle:
+
+    # Names of the properties that make up a style
+    PROPERTIES = (
+        'background_color', 'text_color', 'border_color', 'font', 'margins', 'border_radius',
+        'border_enabled', 'text_centering_enabled', 'drop_shadow_enabled', 'drop_shadow_strength'
+    )
+
+    __slots__ = (
+        '__background_color', '__text_color', '__border_color', '__font', '__margins',
+        '__border_radius', '__border_enabled', '__text_centering_enabled',
+        '__drop_shadow_enabled', '__drop_shadow_strength', '__key', '__artifacts', '__weakref__'
+    )
+
+    # Equal styles that are created with replace() are shared
+    __instances = WeakValueDictionary()
+
+    def __init__(self, background_color: QColor = None, text_color: QColor = None,
+                 border_color: QColor = None, font: QFont = None, margins: QMargins = None,
+                 border_radius: int = 2, border_enabled: bool = False, text_centering_enabled: bool = True,
+                 drop_shadow_enabled: bool = True, drop_shadow_strength: float = 2.0):
+        """Create a new immutable TooltipStyle instance that can be shared by many tooltips.
+        The values are copied, so changing them afterwards doesn't change the style.
+
+        :param background_color: background color (default: #111214)
+        :param text_color: text color (default: #CFD2D5)
+        :param border_color: border color (default: #403E41)
+        :param font: font of the text (default: Arial, 9, bold)
+        :param margins: margins of the text (default: 12, 8, 12, 7)
+        :param border_radius: border radius
+        :param border_enabled: whether the border is enabled
+        :param text_centering_enabled: whether wrapped text is centered
+        :param drop_shadow_enabled: whether the drop shadow is enabled
+        :param drop_shadow_strength: strength of the drop shadow
+        """
+
+        set_attribute = super(TooltipStyle, self).__setattr__
+        set_attribute('_TooltipStyle__background_color',
+                      QColor(background_color) if background_color is not None else QColor('#111214'))
+        set_attribute('_TooltipStyle__text_color',
+                      QColor(text_color) if text_color is not None else QColor('#CFD2D5'))
+        set_attribute('_TooltipStyle__border_color',
+                      QColor(border_color) if border_color is not None else QColor('#403E41'))
+        set_attribute('_TooltipStyle__font',
+                      QFont(font) if font is not None else QFont('Arial', 9, QFont.Weight.Bold))
+        set_attribute('_TooltipStyle__margins',
+                      QMargins(margins) if margins is not None else QMargins(12, 8, 12, 7))
+        set_attribute('_TooltipStyle__border_radius', border_radius)
+        set_attribute('_TooltipStyle__border_enabled', border_enabled)
+        set_attribute('_TooltipStyle__text_centering_enabled', text_centering_enabled)
+        set_attribute('_TooltipStyle__drop_shadow_enabled', drop_shadow_enabled)
+        set_attribute('_TooltipStyle__drop_shadow_strength', drop_shadow_strength)
+
+        # Values the style is compared and hashed by
+        set_attribute('_TooltipStyle__key', (
+            self.__background_color.rgba(), self.__text_color.rgba(), self.__border_color.rgba(),
+            self.__font.toString(), self.__margins.left(), self.__margins.top(),
+            self.__margins.right(), self.__margins.bottom(), border_radius, border_enabled,
+            text_centering_enabled, drop_shadow_enabled, drop_shadow_strength
+        ))
+
+        # Style sheets, pens, and brushes derived from the style (created once when first needed)
+        set_attribute('_TooltipStyle__artifacts', {})
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError('TooltipStyle is immutable, use replace() to create a changed copy')
+
+    def __delattr__(self, name: str):
+        raise AttributeError('TooltipStyle is immutable, use replace() to create a changed copy')
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TooltipStyle):
+            return NotImplemented
+        return self.__key == other.__key
+
+    def __hash__(self) -> int:
+        return hash(self.__key)
+
+    def __repr__(self) -> str:
+        return 'TooltipStyle({})'.format(', '.join(
+            '{}={!r}'.format(name, value) for name, value in zip(self.PROPERTIES, self.__get_values())
+        ))
+
+    def replace(self, **properties) -> 'TooltipStyle':
+        """Get a copy of the style with some of the properties changed (e.g. border_radius=4).
+        The style itself is returned if nothing changes and equal copies are shared.
+
+        :param properties: new values of the properties by name
+        :return: style
+        """
+
+        for name in properties:
+            if name not in TooltipStyle.PROPERTIES:
+                raise ValueError('Unsupported style property: {}'.format(name))
+
+        values = dict(zip(TooltipStyle.PROPERTIES, self.__get_values()))
+        values.update(properties)
+        style = TooltipStyle(**values)
+        if style == self:
+            return self
+        return TooltipStyle.__instances.setdefault(style.__key, style)
+
+    def getBackgroundColor(self) -> QColor:
+        """Get the background color
+
+        :return: background color
+        """
+
+        return QColor(self.__background_color)
+
+    def getTextColor(self) -> QColor:
+        """Get the text color
+
+        :return: text color
+        """
+
+        return QColor(self.__text_color)
+
+    def getBorderColor(self) -> QColor:
+        """Get the border color
+
+        :return: border color
+        """
+
+        return QColor(self.__border_color)
+
+    def getFont(self) -> QFont:
+        """Get the font of the text
+
+        :return: font
+        """
+
+        return QFont(self.__font)
+
+    def getMargins(self) -> QMargins:
+        """Get the margins of the text
+
+        :return: margins
+        """
+
+        return QMargins(self.__margins)
+
+    def getBorderRadius(self) -> int:
+        """Get the border radius
+
+        :return: border radius
+        """
+
+        return self.__border_radius
+
+    def isBorderEnabled(self) -> bool:
+        """Get whether the border is enabled
+
+        :return: whether the border is enabled
+        """
+
+        return self.__border_enabled
+
+    def isTextCenteringEnabled(self) -> bool:
+        """Get whether text centering is enabled
+
+        :return: whether text centering is enabled
+        """
+
+        return self.__text_centering_enabled
+
+    def isDropShadowEnabled(self) -> bool:
+        """Get whether the drop shadow is enabled
+
+        :return: whether the drop shadow is enabled
+        """
+
+        return self.__drop_shadow_enabled
+
+    def getDropShadowStrength(self) -> float:
+        """Get the strength of the drop shadow
+
+        :return: strength
+        """
+
+        return self.__drop_shadow_strength
+
+    def get_body_style_sheet(self) -> str:
+        """Get the style sheet of the body widget (shared, created once per style)
+
+        :return: style sheet
+        """
+
+        if 'body_style_sheet' not in self.__artifacts:
+            self.__artifacts['body_style_sheet'] = (
+                'background: {}; '
+                'border-radius: {}px; '
+                'border: {}px solid {};'
+                .format(
+                    self.__background_color.name(),
+                    self.__border_radius,
+                    1 if self.__border_enabled else 0,
+                    self.__border_color.name()
+                )
+            )
+        return self.__artifacts['body_style_sheet']
+
+    def get_text_style_sheet(self) -> str:
+        """Get the style sheet of the text widget (shared, created once per style)
+
+        :return: style sheet
+        """
+
+        if 'text_style_sheet' not in self.__artifacts:
+            self.__artifacts['text_style_sheet'] = (
+                'border: none;'
+                'color: {}'.format(self.__text_color.name())
+            )
+        return self.__artifacts['text_style_sheet']
+
+    def get_text_alignment(self) -> int:
+        """Get the alignment flags of the text
+
+        :return: alignment flags
+        """
+
+        if self.__text_centering_enabled:
+            return Utils.get_enum_value(Qt.AlignmentFlag.AlignCenter)
+        return Utils.get_enum_value(Qt.AlignmentFlag.AlignLeft)
+
+    def get_painting_objects(self) -> tuple[QPen, QBrush, QPen, QFont]:
+        """Get the border pen, background brush, text pen, and font that the
+        tooltip is painted with (shared, created once per style, must not be changed)
+
+        :return: border pen, background brush, text pen, and font
+        """
+
+        if 'painting_objects' not in self.__artifacts:
+            if self.__border_enabled:
+                border_pen = QPen(self.__border_color, 1)
+            else:
+                border_pen = QPen(Qt.PenStyle.NoPen)
+
+            self.__artifacts['painting_objects'] = (
+                border_pen, QBrush(self.__background_color), QPen(self.__text_color), QFont(self.__font)
+            )
+        return self.__artifacts['painting_objects']
+
+    def __get_values(self) -> tuple:
+        """Get the values of the properties in the order of PROPERTIES
+
+        :return: values
+        """
+
+        return (
+            self.__background_color, self.__text_color, self.__border_color, self.__font,
+            self.__margins, self.__border_radius, self.__border_enabled,
+            self.__text_centering_enabled, self.__drop_shadow_enabled, self.__drop_shadow_strength
+        )
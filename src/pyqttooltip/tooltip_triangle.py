@@ -1,12 +1,17 @@
 from qtpy.QtWidgets import QWidget
-from qtpy.QtGui import QPainter
-from qtpy.QtCore import QPoint, QEvent
+from qtpy.QtGui import QPainter, QPixmap, QColor
+from qtpy.QtCore import Qt, QPoint, QSize, QEvent
 from .tooltip_interface import TooltipInterface
+from .pixmap_cache import PixmapCache
 from .enums import TooltipPlacement
+from .constants import *
 
 
 class TooltipTriangle(QWidget):
 
+    # Rendered triangles shared between all tooltips
+    pixmap_cache = PixmapCache(TRIANGLE_CACHE_LIMIT)
+
     def __init__(self, tooltip: TooltipInterface):
         """Create a new TooltipTriangle instance
 
@@ -17,6 +22,9 @@ class TooltipTriangle(QWidget):
 
         self.tooltip = tooltip
 
+        # Actual placement of the last layout pass of the tooltip
+        self.__placement = None
+
     def paintEvent(self, event: QEvent):
         """Paint event that paints the triangle based on the current
         settings of the tooltip
@@ -28,24 +36,157 @@ class TooltipTriangle(QWidget):
         if not self.tooltip.isTriangleEnabled():
             return
 
-        if self.tooltip.getActualPlacement() is None:
+        # Painting never lays out the tooltip
+        placement = self.__placement
+        if placement is None:
             return
 
-        # Get parameters
-        size = self.tooltip.getTriangleSize()
-        actual_placement = self.tooltip.getActualPlacement()
-        background_color = self.tooltip.getBackgroundColor()
-        border_color = self.tooltip.getBorderColor()
-        border_enabled = self.tooltip.isBorderEnabled()
-        border_width = 1 if border_enabled else 0
-
         # Init painter
         painter = QPainter()
         painter.begin(self)
+        TooltipTriangle.draw_cached(
+            painter, QPoint(0, 0), placement, self.tooltip.getTriangleSize(),
+            self.tooltip.getBackgroundColor(), self.tooltip.getBorderColor(), self.tooltip.isBorderEnabled(),
+            self.devicePixelRatioF()
+        )
+        painter.end()
+
+    def update(self):
+        """Update the size of the triangle and call the paint event"""
+
+        self.resize(TooltipTriangle.get_size(
+            self.tooltip.isTriangleEnabled(), self.tooltip.getTriangleSize(),
+            self.__placement, self.tooltip.isBorderEnabled()
+        ))
+
+        # Fire paint event
+        super().update()
+
+    def update_layout(self, placement: TooltipPlacement | None):
+        """Update the placement of the triangle and repaint it
+
+        :param placement: actual placement of the tooltip
+        """
+
+        self.__placement = placement
+        self.update()
+
+    @staticmethod
+    def get_size(enabled: bool, size: int, placement: TooltipPlacement, border_enabled: bool) -> QSize:
+        """Get the size of a triangle depending on its placement
+
+        :param enabled: whether the triangle is enabled
+        :param size: size of the triangle
+        :param placement: actual placement of the tooltip
+        :param border_enabled: whether the border is enabled
+        :return: size of the triangle
+        """
+
+        border_width = 1 if border_enabled else 0
+
+        if enabled:
+            if placement == TooltipPlacement.BOTTOM or placement == TooltipPlacement.TOP:
+                return QSize(size * 2 - 1, size + border_width)
+            elif placement == TooltipPlacement.LEFT or placement == TooltipPlacement.RIGHT:
+                return QSize(size + border_width, size * 2 - 1)
+        return QSize(0, 0)
+
+    @staticmethod
+    def draw_cached(painter: QPainter, origin: QPoint, placement: TooltipPlacement, size: int,
+                    background_color: QColor, border_color: QColor, border_enabled: bool,
+                    device_pixel_ratio: float):
+        """Draw a triangle from the shared pixmap cache with a single call
+
+        :param painter: painter to draw with
+        :param origin: top left corner of the triangle
+        :param placement: actual placement of the tooltip
+        :param size: size of the triangle
+        :param background_color: background color of the tooltip
+        :param border_color: border color of the tooltip
+        :param border_enabled: whether the border is enabled
+        :param device_pixel_ratio: device pixel ratio of the paint device
+        """
+
+        pixmap = TooltipTriangle.get_pixmap(
+            placement, size, background_color, border_color, border_enabled, device_pixel_ratio
+        )
+        painter.drawPixmap(origin, pixmap)
+
+    @staticmethod
+    def get_pixmap(placement: TooltipPlacement, size: int, background_color: QColor,
+                   border_color: QColor, border_enabled: bool, device_pixel_ratio: float) -> QPixmap:
+        """Get the pixmap that a triangle is drawn from, rendering it into the shared cache if needed
+
+        :param placement: actual placement of the tooltip
+        :param size: size of the triangle
+        :param background_color: background color of the tooltip
+        :param border_color: border color of the tooltip
+        :param border_enabled: whether the border is enabled
+        :param device_pixel_ratio: device pixel ratio of the paint device
+        :return: pixmap
+        """
+
+        key = (
+            'triangle', placement, size, border_enabled,
+            background_color.rgba(), border_color.rgba() if border_enabled else None, device_pixel_ratio
+        )
+
+        pixmap = TooltipTriangle.pixmap_cache.get(key)
+        if pixmap is None:
+            pixmap = TooltipTriangle.render_pixmap(
+                placement, size, background_color, border_color, border_enabled, device_pixel_ratio
+            )
+            TooltipTriangle.pixmap_cache.put(key, pixmap)
+        return pixmap
+
+    @staticmethod
+    def render_pixmap(placement: TooltipPlacement, size: int, background_color: QColor,
+                      border_color: QColor, border_enabled: bool, device_pixel_ratio: float = 1.0) -> QPixmap:
+        """Render a triangle into a transparent pixmap
+
+        :param placement: actual placement of the tooltip
+        :param size: size of the triangle
+        :param background_color: background color of the tooltip
+        :param border_color: border color of the tooltip
+        :param border_enabled: whether the border is enabled
+        :param device_pixel_ratio: device pixel ratio of the pixmap
+        :return: pixmap
+        """
+
+        triangle_size = TooltipTriangle.get_size(True, size, placement, border_enabled)
+        pixmap = QPixmap(triangle_size * device_pixel_ratio)
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter()
+        painter.begin(pixmap)
+        TooltipTriangle.draw(
+            painter, QPoint(0, 0), placement, size, background_color, border_color, border_enabled
+        )
+        painter.end()
+        return pixmap
+
+    @staticmethod
+    def draw(painter: QPainter, origin: QPoint, placement: TooltipPlacement, size: int,
+             background_color: QColor, border_color: QColor, border_enabled: bool):
+        """Draw a triangle one line at a time depending on the placement of the tooltip
+
+        :param painter: painter to draw with
+        :param origin: top left corner of the triangle
+        :param placement: actual placement of the tooltip
+        :param size: size of the triangle
+        :param background_color: background color of the tooltip
+        :param border_color: border color of the tooltip
+        :param border_enabled: whether the border is enabled
+        """
+
+        border_width = 1 if border_enabled else 0
+        painter.save()
+        painter.translate(origin)
         painter.setPen(border_color if border_enabled else background_color)
 
         # Draw triangle shape depending on tooltip placement
-        if actual_placement == TooltipPlacement.RIGHT:
+        if placement == TooltipPlacement.RIGHT:
             start = QPoint(0, size - 1)
             painter.drawPoint(start)
 
@@ -59,7 +200,7 @@ class TooltipTriangle(QWidget):
                     painter.drawPoint(start.x() + i, start.y() - i)
                     painter.drawPoint(start.x() + i, start.y() + i)
 
-        elif actual_placement == TooltipPlacement.LEFT:
+        elif placement == TooltipPlacement.LEFT:
             start = QPoint(size - 1 + border_width, size - 1)
             painter.drawPoint(start)
 
@@ -73,7 +214,7 @@ class TooltipTriangle(QWidget):
                     painter.drawPoint(start.x() - i, start.y() - i)
                     painter.drawPoint(start.x() - i, start.y() + i)
 
-        elif actual_placement == TooltipPlacement.TOP:
+        elif placement == TooltipPlacement.TOP:
             start = QPoint(size - 1, size - 1 + border_width)
             painter.drawPoint(start)
 
@@ -87,7 +228,7 @@ class TooltipTriangle(QWidget):
                     painter.drawPoint(start.x() - i, start.y() - i)
                     painter.drawPoint(start.x() + i, start.y() - i)
 
-        elif actual_placement == TooltipPlacement.BOTTOM:
+        elif placement == TooltipPlacement.BOTTOM:
             start = QPoint(size - 1, 0)
             painter.drawPoint(start)
 
@@ -101,25 +242,4 @@ class TooltipTriangle(QWidget):
                     painter.drawPoint(start.x() - i, start.y() + i)
                     painter.drawPoint(start.x() + i, start.y() + i)
 
-        painter.end()
-
-    def update(self):
-        """Update the size of the triangle and call the paint event"""
-
-        # Get parameters
-        enabled = self.tooltip.isTriangleEnabled()
-        size = self.tooltip.getTriangleSize()
-        actual_placement = self.tooltip.getActualPlacement()
-        border_width = 1 if self.tooltip.isBorderEnabled() > 0 else 0
-
-        # Resize depending on placement
-        if enabled:
-            if actual_placement == TooltipPlacement.BOTTOM or actual_placement == TooltipPlacement.TOP:
-                self.resize(size * 2 - 1, size + border_width)
-            elif actual_placement == TooltipPlacement.LEFT or actual_placement == TooltipPlacement.RIGHT:
-                self.resize(size + border_width, size * 2 - 1)
-        else:
-            self.resize(0, 0)
-
-        # Fire paint event
-        super().update()
+        painter.restore()
@@ -1,8 +1,14 @@
 from qtpy.QtWidgets import QWidget
+from qtpy.QtCore import QObject, QPoint
+from qtpy.QtGui import QGuiApplication
 
 
 class Utils:
 
+    # Number of expensive widget tree calls (for profiling the layout passes)
+    __map_to_global_calls = 0
+    __parent_walks = 0
+
     @staticmethod
     def get_top_level_parent(widget: QWidget) -> QWidget:
         """Get the top level parent of a widget. If the widget has no parent,
@@ -12,6 +18,8 @@ class Utils:
         :return: top level parents
         """
 
+        Utils.__parent_walks += 1
+
         if widget.parent() is None:
             return widget
 
@@ -29,9 +37,89 @@ class Utils:
         :return: parents of the widget
         """
 
+        Utils.__parent_walks += 1
         parents = []
 
         while widget.parent() is not None:
             parents.append(widget.parent())
             widget = widget.parent()
         return parents
+
+    @staticmethod
+    def map_to_global(widget: QWidget, pos: QPoint) -> QPoint:
+        """Translate a position of a widget to global screen coordinates
+
+        :param widget: widget the position is relative to
+        :param pos: position
+        :return: global position
+        """
+
+        Utils.__map_to_global_calls += 1
+        return widget.mapToGlobal(pos)
+
+    @staticmethod
+    def get_call_counts() -> dict[str, int]:
+        """Get the number of expensive widget tree calls since the last reset
+
+        :return: number of mapToGlobal calls and parent walks
+        """
+
+        return {
+            'map_to_global': Utils.__map_to_global_calls,
+            'parent_walks': Utils.__parent_walks
+        }
+
+    @staticmethod
+    def reset_call_counts():
+        """Reset the number of expensive widget tree calls"""
+
+        Utils.__map_to_global_calls = 0
+        Utils.__parent_walks = 0
+
+    @staticmethod
+    def is_deleted(obj: QObject | None) -> bool:
+        """Get whether the C++ object of a Qt object has been deleted,
+        e.g. by the garbage collector while the interpreter shuts down
+
+        :param obj: object
+        :return: whether the object has been deleted (True if None)
+        """
+
+        if obj is None:
+            return True
+        try:
+            obj.objectName()
+            return False
+        except RuntimeError:
+            return True
+
+    @staticmethod
+    def get_enum_value(flag) -> int:
+        """Get the integer value of a Qt enum or flag independent of the Qt binding
+
+        :param flag: enum or flag
+        :return: integer value
+        """
+
+        return int(getattr(flag, 'value', flag))
+
+    @staticmethod
+    def get_frame_interval() -> int:
+        """Get the duration of a display frame of the primary screen
+
+        :return: frame interval in milliseconds
+        """
+
+        screen = QGuiApplication.primaryScreen()
+        if screen is None or screen.refreshRate() <= 0:
+            return 16
+        return max(1, int(1000 / screen.refreshRate()))
+
+    @staticmethod
+    def is_window_opacity_supported() -> bool:
+        """Get whether the platform supports the opacity of top level windows
+
+        :return: whether window opacity is supported
+        """
+
+        return QGuiApplication.platformName() in ['windows', 'cocoa', 'xcb']
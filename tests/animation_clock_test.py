@@ -0,0 +1,56 @@
+from PyQt6.QtWidgets import QMainWindow, QPushButton
+from PyQt6.QtCore import QEasingCurve, QPropertyAnimation
+from src.pyqttooltip import Tooltip, TooltipFadeMode
+from src.pyqttooltip.animation_clock import AnimationClock, Fade
+
+
+def test_fades(qtbot):
+    """Test that fades are advanced by the shared clock and finished once"""
+
+    values = {'first': [], 'second': []}
+    finished = []
+
+    for key in values:
+        AnimationClock.start(key, Fade(
+            100, 0.0, 1.0, QEasingCurve.Type.Linear, values[key].append, lambda key=key: finished.append(key)
+        ))
+    assert AnimationClock.get_running_count() == 2
+    assert 0.0 <= AnimationClock.get_value('first') < 1.0
+
+    # Replacing a fade finishes only the new fade
+    AnimationClock.start('second', Fade(
+        50, 1.0, 0.0, QEasingCurve.Type.OutCubic, values['second'].append, lambda: finished.append('replaced')
+    ))
+
+    qtbot.waitUntil(lambda: AnimationClock.get_running_count() == 0)
+    assert sorted(finished) == ['first', 'replaced']
+    assert values['first'] == sorted(values['first'])
+    assert values['first'][-1] == 1.0
+    assert values['second'][-1] == 0.0
+    assert AnimationClock.get_value('first') is None
+
+    # Fades without a duration are finished immediately
+    AnimationClock.start('instant', Fade(
+        0, 0.0, 1.0, QEasingCurve.Type.Linear, values['first'].append, lambda: finished.append('instant')
+    ))
+    assert finished[-1] == 'instant'
+    assert not AnimationClock.is_running('instant')
+
+
+def test_tooltip_fades(qtbot):
+    """Test that tooltips fade on the shared clock instead of their own animations"""
+
+    window = QMainWindow()
+    button = QPushButton(window)
+    tooltip = Tooltip(button, 'Tooltip')
+    tooltip.setFadeMode(TooltipFadeMode.EFFECT)
+    tooltip.setFadeInDuration(100)
+    tooltip.setOpacity(0)
+    qtbot.addWidget(window)
+    qtbot.addWidget(tooltip)
+    assert tooltip.findChildren(QPropertyAnimation) == []
+
+    tooltip.show()
+    assert AnimationClock.is_running(id(tooltip))
+    qtbot.waitUntil(lambda: not AnimationClock.is_running(id(tooltip)))
+    assert tooltip.graphicsEffect().opacity() == 1.0
@@ -0,0 +1,66 @@
+from PyQt6.QtWidgets import QMainWindow, QPushButton
+from src.pyqttooltip import Tooltip
+from src.pyqttooltip.collision_index import CollisionIndex
+from src.pyqttooltip.placement_core import Rect
+
+
+def test_insert_remove_query():
+    """Test inserting, replacing, removing, and querying rects"""
+
+    CollisionIndex.clear()
+    CollisionIndex.insert('first', Rect(0, 0, 100, 50))
+    CollisionIndex.insert('second', Rect(300, 300, 200, 200))
+    CollisionIndex.insert('third', Rect(90, 40, 20, 20))
+    assert CollisionIndex.get_count() == 3
+
+    assert sorted(CollisionIndex.query(Rect(50, 25, 50, 50))) == ['first', 'third']
+    assert CollisionIndex.query(Rect(50, 25, 50, 50), exclude='first') == ['third']
+    assert CollisionIndex.query(Rect(100, 50, 10, 10)) == ['third']
+    assert CollisionIndex.get_overlap(Rect(80, 30, 40, 40)) == 20 * 20 + 20 * 20
+
+    # Replaced and removed rects are no longer found
+    CollisionIndex.insert('second', Rect(0, 0, 10, 10))
+    CollisionIndex.remove('third')
+    assert sorted(CollisionIndex.query(Rect(0, 0, 10, 10))) == ['first', 'second']
+    assert CollisionIndex.query(Rect(300, 300, 200, 200)) == []
+    assert CollisionIndex.get_count() == 2
+
+    CollisionIndex.clear()
+    assert CollisionIndex.get_count() == 0
+
+
+def test_collision_avoidance(qtbot):
+    """Test that visible tooltips with collision avoidance don't overlap"""
+
+    CollisionIndex.clear()
+
+    window = QMainWindow()
+    window.setGeometry(200, 150, 400, 300)
+    button = QPushButton(window)
+    button.setGeometry(150, 130, 100, 30)
+    tooltips = []
+    qtbot.addWidget(window)
+
+    for i in range(3):
+        tooltip = Tooltip(button, 'Tooltip {}'.format(i))
+        tooltip.setCollisionAvoidanceEnabled(True)
+        tooltip.setFadeInDuration(0)
+        qtbot.addWidget(tooltip)
+        tooltips.append(tooltip)
+        tooltip.show()
+
+    # Tooltips are placed on different sides of the widget
+    assert CollisionIndex.get_count() == 3
+    rects = [CollisionIndex.get_rect(id(tooltip)) for tooltip in tooltips]
+    assert len({tooltip.getActualPlacement() for tooltip in tooltips}) == 3
+    for i, rect in enumerate(rects):
+        for other in rects[i + 1:]:
+            assert rect.get_intersection_area(other) == 0
+
+    # Hidden tooltips are removed from the index
+    tooltips[0].setFadeOutDuration(0)
+    tooltips[0].hide()
+    assert CollisionIndex.get_rect(id(tooltips[0])) is None
+    for tooltip in tooltips[1:]:
+        tooltip.setCollisionAvoidanceEnabled(False)
+    assert CollisionIndex.get_count() == 0
@@ -0,0 +1,56 @@
+from PyQt6.QtWidgets import QMainWindow, QPushButton, QWidget
+from PyQt6.QtCore import Qt, QSize, QRect
+from PyQt6.QtGui import QImage, QPainter
+from src.pyqttooltip import Tooltip
+from src.pyqttooltip.drop_shadow import DropShadow
+from src.pyqttooltip.constants import DROP_SHADOW_SIZE
+
+
+def test_render_pixmap(qtbot):
+    """Test rendering the drop shadow layers into a pixmap"""
+
+    image = DropShadow.render_pixmap(QSize(100, 60), 2.0).toImage()
+
+    # Layers get more opaque towards the center
+    assert image.pixelColor(0, 30).alpha() == 0
+    assert image.pixelColor(5, 30).alpha() < image.pixelColor(9, 30).alpha()
+    assert image.pixelColor(50, 30).alpha() == sum(
+        int((i + 1) * 0.001 * 2.0 * 255) for i in range(DROP_SHADOW_SIZE)
+    )
+
+    # Corners are rounded
+    assert image.pixelColor(1, 1).alpha() == 0
+
+
+def test_single_widget(qtbot):
+    """Test that the drop shadow is painted by a single widget"""
+
+    window = QMainWindow()
+    button = QPushButton(window)
+    tooltip = Tooltip(button, 'Tooltip')
+    qtbot.addWidget(window)
+    qtbot.addWidget(tooltip)
+    tooltip.width()
+
+    drop_shadow = tooltip.findChild(DropShadow)
+    assert drop_shadow is not None
+    assert drop_shadow.findChildren(QWidget) == []
+
+
+def test_draw_nine_patch(qtbot):
+    """Test that drop shadows of different sizes reuse the same cached pixmap"""
+
+    DropShadow.pixmap_cache.clear()
+
+    for width, height in [(100, 60), (250, 40), (60, 120)]:
+        image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        DropShadow.draw_cached(painter, QRect(0, 0, width, height), 2.0, 1.0)
+        painter.end()
+
+        # Stretched drop shadow is identical to one rendered at the full size
+        expected = DropShadow.render_pixmap(QSize(width, height), 2.0).toImage()
+        assert image == expected.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+
+    assert DropShadow.pixmap_cache.get_stats()['size'] == 1
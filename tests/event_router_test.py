@@ -0,0 +1,147 @@
+import gc
+import weakref
+from PyQt6.QtWidgets import QMainWindow, QWidget, QPushButton
+from PyQt6.QtCore import QObject, QEvent, QPointF
+from PyQt6.QtGui import QHoverEvent
+from src.pyqttooltip import Tooltip
+from src.pyqttooltip.event_router import EventRouter
+
+
+def test_single_filter_per_watched_object(qtbot):
+    """Test that watched objects are shared between tooltips"""
+
+    window = QMainWindow()
+    container = QWidget(window)
+    button1 = QPushButton(container)
+    button2 = QPushButton(container)
+    tooltip1 = Tooltip(button1, 'Tooltip 1')
+    tooltip2 = Tooltip(button2, 'Tooltip 2')
+    qtbot.addWidget(window)
+    qtbot.addWidget(tooltip1)
+    qtbot.addWidget(tooltip2)
+    router = EventRouter.instance()
+
+    assert router.get_watcher_count(window) == 2
+    assert router.get_watcher_count(container) == 2
+    assert router.get_watcher_count(button1) == 1
+    assert router.get_watcher_count(button2) == 1
+
+    # Widget changed
+    tooltip2.setWidget(None)
+    assert router.get_watcher_count(window) == 1
+    assert router.get_watcher_count(button2) == 0
+
+
+def test_dispatch_hover_events(qtbot):
+    """Test that hover events are only dispatched to the tooltip of the hovered widget"""
+
+    window = QMainWindow()
+    button1 = QPushButton(window)
+    button2 = QPushButton(window)
+    tooltip1 = Tooltip(button1, 'Tooltip 1')
+    tooltip2 = Tooltip(button2, 'Tooltip 2')
+    for tooltip in [tooltip1, tooltip2]:
+        tooltip.setOpacity(0)
+        tooltip.setFadeInDuration(0)
+        tooltip.setShowDelay(0)
+    qtbot.addWidget(window)
+    qtbot.addWidget(tooltip1)
+    qtbot.addWidget(tooltip2)
+
+    event = QHoverEvent(QEvent.Type.HoverEnter, QPointF(1, 1), QPointF(1, 1), QPointF(-1, -1))
+    EventRouter.instance().eventFilter(button1, event)
+    qtbot.wait(250)
+    assert tooltip1.isVisible() == True
+    assert tooltip2.isVisible() == False
+
+
+def test_forget_deleted_objects(qtbot):
+    """Test that deleted objects and tooltips are no longer watched"""
+
+    window = QMainWindow()
+    button = QPushButton(window)
+    tooltip = Tooltip(button, 'Tooltip')
+    qtbot.addWidget(window)
+    router = EventRouter.instance()
+    assert router.get_watcher_count(window) == 1
+
+    # Tooltip deleted
+    tooltip.deleteLater()
+    qtbot.wait(50)
+    assert router.get_watcher_count(window) == 0
+    assert router.get_watcher_count(button) == 0
+
+
+def test_tooltips_not_kept_alive(qtbot):
+    """Test that the router doesn't keep tooltips alive"""
+
+    window = QMainWindow()
+    button1 = QPushButton(window)
+    button2 = QPushButton(window)
+    qtbot.addWidget(window)
+    router = EventRouter.instance()
+    tooltip_count = router.get_tooltip_count()
+
+    # Last reference dropped while the widget is alive
+    tooltip = Tooltip(button1, 'Tooltip 1')
+    tooltip_ref = weakref.ref(tooltip)
+    del tooltip
+    gc.collect()
+    assert tooltip_ref() is None
+    assert router.get_tooltip_count() == tooltip_count
+    assert router.get_watcher_count(window) == 0
+
+    # Widget destroyed before the last reference is dropped
+    tooltip = Tooltip(button2, 'Tooltip 2')
+    tooltip_ref = weakref.ref(tooltip)
+    button2.deleteLater()
+    qtbot.wait(250)
+    assert router.get_tooltip_count() == tooltip_count
+    assert router.get_watcher_count(window) == 0
+    del tooltip
+    gc.collect()
+    assert tooltip_ref() is None
+
+
+def test_dispatch_geometry_events(qtbot):
+    """Test that geometry events only reach the visible tooltips watching the object"""
+
+    class CountingTooltip(Tooltip):
+        def __init__(self, widget: QWidget, text: str):
+            super().__init__(widget, text)
+            self.geometry_events = 0
+
+        def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+            if event.type() in EventRouter.GEOMETRY_EVENTS:
+                self.geometry_events += 1
+            return super().eventFilter(watched, event)
+
+    window = QMainWindow()
+    button1 = QPushButton(window)
+    button2 = QPushButton(window)
+    qtbot.addWidget(window)
+    tooltip1 = CountingTooltip(button1, 'Tooltip 1')
+    tooltip2 = CountingTooltip(button2, 'Tooltip 2')
+    hidden_tooltip = CountingTooltip(button2, 'Hidden tooltip')
+    for tooltip in [tooltip1, tooltip2, hidden_tooltip]:
+        qtbot.addWidget(tooltip)
+    router = EventRouter.instance()
+    router.set_visible(tooltip1, True)
+    router.set_visible(tooltip2, True)
+    stamp1 = router.get_geometry_stamp(tooltip1)
+    stamp2 = router.get_geometry_stamp(hidden_tooltip)
+
+    router.eventFilter(button2, QEvent(QEvent.Type.Move))
+    assert tooltip1.geometry_events == 0
+    assert tooltip2.geometry_events == 1
+    assert hidden_tooltip.geometry_events == 0
+
+    # Hidden tooltips only find out about the changes of their own widgets
+    assert router.get_geometry_stamp(tooltip1) == stamp1
+    assert router.get_geometry_stamp(hidden_tooltip) != stamp2
+
+    # Shared parent
+    router.eventFilter(window, QEvent(QEvent.Type.Resize))
+    assert tooltip1.geometry_events == 1
+    assert tooltip2.geometry_events == 2
+    assert router.get_geometry_stamp(tooltip1) != stamp1
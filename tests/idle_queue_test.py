@@ -0,0 +1,110 @@
+from PyQt6.QtWidgets import QMainWindow, QPushButton, QWidget
+from src.pyqttooltip import Tooltip, TooltipManager, TooltipPlacement
+from src.pyqttooltip.idle_queue import IdleQueue
+from src.pyqttooltip.text_metrics import TextMetricsCache
+from src.pyqttooltip.drop_shadow import DropShadow
+from src.pyqttooltip.tooltip_triangle import TooltipTriangle
+
+
+def test_schedule_cancel(qtbot):
+    """Test scheduling, replacing, and cancelling idle callbacks"""
+
+    calls = []
+    IdleQueue.schedule('first', lambda: calls.append('first'))
+    IdleQueue.schedule('second', lambda: calls.append('second'))
+    IdleQueue.schedule('cancelled', lambda: calls.append('cancelled'))
+    IdleQueue.schedule('first', lambda: calls.append('replaced'))
+    IdleQueue.cancel('cancelled')
+    assert IdleQueue.is_pending('first')
+    assert not IdleQueue.is_pending('cancelled')
+
+    # Callbacks are only called once the event loop runs
+    assert calls == []
+    qtbot.waitUntil(lambda: IdleQueue.get_pending_count() == 0)
+    assert calls == ['replaced', 'second']
+
+
+def test_prewarm_tooltip(qtbot):
+    """Test that prewarming a tooltip does the work of the first show"""
+
+    window = QMainWindow()
+    button = QPushButton(window)
+    tooltip = Tooltip(button, 'Prewarmed tooltip')
+    qtbot.addWidget(window)
+    qtbot.addWidget(tooltip)
+    TextMetricsCache.clear()
+    DropShadow.pixmap_cache.clear()
+
+    tooltip.prewarm()
+    assert tooltip.findChildren(QWidget) == []
+    qtbot.waitUntil(lambda: IdleQueue.get_pending_count() == 0)
+
+    assert len(tooltip.findChildren(QWidget)) == 4
+    assert tooltip.windowHandle() is not None
+    assert not tooltip.isVisible()
+    assert TextMetricsCache.get_stats()['size'] == 1
+    assert DropShadow.pixmap_cache.get_stats()['size'] == 1
+
+
+def test_prewarm_manager(qtbot):
+    """Test that prewarming a manager creates and prewarms pooled tooltips"""
+
+    manager = TooltipManager(pool_size=3)
+    manager.prewarm(2)
+    assert len(manager.getPool()) == 2
+    for tooltip in manager.getPool():
+        qtbot.addWidget(tooltip)
+
+    qtbot.waitUntil(lambda: IdleQueue.get_pending_count() == 0)
+    assert all(tooltip.windowHandle() is not None for tooltip in manager.getPool())
+
+    # Pool never exceeds its size
+    manager.prewarm(10)
+    assert len(manager.getPool()) == 3
+    qtbot.addWidget(manager.getPool()[0])
+
+
+def test_prewarm_fills_caches(qtbot):
+    """Test that prewarming fills the caches of pooled tooltips without a widget"""
+
+    TextMetricsCache.clear()
+    DropShadow.pixmap_cache.clear()
+    TooltipTriangle.pixmap_cache.clear()
+
+    # Triangles of the placement and the fallback placements are rendered
+    tooltip = Tooltip()
+    tooltip.setPlacement(TooltipPlacement.TOP)
+    tooltip.setFallbackPlacements([TooltipPlacement.BOTTOM])
+    qtbot.addWidget(tooltip)
+    tooltip.prewarm()
+    qtbot.waitUntil(lambda: IdleQueue.get_pending_count() == 0)
+
+    assert tooltip.getActualPlacement() is None
+    assert TextMetricsCache.get_stats()['size'] == 1
+    assert DropShadow.pixmap_cache.get_stats()['size'] == 1
+    assert TooltipTriangle.pixmap_cache.get_stats()['size'] == 2
+
+
+def test_prewarm_manager_specs(qtbot):
+    """Test that prewarming a manager measures the texts of its specs"""
+
+    window = QMainWindow()
+    buttons = [QPushButton(window) for i in range(3)]
+    qtbot.addWidget(window)
+    manager = TooltipManager(pool_size=2)
+    for i, button in enumerate(buttons):
+        manager.addTooltip(button, 'Spec {}'.format(i), maximumWidth=100 + i)
+    TextMetricsCache.clear()
+
+    manager.prewarm()
+    for tooltip in manager.getPool():
+        qtbot.addWidget(tooltip)
+    qtbot.waitUntil(lambda: IdleQueue.get_pending_count() == 0)
+    assert TextMetricsCache.get_stats()['size'] == 2
+
+    # Showing a prewarmed spec doesn't measure its text again
+    TextMetricsCache.reset_stats()
+    tooltip = manager.acquire(manager.getTooltipSpec(buttons[1]))
+    tooltip.show()
+    qtbot.waitUntil(tooltip.isVisible)
+    assert TextMetricsCache.get_stats()['misses'] == 0
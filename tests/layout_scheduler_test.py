@@ -0,0 +1,94 @@
+from PyQt6.QtWidgets import QMainWindow, QWidget, QPushButton
+from PyQt6.QtCore import QEvent
+from src.pyqttooltip import Tooltip, TooltipPlacement, TooltipRenderer
+from src.pyqttooltip.layout_scheduler import LayoutScheduler
+from src.pyqttooltip.event_router import EventRouter
+from src.pyqttooltip.tooltip_triangle import TooltipTriangle
+from src.pyqttooltip.tooltip_canvas import TooltipCanvas
+from src.pyqttooltip.utils import Utils
+
+
+def test_coalesce_geometry_events(qtbot):
+    """Test that geometry events of the widget and its parents
+    are collapsed into a single layout pass per frame"""
+
+    window = QMainWindow()
+    container = QWidget(window)
+    button = QPushButton(container)
+    tooltip = Tooltip(button, 'Tooltip')
+    tooltip.setPlacement(TooltipPlacement.BOTTOM)
+    tooltip.setOpacity(0)
+    tooltip.setFadeInDuration(0)
+    tooltip.setShowDelay(0)
+    tooltip.setDropShadowEnabled(False)
+    qtbot.addWidget(window)
+    qtbot.addWidget(tooltip)
+    window.show()
+    tooltip.show()
+    qtbot.wait(250)
+    LayoutScheduler.reset_stats()
+
+    # Storm of move events on the widget and its parent
+    for i in range(1, 21):
+        button.move(i, i)
+        container.move(i, 0)
+
+    stats = LayoutScheduler.get_stats()
+    assert stats['requests'] == 40
+    assert stats['coalesced'] == 39
+    assert stats['passes'] == 0
+
+    # Only one layout pass is executed
+    qtbot.waitUntil(lambda: LayoutScheduler.get_stats()['passes'] == 1)
+    assert tooltip.y() == button.mapToGlobal(button.rect().bottomLeft()).y() + 1
+
+
+def test_hidden_tooltip_not_scheduled(qtbot):
+    """Test that geometry events of hidden tooltips don't schedule layout passes"""
+
+    window = QMainWindow()
+    button = QPushButton(window)
+    tooltip = Tooltip(button, 'Tooltip')
+    qtbot.addWidget(window)
+    qtbot.addWidget(tooltip)
+    window.show()
+    LayoutScheduler.reset_stats()
+
+    for i in range(10):
+        button.move(i, i)
+
+    assert LayoutScheduler.get_stats()['requests'] == 0
+
+
+def test_painting_doesnt_lay_out(qtbot):
+    """Test that painting the triangle or canvas never runs a layout pass"""
+
+    window = QMainWindow()
+    button = QPushButton(window)
+    qtbot.addWidget(window)
+    window.show()
+    qtbot.waitExposed(window)
+    tooltips = []
+    for renderer in [TooltipRenderer.WIDGETS, TooltipRenderer.PAINTER]:
+        tooltip = Tooltip(button, 'Tooltip')
+        tooltip.setRenderer(renderer)
+        tooltip.setFadeInDuration(0)
+        tooltip.setShowDelay(0)
+        qtbot.addWidget(tooltip)
+        tooltip.show()
+        tooltips.append(tooltip)
+    for tooltip in tooltips:
+        qtbot.waitExposed(tooltip)
+    triangle = tooltips[0].findChild(TooltipTriangle)
+    canvas = tooltips[1].findChild(TooltipCanvas)
+
+    # Layout is dirty until the next scheduled pass
+    EventRouter.instance().eventFilter(button, QEvent(QEvent.Type.Move))
+    Utils.reset_call_counts()
+    triangle.grab()
+    canvas.grab()
+    assert Utils.get_call_counts()['map_to_global'] == 0
+
+    # Layout is done by the scheduled pass
+    LayoutScheduler.flush()
+    assert Utils.get_call_counts()['map_to_global'] == 2
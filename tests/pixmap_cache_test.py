@@ -0,0 +1,50 @@
+from PyQt6.QtGui import QPixmap
+from src.pyqttooltip.pixmap_cache import PixmapCache
+
+
+def test_memory_usage(qtbot):
+    """Test reporting the memory used by the cached pixmaps"""
+
+    cache = PixmapCache(1024 * 1024)
+    pixmap1 = QPixmap(10, 10)
+    pixmap2 = QPixmap(20, 10)
+    bytes_per_pixel = pixmap1.depth() // 8
+
+    cache.put(('a',), pixmap1)
+    cache.put(('b',), pixmap2)
+    assert cache.get_memory_usage() == 300 * bytes_per_pixel
+
+    # Replacing a pixmap
+    cache.put(('b',), pixmap1)
+    assert cache.get_memory_usage() == 200 * bytes_per_pixel
+
+    cache.remove(('a',))
+    assert cache.get_memory_usage() == 100 * bytes_per_pixel
+
+    cache.clear()
+    assert cache.get_memory_usage() == 0
+
+
+def test_memory_limit(qtbot):
+    """Test evicting the least recently used pixmaps when the memory limit is exceeded"""
+
+    pixmap = QPixmap(10, 10)
+    pixmap_memory = PixmapCache.get_pixmap_memory(pixmap)
+    cache = PixmapCache(pixmap_memory * 2)
+
+    cache.put(('a',), pixmap)
+    cache.put(('b',), pixmap)
+    assert cache.get(('a',)) is not None
+
+    # Key b is the least recently used
+    cache.put(('c',), pixmap)
+    assert cache.get(('b',)) is None
+    assert cache.get(('a',)) is not None
+    assert cache.get(('c',)) is not None
+    assert cache.get_memory_usage() == pixmap_memory * 2
+
+    # Lower memory limit
+    cache.set_memory_limit(pixmap_memory)
+    assert cache.get_memory_limit() == pixmap_memory
+    assert cache.get(('a',)) is None
+    assert cache.get_stats() == {'hits': 3, 'misses': 2, 'size': 1, 'memory': pixmap_memory}
@@ -0,0 +1,194 @@
+import pytest
+from src.pyqttooltip import TooltipPlacement
+from src.pyqttooltip import placement_core
+from src.pyqttooltip.placement_core import PlacementCore, Rect
+
+
+OFFSETS = {
+    TooltipPlacement.LEFT:   (0, 0),
+    TooltipPlacement.RIGHT:  (0, 0),
+    TooltipPlacement.TOP:    (0, 0),
+    TooltipPlacement.BOTTOM: (0, 0)
+}
+SCREENS = [Rect(0, 0, 1920, 1080)]
+
+
+def test_rect():
+    """Test the containment check of rects"""
+
+    rect = Rect(10, 20, 100, 50)
+    assert rect.right() == 109
+    assert rect.bottom() == 69
+    assert rect.contains(Rect(10, 20, 100, 50))
+    assert rect.contains(Rect(50, 30, 10, 10))
+    assert not rect.contains(Rect(10, 20, 101, 50))
+    assert not rect.contains(Rect(9, 20, 10, 10))
+    assert Rect.create((1, 2, 3, 4)) == Rect(1, 2, 3, 4)
+
+
+def test_get_tooltip_rect():
+    """Test calculating the rect of a tooltip for every placement"""
+
+    anchor = Rect(500, 500, 100, 40)
+
+    assert PlacementCore.get_tooltip_rect(anchor, TooltipPlacement.TOP, (80, 30), 5, (0, 0)) \
+        == Rect(510, 465, 81, 36)
+    assert PlacementCore.get_tooltip_rect(anchor, TooltipPlacement.BOTTOM, (80, 30), 5, (0, 3)) \
+        == Rect(510, 543, 81, 36)
+    assert PlacementCore.get_tooltip_rect(anchor, TooltipPlacement.LEFT, (80, 30), 5, (0, 0)) \
+        == Rect(415, 480, 86, 31)
+    assert PlacementCore.get_tooltip_rect(anchor, TooltipPlacement.RIGHT, (80, 30), 5, (-2, 0)) \
+        == Rect(598, 480, 86, 31)
+
+
+def test_indexed_offsets():
+    """Test that offsets can be stored as tuples indexed by placement"""
+
+    offsets = [(0, 0)] * len(TooltipPlacement)
+    offsets[TooltipPlacement.TOP] = (0, -200)
+    anchor = Rect(400, 100, 80, 30)
+    bounds = Rect(0, 0, 500, 250)
+
+    assert PlacementCore.get_fallback_placement(
+        anchor, TooltipPlacement.TOP, [TooltipPlacement.BOTTOM], (100, 30), 5, offsets, SCREENS
+    ) == TooltipPlacement.BOTTOM
+    assert PlacementCore.get_optimal_placement(anchor, bounds, (100, 30), 5, offsets, SCREENS) \
+        == PlacementCore.get_optimal_placement(anchor, bounds, (100, 30), 5, OFFSETS, SCREENS)
+
+
+def test_get_optimal_placement():
+    """Test getting the optimal placement without Qt"""
+
+    bounds = Rect(0, 0, 500, 250)
+    size = (100, 30)
+
+    assert PlacementCore.get_optimal_placement(
+        Rect(400, 100, 80, 30), bounds, size, 5, OFFSETS, SCREENS
+    ) == TooltipPlacement.LEFT
+    assert PlacementCore.get_optimal_placement(
+        Rect(200, 100, 80, 30), bounds, size, 5, OFFSETS, SCREENS
+    ) == TooltipPlacement.RIGHT
+
+    # Placement with the most space doesn't fit on the screen
+    assert PlacementCore.get_optimal_placement(
+        Rect(2, 100, 80, 30), bounds, size, 5, OFFSETS, SCREENS
+    ) == TooltipPlacement.RIGHT
+    assert PlacementCore.get_optimal_placement(
+        Rect(250, 5, 80, 30), Rect(0, -300, 500, 550), size, 5, OFFSETS, SCREENS
+    ) == TooltipPlacement.BOTTOM
+
+
+def test_get_fallback_placement():
+    """Test getting a fallback placement without Qt"""
+
+    anchor = Rect(0, 15, 80, 30)
+    size = (50, 20)
+
+    assert PlacementCore.get_fallback_placement(
+        anchor, TooltipPlacement.LEFT, [TooltipPlacement.TOP, TooltipPlacement.RIGHT],
+        size, 5, OFFSETS, SCREENS
+    ) == TooltipPlacement.RIGHT
+    assert PlacementCore.get_fallback_placement(
+        Rect(100, 15, 80, 30), TooltipPlacement.LEFT, [TooltipPlacement.RIGHT],
+        size, 5, OFFSETS, SCREENS
+    ) is None
+
+
+def test_get_placements():
+    """Test placing many tooltips at once"""
+
+    bounds = (0, 0, 500, 250)
+    items = [((400, 100, 80, 30), (100, 30)), ((2, 100, 80, 30), (100, 30)), ((0, 15, 80, 30), (50, 20))]
+
+    assert PlacementCore.get_placements(items, bounds, [(0, 0, 1920, 1080)], 5, OFFSETS) == [
+        TooltipPlacement.LEFT, TooltipPlacement.RIGHT, TooltipPlacement.RIGHT
+    ]
+    assert PlacementCore.get_placements(
+        items, bounds, SCREENS, 5, OFFSETS, TooltipPlacement.LEFT, [TooltipPlacement.BOTTOM]
+    ) == [TooltipPlacement.LEFT, TooltipPlacement.LEFT, TooltipPlacement.BOTTOM]
+
+
+def test_get_optimal_placements(monkeypatch):
+    """Test placing many tooltips with and without NumPy"""
+
+    bounds = Rect(0, 0, 1000, 900)
+    anchors = [(400, 100, 80, 30), (2, 100, 80, 30), (450, 300, 99, 159), (900, 880, 50, 20)]
+    sizes = [(100, 30), (100, 30), (60, 20), (200, 60)]
+    offsets = {**OFFSETS, TooltipPlacement.TOP: [(0, 0), (0, 0), (0, -2), (5, 0)]}
+    expected = [
+        PlacementCore.get_optimal_placement(
+            Rect(*anchor), bounds, size, 5, {**OFFSETS, TooltipPlacement.TOP: offsets[TooltipPlacement.TOP][i]},
+            SCREENS
+        )
+        for i, (anchor, size) in enumerate(zip(anchors, sizes))
+    ]
+
+    # Offsets indexed by placement give the same results
+    indexed_offsets = [(0, 0)] * len(TooltipPlacement)
+    indexed_offsets[TooltipPlacement.TOP] = offsets[TooltipPlacement.TOP]
+
+    assert PlacementCore.get_optimal_placements(anchors, sizes, 5, offsets, bounds, SCREENS) == expected
+    assert PlacementCore.get_optimal_placements(anchors, sizes, 5, indexed_offsets, bounds, SCREENS) == expected
+    monkeypatch.setattr(placement_core, 'numpy', None)
+    assert PlacementCore.get_optimal_placements(anchors, sizes, 5, offsets, bounds, SCREENS) == expected
+    assert PlacementCore.get_optimal_placements(anchors, sizes, 5, indexed_offsets, bounds, SCREENS) == expected
+
+
+def test_get_optimal_placements_vectorized():
+    """Test that the vectorized placements match the placements of single tooltips"""
+
+    numpy = pytest.importorskip('numpy')
+    random = numpy.random.default_rng(0)
+    rows = 2000
+
+    anchors = numpy.column_stack([
+        random.integers(-100, 1900, rows), random.integers(-100, 1100, rows),
+        random.integers(1, 300, rows), random.integers(1, 100, rows)
+    ])
+    sizes = numpy.column_stack([random.integers(5, 700, rows), random.integers(5, 400, rows)])
+    triangle_sizes = random.integers(0, 10, rows)
+    offsets = {placement: random.integers(-30, 30, (rows, 2)) for placement in OFFSETS}
+    bounds = Rect(0, 0, 1000, 900)
+    screens = [Rect(0, 0, 1920, 1080), Rect(1920, 0, 1280, 1024)]
+
+    # Rows where two placements have the same space
+    anchors[::5] = [450, 300, 99, 159]
+
+    placements = PlacementCore.get_optimal_placements(anchors, sizes, triangle_sizes, offsets, bounds, screens)
+    for i in range(rows):
+        row_offsets = {placement: tuple(offset[i].tolist()) for placement, offset in offsets.items()}
+        assert placements[i] == PlacementCore.get_optimal_placement(
+            Rect(*anchors[i].tolist()), bounds, tuple(sizes[i].tolist()),
+            int(triangle_sizes[i]), row_offsets, screens
+        )
+
+
+def test_get_fitting_slide():
+    """Test calculating the slide that moves a rect onto the screen"""
+
+    # Rect sticks out on the left or right side of the screen
+    assert PlacementCore.get_fitting_slide(Rect(-30, 100, 200, 40), TooltipPlacement.TOP, 50, SCREENS) == 30
+    assert PlacementCore.get_fitting_slide(Rect(1800, 100, 200, 40), TooltipPlacement.BOTTOM, 90, SCREENS) == -80
+    assert PlacementCore.get_fitting_slide(Rect(100, 1050, 40, 60), TooltipPlacement.RIGHT, 30, SCREENS) == -30
+
+    # Rect already fits, needs to be slid too far, or doesn't fit perpendicular to the slide
+    assert PlacementCore.get_fitting_slide(Rect(100, 100, 200, 40), TooltipPlacement.TOP, 50, SCREENS) == 0
+    assert PlacementCore.get_fitting_slide(Rect(-60, 100, 200, 40), TooltipPlacement.TOP, 50, SCREENS) is None
+    assert PlacementCore.get_fitting_slide(Rect(-30, -5, 200, 40), TooltipPlacement.TOP, 50, SCREENS) is None
+
+
+def test_get_sliding_placement():
+    """Test choosing the first placement that fits once slid"""
+
+    anchor = Rect(0, 500, 40, 30)
+    candidates = [TooltipPlacement.TOP, TooltipPlacement.LEFT]
+
+    placement, slide, rect = PlacementCore.get_sliding_placement(anchor, candidates, (100, 30), 5, OFFSETS, SCREENS, 2)
+    assert placement == TooltipPlacement.TOP
+    assert slide == 30
+    assert rect == Rect(0, 465, 100, 35)
+
+    # Body can't be slid far enough with the triangle still on it
+    assert PlacementCore.get_sliding_placement(
+        Rect(-40, 500, 20, 30), [TooltipPlacement.TOP], (100, 30), 5, OFFSETS, SCREENS, 2
+    ) is None
@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import QMainWindow, QPushButton
 from PyQt6.QtCore import QPoint, QSize
 from src.pyqttooltip import TooltipPlacement
 from src.pyqttooltip.placement_utils import PlacementUtils
+from src.pyqttooltip.placement_snapshot import PlacementSnapshot
 
 
 def test_get_optimal_placement(qtbot):
@@ -88,3 +89,31 @@ def test_get_fallback_placement(qtbot):
         QSize(50, 20), 5, offsets
     )
     assert fallback_placement is None
+
+
+def test_placement_snapshot(qtbot):
+    """Test placing a tooltip based on a snapshot of the widget geometry"""
+
+    window = QMainWindow()
+    button = QPushButton(window)
+    offsets = {
+        TooltipPlacement.LEFT:   QPoint(0, 0),
+        TooltipPlacement.RIGHT:  QPoint(0, 0),
+        TooltipPlacement.TOP:    QPoint(0, 0),
+        TooltipPlacement.BOTTOM: QPoint(0, 0)
+    }
+    qtbot.addWidget(window)
+    qtbot.addWidget(button)
+
+    window.setFixedSize(500, 250)
+    button.move(400, 100)
+    snapshot = PlacementSnapshot.capture(button)
+    assert snapshot.widget_pos == window.mapToGlobal(button.pos())
+    assert snapshot.top_level_geometry == window.geometry()
+
+    # Snapshot is used instead of the current geometry of the widget
+    button.move(0, 100)
+    placement = PlacementUtils.get_optimal_placement(button, QSize(100, 30), 5, offsets, snapshot)
+    assert placement == TooltipPlacement.LEFT
+    placement = PlacementUtils.get_optimal_placement(button, QSize(100, 30), 5, offsets)
+    assert placement == TooltipPlacement.RIGHT
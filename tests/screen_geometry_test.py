@@ -0,0 +1,30 @@
+from PyQt6.QtWidgets import QApplication
+from src.pyqttooltip.screen_geometry import ScreenGeometryCache
+
+
+def test_geometries(qtbot):
+    """Test that screen geometries are only captured once until cleared"""
+
+    ScreenGeometryCache.clear()
+    ScreenGeometryCache.reset_stats()
+    geometries = [screen.geometry() for screen in QApplication.screens()]
+
+    for _ in range(10):
+        assert ScreenGeometryCache.get_geometries() == geometries
+    assert ScreenGeometryCache.get_stats() == {'refreshes': 1}
+
+    # Geometries are rebuilt after being cleared
+    ScreenGeometryCache.clear()
+    ScreenGeometryCache.get_geometries()
+    assert ScreenGeometryCache.get_stats()['refreshes'] == 2
+
+
+def test_available_geometry(qtbot):
+    """Test using the available geometry of the screens"""
+
+    ScreenGeometryCache.set_available_geometry_used(True)
+    assert ScreenGeometryCache.is_available_geometry_used()
+    assert ScreenGeometryCache.get_geometries() == [
+        screen.availableGeometry() for screen in QApplication.screens()
+    ]
+    ScreenGeometryCache.set_available_geometry_used(False)
@@ -0,0 +1,100 @@
+from PyQt6.QtWidgets import QApplication, QMainWindow, QPushButton, QLabel
+from PyQt6.QtCore import QMargins
+from PyQt6.QtGui import QFont
+from src.pyqttooltip import Tooltip
+from src.pyqttooltip.text_metrics import TextMetricsCache, TextMetrics
+
+
+def test_share_measurements(qtbot):
+    """Test that tooltips with the same font and text share their measurements"""
+
+    window = QMainWindow()
+    button1 = QPushButton(window)
+    button2 = QPushButton(window)
+    tooltip1 = Tooltip(button1, 'Shared measurement')
+    tooltip2 = Tooltip(button2, 'Shared measurement')
+    qtbot.addWidget(window)
+    qtbot.addWidget(tooltip1)
+    qtbot.addWidget(tooltip2)
+    TextMetricsCache.clear()
+    TextMetricsCache.reset_stats()
+
+    # First tooltip measures, second tooltip hits the cache
+    width = tooltip1.width()
+    assert TextMetricsCache.get_stats() == {'hits': 0, 'misses': 1, 'size': 1}
+    assert tooltip2.width() == width
+    assert TextMetricsCache.get_stats() == {'hits': 1, 'misses': 1, 'size': 1}
+
+    # Moving the widget doesn't measure the text again
+    button1.move(50, 50)
+    tooltip1.update()
+    assert TextMetricsCache.get_stats()['hits'] == 1
+    assert TextMetricsCache.get_stats()['misses'] == 1
+
+
+def test_screen_key(qtbot):
+    """Test that measurements are only shared between screens with the same DPI and pixel ratio"""
+
+    class HighDpiScreen:
+
+        def __init__(self, screen):
+            self.screen = screen
+
+        def devicePixelRatio(self) -> float:
+            return self.screen.devicePixelRatio() * 2
+
+        def logicalDotsPerInch(self) -> float:
+            return self.screen.logicalDotsPerInch()
+
+    font = QFont('Arial', 9)
+    margins = QMargins(0, 0, 0, 0)
+    screen = QApplication.primaryScreen()
+    key = TextMetricsCache.create_key(font, 'Save', 100, margins, screen=screen)
+
+    assert TextMetricsCache.create_key(font, 'Save', 100, margins) == key
+    assert TextMetricsCache.create_key(font, 'Save', 100, margins, screen=HighDpiScreen(screen)) != key
+
+
+def test_evict_least_recently_used(qtbot):
+    """Test that the least recently used measurements are evicted"""
+
+    font = QFont('Arial', 9)
+    margins = QMargins(0, 0, 0, 0)
+    capacity = TextMetricsCache.get_capacity()
+    TextMetricsCache.clear()
+    TextMetricsCache.set_capacity(2)
+
+    key1 = TextMetricsCache.create_key(font, 'Save', 100, margins)
+    key2 = TextMetricsCache.create_key(font, 'Delete', 100, margins)
+    key3 = TextMetricsCache.create_key(font, 'Load', 100, margins)
+    TextMetricsCache.put(key1, (20, 10), (20, 10), False)
+    TextMetricsCache.put(key2, (30, 10), (30, 10), False)
+    assert TextMetricsCache.get(key1) is not None
+
+    # Key 2 is the least recently used
+    TextMetricsCache.put(key3, (25, 10), (25, 10), False)
+    assert TextMetricsCache.get(key2) is None
+    assert TextMetricsCache.get(key1) is not None
+    assert TextMetricsCache.get(key3) is not None
+
+    TextMetricsCache.set_capacity(capacity)
+    TextMetricsCache.clear()
+    assert TextMetricsCache.get_stats()['size'] == 0
+
+
+def test_get_minimal_wrap_width(qtbot):
+    """Test getting the minimal width of wrapped text with the same height"""
+
+    label = QLabel('Lorem ipsum dolor sit amet, consetetur sadipscing elitr, sed diam nonumy')
+    label.setWordWrap(True)
+    qtbot.addWidget(label)
+    probes = []
+
+    def height_for_width(width: int) -> int:
+        probes.append(width)
+        return label.heightForWidth(width)
+
+    width = TextMetrics.get_minimal_wrap_width(height_for_width, 150)
+    assert label.heightForWidth(width) == label.heightForWidth(150)
+    assert label.heightForWidth(width - 1) != label.heightForWidth(150)
+    assert len(probes) <= 10
@@ -0,0 +1,42 @@
+from PyQt6.QtWidgets import QMainWindow, QPushButton
+from PyQt6.QtCore import QTimer
+from src.pyqttooltip import Tooltip
+from src.pyqttooltip.timer_wheel import TimerWheel
+
+
+def test_schedule_cancel(qtbot):
+    """Test scheduling, rescheduling, and cancelling callbacks"""
+
+    calls = []
+    TimerWheel.schedule('first', 30, lambda: calls.append('first'))
+    TimerWheel.schedule('second', 10, lambda: calls.append('second'))
+    TimerWheel.schedule('cancelled', 10, lambda: calls.append('cancelled'))
+    assert TimerWheel.get_pending_count() == 3
+
+    # Rescheduling replaces the previous deadline
+    TimerWheel.schedule('second', 60, lambda: calls.append('rescheduled'))
+    TimerWheel.cancel('cancelled')
+    assert TimerWheel.get_pending_count() == 2
+    assert TimerWheel.is_pending('second')
+    assert not TimerWheel.is_pending('cancelled')
+
+    qtbot.waitUntil(lambda: TimerWheel.get_pending_count() == 0)
+    assert calls == ['first', 'rescheduled']
+
+
+def test_tooltip_timers(qtbot):
+    """Test that tooltips use the timer wheel instead of their own timers"""
+
+    window = QMainWindow()
+    button = QPushButton(window)
+    tooltip = Tooltip(button, 'Tooltip')
+    tooltip.setShowDelay(1000)
+    qtbot.addWidget(window)
+    assert tooltip.findChildren(QTimer) == []
+
+    # Pending delay is cancelled when the tooltip is deleted
+    tooltip.show(delay=True)
+    assert TimerWheel.get_pending_count() == 1
+    tooltip.deleteLater()
+    qtbot.wait(50)
+    assert TimerWheel.get_pending_count() == 0
@@ -0,0 +1,152 @@
+import pytest
+from PyQt6.QtWidgets import QMainWindow, QPushButton
+from PyQt6.QtCore import QEvent, QPointF
+from PyQt6.QtGui import QHoverEvent, QColor
+from src.pyqttooltip import Tooltip, TooltipManager, TooltipPlacement, TooltipStyle
+from src.pyqttooltip.event_router import EventRouter
+
+
+def hover(widget: QPushButton):
+    """Dispatch a hover enter event for a widget to the tooltips"""
+
+    event = QHoverEvent(QEvent.Type.HoverEnter, QPointF(1, 1), QPointF(1, 1), QPointF(-1, -1))
+    EventRouter.instance().eventFilter(widget, event)
+
+
+def test_add_remove_tooltips(qtbot):
+    """Test that specs are registered without creating tooltips"""
+
+    window = QMainWindow()
+    buttons = [QPushButton(window) for _ in range(100)]
+    qtbot.addWidget(window)
+    manager = TooltipManager()
+
+    for i, button in enumerate(buttons):
+        manager.addTooltip(button, 'Tooltip {}'.format(i), placement=TooltipPlacement.TOP)
+
+    assert manager.getTooltipCount() == 100
+    assert manager.getPool() == []
+    assert manager.getTooltipSpec(buttons[5]).text == 'Tooltip 5'
+
+    # Specs only watch their own widget, not its parents
+    assert EventRouter.instance().get_watcher_count(window) == 0
+    assert all(EventRouter.instance().get_watcher_count(button) == 1 for button in buttons)
+
+    # Remove tooltip and delete widget
+    manager.removeTooltip(buttons[0])
+    buttons[1].deleteLater()
+    qtbot.wait(50)
+    assert manager.getTooltipCount() == 98
+    assert manager.getTooltipSpec(buttons[0]) is None
+    assert EventRouter.instance().get_watcher_count(buttons[0]) == 0
+    assert EventRouter.instance().get_watcher_count(buttons[2]) == 1
+
+
+def test_pool(qtbot):
+    """Test that pooled tooltips are reused to display the specs"""
+
+    window = QMainWindow()
+    buttons = [QPushButton(window) for _ in range(3)]
+    qtbot.addWidget(window)
+    manager = TooltipManager(pool_size=2)
+    for i, button in enumerate(buttons):
+        manager.addTooltip(
+            button, 'Tooltip {}'.format(i), showDelay=0, fadeInDuration=0, fadeOutDuration=0
+        )
+    manager.addTooltip(buttons[2], 'Tooltip 2', showDelay=0, backgroundColor=QColor('#FFFFFF'))
+
+    # Hovering a widget shows its tooltip
+    hover(buttons[0])
+    qtbot.wait(50)
+    tooltip = manager.getPool()[0]
+    assert tooltip.isVisible()
+    assert tooltip.getWidget() == buttons[0]
+    assert tooltip.getText() == 'Tooltip 0'
+
+    # Second visible tooltip
+    hover(buttons[1])
+    qtbot.wait(50)
+    assert len(manager.getPool()) == 2
+    assert manager.getPool()[1].getText() == 'Tooltip 1'
+
+    # Pool is full, least recently used tooltip is reused with the properties of the new spec
+    hover(buttons[2])
+    qtbot.wait(50)
+    assert len(manager.getPool()) == 2
+    assert tooltip.getWidget() == buttons[2]
+    assert tooltip.getText() == 'Tooltip 2'
+    assert tooltip.getBackgroundColor() == QColor('#FFFFFF')
+    assert tooltip.getFadeInDuration() == 150
+
+    # Hovering the same widget again reuses its tooltip
+    hover(buttons[2])
+    assert manager.getPool()[1] == tooltip
+
+
+def test_unsupported_property(qtbot):
+    """Test that unsupported properties are rejected"""
+
+    window = QMainWindow()
+    button = QPushButton(window)
+    qtbot.addWidget(window)
+    manager = TooltipManager()
+
+    # Same error as Tooltip.configure()
+    with pytest.raises(TypeError):
+        manager.addTooltip(button, 'Tooltip', size=10)
+    with pytest.raises(TypeError):
+        manager.addTooltip(button, 'Tooltip', visible=False)
+    assert manager.getTooltipCount() == 0
+
+
+def test_pooled_style(qtbot):
+    """Test that pooled tooltips share the styles of the specs and reset them"""
+
+    window = QMainWindow()
+    buttons = [QPushButton(window) for _ in range(3)]
+    qtbot.addWidget(window)
+    style = TooltipStyle(background_color=QColor('#FFFFFF'))
+    manager = TooltipManager(pool_size=1)
+    manager.addTooltip(buttons[0], 'Tooltip 0', showDelay=0, tooltipStyle=style, borderRadius=4)
+    manager.addTooltip(buttons[1], 'Tooltip 1', showDelay=0, textColor=QColor('#000000'))
+    manager.addTooltip(buttons[2], 'Tooltip 2', showDelay=0)
+
+    hover(buttons[0])
+    tooltip = manager.getPool()[0]
+    assert tooltip.getTooltipStyle() is style
+    assert tooltip.getActualTooltipStyle() == style.replace(border_radius=4)
+
+    # Style and style properties of the previous spec are reset
+    hover(buttons[1])
+    assert tooltip.getTooltipStyle() is None
+    assert tooltip.getActualTooltipStyle() == Tooltip.getDefaultTooltipStyle().replace(
+        text_color=QColor('#000000')
+    )
+
+    hover(buttons[2])
+    assert tooltip.getActualTooltipStyle() is Tooltip.getDefaultTooltipStyle()
+
+
+def test_remove_then_reuse(qtbot):
+    """Test that removing a spec resets the properties it applied to its pooled tooltip"""
+
+    window = QMainWindow()
+    buttons = [QPushButton(window) for _ in range(2)]
+    qtbot.addWidget(window)
+    manager = TooltipManager(pool_size=1)
+    manager.addTooltip(buttons[0], 'Tooltip 0', showDelay=0, duration=500, borderRadius=4)
+    manager.addTooltip(buttons[1], 'Tooltip 1', showDelay=0)
+
+    hover(buttons[0])
+    tooltip = manager.getPool()[0]
+    assert tooltip.getDuration() == 500
+    manager.removeTooltip(buttons[0])
+    assert tooltip.getWidget() is None
+
+    # Next spec displayed by the tooltip has the default properties
+    hover(buttons[1])
+    assert manager.getPool() == [tooltip]
+    assert tooltip.getWidget() == buttons[1]
+    assert tooltip.getDuration() == 0
+    assert tooltip.getTooltipStyle() is None
+    assert tooltip.getActualTooltipStyle() is Tooltip.getDefaultTooltipStyle()
@@ -0,0 +1,113 @@
+import pytest
+from PyQt6.QtWidgets import QMainWindow, QPushButton, QLabel
+from PyQt6.QtCore import QMargins
+from PyQt6.QtGui import QColor, QFont
+from src.pyqttooltip import Tooltip, TooltipStyle, TooltipRenderer
+
+
+def test_immutable_value(qtbot):
+    """Test that styles are immutable values that are compared by their properties"""
+
+    color = QColor('#FFFFFF')
+    style = TooltipStyle(background_color=color, border_radius=4)
+
+    # Values are copied and can't be changed through the style
+    color.setNamedColor('#000000')
+    style.getBackgroundColor().setNamedColor('#000000')
+    assert style.getBackgroundColor() == QColor('#FFFFFF')
+    with pytest.raises(AttributeError):
+        style.border_radius = 0
+
+    # Equal styles are interchangeable
+    assert style == TooltipStyle(background_color=QColor('#FFFFFF'), border_radius=4)
+    assert hash(style) == hash(TooltipStyle(background_color=QColor('#FFFFFF'), border_radius=4))
+    assert style != TooltipStyle()
+
+    # Copies with changed properties are shared
+    changed = style.replace(border_enabled=True)
+    assert changed.isBorderEnabled()
+    assert not style.isBorderEnabled()
+    assert changed is style.replace(border_enabled=True)
+    assert style.replace(border_radius=4) is style
+    with pytest.raises(ValueError):
+        style.replace(opacity=0.5)
+
+    # Derived style sheets and painting objects are created once per style
+    assert style.get_body_style_sheet() is style.get_body_style_sheet()
+    assert style.get_painting_objects() is style.get_painting_objects()
+    assert 'border-radius: 4px' in style.get_body_style_sheet()
+
+
+def test_shared_style(qtbot):
+    """Test that tooltips share a style until they change one of its properties"""
+
+    window = QMainWindow()
+    button = QPushButton(window)
+    qtbot.addWidget(window)
+    style = TooltipStyle(background_color=QColor('#FFFFFF'), font=QFont('Consolas', 10))
+    tooltips = [Tooltip(button, 'Tooltip {}'.format(i)) for i in range(3)]
+    for tooltip in tooltips:
+        qtbot.addWidget(tooltip)
+        tooltip.setTooltipStyle(style)
+
+    assert all(tooltip.getActualTooltipStyle() is style for tooltip in tooltips)
+    assert tooltips[0].getBackgroundColor() == QColor('#FFFFFF')
+
+    # Changing a property changes a copy of the style
+    tooltips[0].setMarginLeft(20)
+    tooltips[1].setMarginLeft(20)
+    assert tooltips[0].getMargins() == QMargins(20, 8, 12, 7)
+    assert tooltips[0].getActualTooltipStyle() is tooltips[1].getActualTooltipStyle()
+    assert tooltips[2].getActualTooltipStyle() is style
+    assert style.getMargins() == QMargins(12, 8, 12, 7)
+    assert tooltips[0].getTooltipStyle() is style
+
+    # Setting the style again resets the changed properties
+    tooltips[0].setTooltipStyle(style)
+    assert tooltips[0].getMargins() == QMargins(12, 8, 12, 7)
+
+    # Widgets are styled with the shared style
+    tooltips[0].show()
+    qtbot.waitUntil(tooltips[0].isVisible)
+    labels = [label for label in tooltips[0].findChildren(QLabel) if label.text() == 'Tooltip 0']
+    assert labels[0].font().pointSize() == 10
+    assert labels[0].styleSheet() == style.get_text_style_sheet()
+
+
+def test_default_style(qtbot):
+    """Test that changing the default style changes all the tooltips that don't set their own"""
+
+    window = QMainWindow()
+    button = QPushButton(window)
+    qtbot.addWidget(window)
+    default_style = Tooltip.getDefaultTooltipStyle()
+    following = Tooltip(button, 'Following tooltip')
+    overriding = Tooltip(button, 'Overriding tooltip')
+    fixed = Tooltip(button, 'Fixed tooltip')
+    painted = Tooltip(button, 'Painted tooltip')
+    for tooltip in [following, overriding, fixed, painted]:
+        qtbot.addWidget(tooltip)
+    overriding.setBorderRadius(6)
+    fixed.setTooltipStyle(TooltipStyle())
+    painted.setRenderer(TooltipRenderer.PAINTER)
+    painted.show()
+    qtbot.waitUntil(painted.isVisible)
+    width = painted.width()
+
+    try:
+        theme = TooltipStyle(background_color=QColor('#FFFFFF'), margins=QMargins(30, 8, 30, 7))
+        Tooltip.setDefaultTooltipStyle(theme)
+
+        assert Tooltip.getDefaultTooltipStyle() is theme
+        assert following.getActualTooltipStyle() is theme
+        assert overriding.getBackgroundColor() == QColor('#FFFFFF')
+        assert overriding.getBorderRadius() == 6
+        assert fixed.getBackgroundColor() == QColor('#111214')
+
+        # Visible tooltips update their style and layout with the next layout pass
+        qtbot.waitUntil(lambda: painted.width() == width + 36)
+        assert painted.getMargins() == QMargins(30, 8, 30, 7)
+    finally:
+        Tooltip.setDefaultTooltipStyle(default_style)
+
+    assert following.getBackgroundColor() == QColor('#111214')
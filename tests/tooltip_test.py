@@ -1,8 +1,10 @@
-from PyQt6.QtWidgets import QMainWindow, QPushButton
-from PyQt6.QtCore import QMargins, QPoint, QEasingCurve
+import pytest
+from PyQt6.QtWidgets import QMainWindow, QPushButton, QWidget, QLabel
+from PyQt6.QtCore import Qt, QMargins, QPoint, QEasingCurve, QObject, QEvent
 from PyQt6.QtGui import QColor, QFont
-from src.pyqttooltip import Tooltip, TooltipPlacement
+from src.pyqttooltip import Tooltip, TooltipPlacement, TooltipRenderer, TooltipFadeMode
 from src.pyqttooltip.constants import DROP_SHADOW_SIZE
+from src.pyqttooltip.utils import Utils
 
 
 def test_initial_values(qtbot):
@@ -226,6 +228,15 @@ def test_set_offsets(qtbot):
     tooltip.setPlacement(TooltipPlacement.BOTTOM)
     assert tooltip.y() == button.height() + 10
 
+    # Offsets are returned as copies
+    assert tooltip.getOffsets() == offsets
+    tooltip.getOffsetByPlacement(TooltipPlacement.BOTTOM).setY(20)
+    assert tooltip.getOffsetByPlacement(TooltipPlacement.BOTTOM) == QPoint(0, 10)
+
+    tooltip.setOffsetByPlacement(TooltipPlacement.BOTTOM, QPoint(3, 4))
+    tooltip.setOffsetsAll(QPoint(1, 2))
+    assert tooltip.getOffsets() == {placement: QPoint(1, 2) for placement in offsets}
+
 
 def test_set_delays(qtbot):
     """Test setting the delays"""
@@ -422,6 +433,29 @@ def test_change_top_level_parent(qtbot):
     assert tooltip.y() == y + 150
 
 
+def test_reparent_hidden_widget(qtbot):
+    """Test that reparenting a hidden widget into another window updates the placement"""
+
+    window1 = QMainWindow()
+    window2 = QMainWindow()
+    window2.move(0, 300)
+    button = QPushButton(window1)
+    tooltip = Tooltip(button, 'Tooltip')
+    tooltip.setPlacement(TooltipPlacement.BOTTOM)
+    tooltip.setDropShadowEnabled(False)
+    qtbot.addWidget(window1)
+    qtbot.addWidget(window2)
+    qtbot.addWidget(button)
+    qtbot.addWidget(tooltip)
+    y = tooltip.y()
+
+    # Geometry stamps of the new parents must not match the stamps of the old ones
+    button.hide()
+    button.setParent(window2)
+    button.show()
+    assert tooltip.y() == y + 300
+
+
 def test_delete_parent(qtbot):
     """Test deleting the parent of the widget while the tooltip is showing"""
 
@@ -513,3 +547,274 @@ def test_move_widget(qtbot):
     tooltip.update()
     assert tooltip.x() == x + 100
     assert tooltip.y() == y + 50
+
+
+def test_lazy_layout(qtbot):
+    """Test that the layout is only recalculated when it is needed"""
+
+    window = QMainWindow()
+    button = QPushButton(window)
+    tooltip = Tooltip(button, 'Tooltip')
+    tooltip.setOpacity(0)
+    tooltip.setFadeInDuration(0)
+    tooltip.setShowDelay(0)
+    qtbot.addWidget(window)
+    qtbot.addWidget(button)
+    qtbot.addWidget(tooltip)
+    width = tooltip.width()
+
+    # Hidden tooltip is only laid out when its geometry is requested
+    tooltip.setText('Longer tooltip text')
+    assert QWidget.width(tooltip) == width
+    assert tooltip.width() > width
+
+    # Visible tooltip is laid out in the next display frame
+    tooltip.show()
+    qtbot.wait(250)
+    width = tooltip.width()
+    tooltip.setText('Even longer tooltip text')
+    assert QWidget.width(tooltip) == width
+    qtbot.waitUntil(lambda: QWidget.width(tooltip) > width)
+
+
+def test_layout_queries_widget_tree_once(qtbot):
+    """Test that a layout pass only queries the widget tree once"""
+
+    window = QMainWindow()
+    widget = QWidget(window)
+    button = QPushButton(widget)
+    tooltip = Tooltip(button, 'Tooltip')
+    tooltip.setFallbackPlacements([TooltipPlacement.TOP, TooltipPlacement.BOTTOM])
+    qtbot.addWidget(window)
+    qtbot.addWidget(tooltip)
+    tooltip.width()
+
+    for placement in [TooltipPlacement.AUTO, TooltipPlacement.LEFT]:
+        tooltip.setPlacement(placement)
+        Utils.reset_call_counts()
+        tooltip.width()
+        assert Utils.get_call_counts() == {'map_to_global': 1, 'parent_walks': 1}
+
+
+def test_set_edge_sliding_enabled(qtbot):
+    """Test sliding the body along the widget to fit on the screen"""
+
+    window = QMainWindow()
+    window.setGeometry(0, 300, 400, 200)
+    button = QPushButton(window)
+    button.setGeometry(0, 50, 40, 30)
+    tooltip = Tooltip(button, 'Tooltip with a longer text')
+    tooltip.setPlacement(TooltipPlacement.TOP)
+    tooltip.setFallbackPlacements([TooltipPlacement.RIGHT])
+    qtbot.addWidget(window)
+    qtbot.addWidget(tooltip)
+    assert tooltip.getActualPlacement() == TooltipPlacement.RIGHT
+
+    # Body is slid right until it fits and the triangle still points at the button
+    tooltip.setEdgeSlidingEnabled(True)
+    assert tooltip.isEdgeSlidingEnabled()
+    assert tooltip.getActualPlacement() == TooltipPlacement.TOP
+    assert tooltip.x() + DROP_SHADOW_SIZE == 0
+    assert tooltip.y() + tooltip.height() - DROP_SHADOW_SIZE <= button.mapToGlobal(QPoint(0, 0)).y()
+
+
+def test_lazy_widgets(qtbot):
+    """Test that the widgets of the tooltip are only created once it is laid out"""
+
+    window = QMainWindow()
+    button = QPushButton(window)
+    tooltip = Tooltip(button, 'Tooltip')
+    qtbot.addWidget(window)
+    qtbot.addWidget(tooltip)
+
+    # Configuration is recorded without creating any widgets
+    tooltip.setText('Other text')
+    tooltip.setBackgroundColor(QColor('#FF0000'))
+    tooltip.setDropShadowStrength(3.0)
+    tooltip.setRenderer(TooltipRenderer.PAINTER)
+    tooltip.setRenderer(TooltipRenderer.WIDGETS)
+    assert tooltip.findChildren(QWidget) == []
+    assert tooltip.getText() == 'Other text'
+    assert tooltip.getBackgroundColor() == QColor('#FF0000')
+
+    # Widgets are created with the recorded configuration when shown
+    tooltip.setFadeInDuration(0)
+    tooltip.show()
+    assert len(tooltip.findChildren(QWidget)) == 4
+    assert tooltip.findChild(QLabel, options=Qt.FindChildOption.FindDirectChildrenOnly) \
+        .styleSheet().startswith('background: #ff0000;')
+    assert tooltip.findChildren(QLabel)[-1].text() == 'Other text'
+
+
+def test_batch_update(qtbot):
+    """Test that batched changes only update the style and the layout once"""
+
+    class StyleChangeCounter(QObject):
+
+        def __init__(self):
+            super().__init__()
+            self.count = 0
+
+        def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+            if event.type() == QEvent.Type.StyleChange:
+                self.count += 1
+            return False
+
+    window = QMainWindow()
+    button = QPushButton(window)
+    tooltip = Tooltip(button, 'Tooltip')
+    tooltip.setFadeInDuration(0)
+    qtbot.addWidget(window)
+    qtbot.addWidget(tooltip)
+    tooltip.show()
+
+    counter = StyleChangeCounter()
+    body = tooltip.findChild(QLabel, options=Qt.FindChildOption.FindDirectChildrenOnly)
+    body.installEventFilter(counter)
+    Utils.reset_call_counts()
+
+    with tooltip.batchUpdate():
+        tooltip.setFont(QFont('Arial', 12))
+        tooltip.setMargins(QMargins(5, 5, 5, 5))
+        tooltip.setBorderEnabled(True)
+        tooltip.setBorderRadius(4)
+        tooltip.setBackgroundColor(QColor('#FFFFFF'))
+        tooltip.setTextColor(QColor('#000000'))
+        tooltip.setMaximumWidth(100)
+        tooltip.setPlacement(TooltipPlacement.BOTTOM)
+    assert counter.count == 1
+    assert Utils.get_call_counts()['map_to_global'] == 1
+    assert body.styleSheet().startswith('background: #ffffff;')
+
+    # Same for configure()
+    tooltip.configure(
+        borderRadius=3, borderColor=QColor('#FF0000'), triangleSize=7,
+        offsets={placement: QPoint(1, 1) for placement in tooltip.getOffsets()}
+    )
+    assert counter.count == 2
+    assert Utils.get_call_counts()['map_to_global'] == 2
+    assert tooltip.getTriangleSize() == 7
+    qtbot.wait(50)
+    assert counter.count == 2
+    assert Utils.get_call_counts()['map_to_global'] == 2
+
+    # Only tooltip properties can be set (not the properties of QWidget)
+    with pytest.raises(TypeError):
+        tooltip.configure(unknownProperty=1)
+    with pytest.raises(TypeError):
+        tooltip.configure(borderRadius=5, visible=False)
+    with pytest.raises(TypeError):
+        tooltip.configure(styleSheet='background: red;')
+    assert tooltip.getBorderRadius() == 3
+    assert tooltip.isVisible()
+
+
+def test_set_renderer(qtbot):
+    """Test setting the renderer of the tooltip"""
+
+    window = QMainWindow()
+    button = QPushButton(window)
+    tooltip = Tooltip(button, 'Tooltip')
+    qtbot.addWidget(window)
+    qtbot.addWidget(button)
+    qtbot.addWidget(tooltip)
+    size = tooltip.size()
+
+    # Painter renderer uses a single child widget with the same layout
+    tooltip.setRenderer(TooltipRenderer.PAINTER)
+    qtbot.wait(50)
+    assert tooltip.getRenderer() == TooltipRenderer.PAINTER
+    assert len(tooltip.findChildren(QWidget)) == 1
+    assert abs(tooltip.width() - size.width()) <= 2
+    assert abs(tooltip.height() - size.height()) <= 2
+
+    # Setters work the same with the painter renderer
+    tooltip.setBorderEnabled(True)
+    tooltip.setBackgroundColor(QColor('#FFFFFF'))
+    tooltip.setFont(QFont('Arial', 12))
+    tooltip.setTextCenteringEnabled(False)
+    tooltip.setDropShadowStrength(3.0)
+    assert tooltip.isBorderEnabled()
+    assert tooltip.getBackgroundColor() == QColor('#FFFFFF')
+    assert tooltip.getFont().pointSize() == 12
+    assert tooltip.width() > size.width()
+
+    tooltip.setMaximumWidth(60)
+    tooltip.setText('Long tooltip text that has to be wrapped')
+    assert tooltip.width() <= 60 + DROP_SHADOW_SIZE * 2
+    tooltip.setDropShadowEnabled(False)
+    assert tooltip.width() <= 60
+
+    # Switching back to the widget renderer
+    tooltip.setRenderer(TooltipRenderer.WIDGETS)
+    qtbot.wait(50)
+    assert tooltip.getRenderer() == TooltipRenderer.WIDGETS
+    assert len(tooltip.findChildren(QWidget)) > 1
+    assert tooltip.width() <= 60
+
+
+def test_set_fade_mode(qtbot):
+    """Test setting the fade mode of the tooltip"""
+
+    window = QMainWindow()
+    button = QPushButton(window)
+    tooltip = Tooltip(button, 'Tooltip')
+    tooltip.setFadeInDuration(0)
+    qtbot.addWidget(window)
+    qtbot.addWidget(tooltip)
+
+    # Window opacity is not supported by the offscreen platform
+    assert tooltip.getFadeMode() == TooltipFadeMode.AUTO
+    assert tooltip.getActualFadeMode() == TooltipFadeMode.SNAPSHOT
+    assert tooltip.graphicsEffect() is None
+
+    # Window opacity combines the opacity of the tooltip and the fade
+    tooltip.setFadeMode(TooltipFadeMode.WINDOW)
+    tooltip.setOpacity(0.5)
+    tooltip.show()
+    assert tooltip.getActualFadeMode() == TooltipFadeMode.WINDOW
+    assert tooltip.graphicsEffect() is None
+    assert tooltip.getOpacity() == 0.5
+    assert abs(tooltip.windowOpacity() - 0.5) < 0.01
+
+    # Default fade mode is used if no fade mode is set
+    Tooltip.setDefaultFadeMode(TooltipFadeMode.EFFECT)
+    tooltip.setFadeMode(None)
+    assert tooltip.getFadeMode() == TooltipFadeMode.EFFECT
+    assert tooltip.getActualFadeMode() == TooltipFadeMode.EFFECT
+    assert tooltip.graphicsEffect().opacity() == 1.0
+    Tooltip.setDefaultFadeMode(TooltipFadeMode.AUTO)
+
+
+def test_snapshot_fade_mode(qtbot):
+    """Test fading a snapshot of the tooltip instead of its widgets"""
+
+    window = QMainWindow()
+    button = QPushButton(window)
+    tooltip = Tooltip(button, 'Tooltip')
+    tooltip.setFadeMode(TooltipFadeMode.SNAPSHOT)
+    tooltip.setFadeInDuration(200)
+    tooltip.setFadeOutDuration(0)
+    qtbot.addWidget(window)
+    qtbot.addWidget(tooltip)
+    assert tooltip.getActualFadeMode() == TooltipFadeMode.SNAPSHOT
+    assert tooltip.graphicsEffect() is None
+
+    # Widgets are hidden while the snapshot is faded in
+    tooltip.show()
+    assert tooltip.isVisible()
+    assert all(widget.isHidden() for widget in tooltip.children() if isinstance(widget, QWidget))
+    image = tooltip.grab().toImage()
+    assert image.width() == tooltip.width()
+
+    # Changes during the fade are painted as well
+    tooltip.setText('Longer tooltip text')
+    assert tooltip.width() > image.width()
+    assert tooltip.grab().toImage() != image
+
+    # Widgets are shown again after the fade
+    widgets = [widget for widget in tooltip.children() if isinstance(widget, QWidget)]
+    qtbot.waitUntil(lambda: all(not widget.isHidden() for widget in widgets))
+
+    tooltip.hide()
+    assert not tooltip.isVisible()
@@ -0,0 +1,45 @@
+from PyQt6.QtCore import Qt, QPoint
+from PyQt6.QtGui import QImage, QPainter, QColor
+from src.pyqttooltip import TooltipPlacement
+from src.pyqttooltip.tooltip_triangle import TooltipTriangle
+
+
+def test_draw_cached(qtbot):
+    """Test that cached triangles are identical to triangles drawn line by line"""
+
+    TooltipTriangle.pixmap_cache.clear()
+    background_color = QColor('#111214')
+    border_color = QColor('#403E41')
+
+    for placement in [TooltipPlacement.LEFT, TooltipPlacement.RIGHT,
+                      TooltipPlacement.TOP, TooltipPlacement.BOTTOM]:
+        for border_enabled in [False, True]:
+            size = TooltipTriangle.get_size(True, 8, placement, border_enabled)
+            images = []
+
+            for cached in [False, True]:
+                image = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+                image.fill(Qt.GlobalColor.transparent)
+                painter = QPainter(image)
+                if cached:
+                    TooltipTriangle.draw_cached(
+                        painter, QPoint(0, 0), placement, 8, background_color, border_color,
+                        border_enabled, 1.0
+                    )
+                else:
+                    TooltipTriangle.draw(
+                        painter, QPoint(0, 0), placement, 8, background_color, border_color, border_enabled
+                    )
+                painter.end()
+                images.append(image)
+
+            assert images[0] == images[1]
+
+    # Triangles are only rendered once per placement, size, border, and colors
+    image = QImage(20, 20, QImage.Format.Format_ARGB32_Premultiplied)
+    painter = QPainter(image)
+    TooltipTriangle.draw_cached(
+        painter, QPoint(0, 0), TooltipPlacement.TOP, 8, background_color, border_color, True, 1.0
+    )
+    painter.end()
+    assert TooltipTriangle.pixmap_cache.get_stats()['size'] == 8